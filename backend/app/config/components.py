@@ -103,6 +103,15 @@ class RedisConfig(BaseModel):
     cache_events_ttl: int = Field(default=600, alias="cache.events_ttl")
     cache_search_ttl: int = Field(default=180, alias="cache.search_ttl")
     
+    # In-process (L1) cache tier in front of Redis, per worker
+    cache_local_max_entries: int = Field(default=1024, alias="cache.local_max_entries")
+    cache_local_ttl: int = Field(default=30, alias="cache.local_ttl")
+    
+    # Stored value format: msgpack | orjson | json | auto; compression: lz4 | zlib | none | auto
+    cache_codec: str = Field(default="auto", alias="cache.codec")
+    cache_compression: str = Field(default="auto", alias="cache.compression")
+    cache_compression_threshold: int = Field(default=1024, alias="cache.compression_threshold")
+    
     @field_validator('url')
     @classmethod
     def build_redis_url(cls, v, info) -> str:
@@ -214,6 +223,57 @@ class ScrapingConfig(BaseModel):
     max_retries: int = Field(default=3, alias="settings.max_retries")
     timeout: int = Field(default=30, alias="settings.timeout")
     delay_between_requests: float = Field(default=1.0, alias="settings.delay_between_requests")
+    # Data quality validation pool (0 = one worker per CPU, 1 = validate inline)
+    quality_workers: int = Field(default=0, alias="settings.quality_workers")
+    quality_chunk_size: int = Field(default=200, alias="settings.quality_chunk_size")
+    # Multi-source pipeline scheduling
+    max_concurrent_sources: int = Field(default=4, alias="settings.max_concurrent_sources")
+    source_timeout: float = Field(default=1200.0, alias="settings.source_timeout")
+    domain_rate_limit: float = Field(default=2.0, alias="settings.domain_rate_limit")
+    domain_burst: int = Field(default=4, alias="settings.domain_burst")
+    # Streaming quality processing (events per batch, batches buffered)
+    stream_batch_size: int = Field(default=250, alias="settings.stream_batch_size")
+    stream_queue_size: int = Field(default=8, alias="settings.stream_queue_size")
+    # Shared scraper HTTP clients
+    http2: bool = Field(default=True, alias="settings.http2")
+    http_max_connections: int = Field(default=100, alias="settings.http_max_connections")
+    http_max_keepalive_connections: int = Field(default=20, alias="settings.http_max_keepalive_connections")
+    http_keepalive_expiry: float = Field(default=30.0, alias="settings.http_keepalive_expiry")
+    # On-disk HTTP cache for conditional requests
+    http_cache_enabled: bool = Field(default=True, alias="settings.http_cache_enabled")
+    # Relative directories are resolved against the backend directory
+    http_cache_dir: str = Field(default="~/.cache/kruzna-karta/http", alias="settings.http_cache_dir")
+    http_cache_max_age_hours: int = Field(default=168, alias="settings.http_cache_max_age_hours")
+    # Per-scraper detail page concurrency and adaptive request pacing
+    detail_concurrency: int = Field(default=6, alias="settings.detail_concurrency")
+    pacing_min_delay: float = Field(default=0.0, alias="settings.pacing_min_delay")
+    pacing_max_delay: float = Field(default=30.0, alias="settings.pacing_max_delay")
+    pacing_target_latency: float = Field(default=2.0, alias="settings.pacing_target_latency")
+    # Incremental runs skip events scraped within this many hours
+    incremental_max_age_hours: float = Field(default=24.0, alias="settings.incremental_max_age_hours")
+    # Shared Playwright browser pool
+    browser_max_contexts: int = Field(default=3, alias="settings.browser_max_contexts")
+    browser_recycle_after: int = Field(default=200, alias="settings.browser_recycle_after")
+    # Playwright request blocking and fast mode (no human simulation)
+    browser_block_resources: bool = Field(default=True, alias="settings.browser_block_resources")
+    browser_blocked_resource_types: List[str] = Field(
+        default_factory=lambda: ["image", "media", "font"], alias="settings.browser_blocked_resource_types"
+    )
+    browser_blocked_domains: List[str] = Field(
+        default_factory=lambda: [
+            "google-analytics.com",
+            "googletagmanager.com",
+            "doubleclick.net",
+            "googlesyndication.com",
+            "facebook.net",
+            "hotjar.com",
+            "clarity.ms",
+        ],
+        alias="settings.browser_blocked_domains",
+    )
+    browser_fast_mode: bool = Field(default=True, alias="settings.browser_fast_mode")
+    # BeautifulSoup parser for scraped pages ("lxml" or "html.parser")
+    html_parser: str = Field(default="lxml", alias="settings.html_parser")
     
     # Headers
     user_agent: str = Field(
@@ -0,0 +1,456 @@
+"""
+Asyncio Redis caching service for scrapers, geocoding and other async code.
+
+Mirrors the ``CacheService`` API on ``redis.asyncio`` so coroutines can cache
+without blocking the event loop. Keys, TTLs, the value codec and tag sets are
+shared with ``CacheService``: plain ``get``/``set`` entries written by either
+service can be read by the other, and tag invalidation covers both. Keys that
+``CacheService.get_or_set`` writes hold an early-refresh envelope and must
+only be read through that method.
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+import redis.asyncio as aioredis
+from redis.exceptions import ConnectionError, RedisError, TimeoutError
+
+from app.core.cache import (
+    DEFAULT_TTL,
+    KEY_PREFIX,
+    TTL_CONFIG,
+    CacheService,
+    CacheTags,
+    LocalCache,
+    cache_key_generator,
+    get_cache_service,
+)
+from app.core.cache_codec import CacheCodec, CacheCodecError
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCacheService:
+    """Redis caching service for asyncio code paths."""
+
+    RECONNECT_INTERVAL = CacheService.RECONNECT_INTERVAL
+    TAG_NAMESPACE = CacheService.TAG_NAMESPACE
+
+    def __init__(
+        self,
+        redis_url: str = None,
+        pool: Optional[aioredis.ConnectionPool] = None,
+        local_max_entries: Optional[int] = None,
+        local_ttl: Optional[int] = None,
+    ):
+        """Prepare the async Redis client.
+
+        The connection is established lazily on first use, so the service can
+        be created outside a running event loop.
+
+        Args:
+            redis_url: Optional Redis connection URL. If not provided, uses settings.redis_url
+            pool: Optional shared connection pool. If not provided, one is created
+                with settings.redis.max_connections connections
+            local_max_entries: Size of the in-process L1 cache (0 disables it)
+            local_ttl: Maximum lifetime in seconds of L1 entries
+
+        Note:
+            redis.asyncio connections are bound to the event loop that opened
+            them. Use get_async_cache_service() to get the instance for the
+            current loop instead of sharing one across loops.
+        """
+        self.redis_url = redis_url or settings.redis_url
+        self._pool = pool
+        self._redis: Optional[aioredis.Redis] = None
+        self._connection_failed = False
+        self._last_connect_attempt = 0.0
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.default_ttl = DEFAULT_TTL
+        self.key_prefix = KEY_PREFIX
+        self.ttl_config = dict(TTL_CONFIG)
+
+        self.local_cache = LocalCache(
+            max_entries=(
+                local_max_entries
+                if local_max_entries is not None
+                else settings.redis.cache_local_max_entries
+            ),
+            max_ttl=local_ttl if local_ttl is not None else settings.redis.cache_local_ttl,
+        )
+        self.codec = CacheCodec(
+            format=settings.redis.cache_codec,
+            compression=settings.redis.cache_compression,
+            compression_threshold=settings.redis.cache_compression_threshold,
+        )
+
+    async def _connect(self) -> None:
+        """Establish Redis connection with error handling."""
+        self._last_connect_attempt = time.monotonic()
+        try:
+            if not self.redis_url:
+                logger.warning("Redis URL not configured, async caching disabled")
+                self._connection_failed = True
+                return
+
+            if self._pool is None:
+                self._pool = aioredis.ConnectionPool.from_url(
+                    self.redis_url,
+                    max_connections=settings.redis.max_connections,
+                    socket_timeout=5,
+                    socket_connect_timeout=5,
+                    retry_on_timeout=True,
+                    health_check_interval=30,
+                )
+            self._redis = aioredis.Redis(connection_pool=self._pool)
+            await self._redis.ping()
+            self._connection_failed = False
+            logger.info("Async Redis connection established successfully")
+        except (RedisError, ConnectionError, OSError) as e:
+            logger.error(f"Failed to connect to Redis (async): {e}")
+            self._connection_failed = True
+            self._redis = None
+
+    async def is_available(self) -> bool:
+        """Check if Redis is available, reconnecting at most every RECONNECT_INTERVAL seconds."""
+        if self._redis is not None and not self._connection_failed:
+            return True
+
+        if not self.redis_url:
+            return False
+
+        if time.monotonic() - self._last_connect_attempt >= self.RECONNECT_INTERVAL:
+            await self._connect()
+
+        return self._redis is not None and not self._connection_failed
+
+    def _mark_unavailable(self, error: Exception) -> None:
+        """Record a connection-level failure so callers skip Redis until reconnect."""
+        if isinstance(error, (ConnectionError, TimeoutError, OSError)):
+            self._connection_failed = True
+
+    def _make_key(self, namespace: str, key: str) -> str:
+        """Generate cache key with namespace."""
+        return f"{self.key_prefix}:{namespace}:{key}"
+
+    def _deserialize_value(self, value: bytes) -> Any:
+        """Deserialize value from storage, whichever codec wrote it."""
+        try:
+            return self.codec.decode(value)
+        except CacheCodecError as e:
+            logger.error(f"Failed to deserialize cache value: {e}")
+            return None
+
+    def _register_tags(
+        self, pipe: Any, cache_key: str, tags: Optional[Iterable[str]], ttl: int
+    ) -> None:
+        """Queue tag registrations for cache_key on a pipeline."""
+        if not tags:
+            return
+
+        tag_ttl = max(ttl, max(self.ttl_config.values()))
+        for tag in set(tags):
+            tag_key = self._make_key(self.TAG_NAMESPACE, tag)
+            pipe.sadd(tag_key, cache_key)
+            pipe.expire(tag_key, tag_ttl)
+
+    async def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Get value from cache, returning None on a miss or any error."""
+        cache_key = self._make_key(namespace, key)
+
+        local_value = self.local_cache.get(cache_key)
+        if local_value is not None:
+            return local_value
+
+        if not await self.is_available():
+            return None
+
+        try:
+            value = await self._redis.get(cache_key)
+            if value is None:
+                return None
+
+            result = self._deserialize_value(value)
+            if result is not None:
+                self.local_cache.set(
+                    cache_key, result, self.ttl_config.get(namespace, self.default_ttl)
+                )
+            return result
+
+        except Exception as e:
+            self._mark_unavailable(e)
+            logger.error(f"Async cache get error: {e}")
+            return None
+
+    async def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> bool:
+        """Set value in cache with TTL and optional invalidation tags."""
+        cache_ttl = ttl or self.ttl_config.get(namespace, self.default_ttl)
+        cache_key = self._make_key(namespace, key)
+
+        if not await self.is_available():
+            return False
+
+        try:
+            serialized_value = self.codec.encode(value)
+
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.setex(cache_key, cache_ttl, serialized_value)
+            self._register_tags(pipe, cache_key, tags, cache_ttl)
+            result = (await pipe.execute())[0]
+            if result:
+                self.local_cache.set(cache_key, value, cache_ttl)
+            return bool(result)
+
+        except Exception as e:
+            self._mark_unavailable(e)
+            logger.error(f"Async cache set error: {e}")
+            return False
+
+    async def delete(self, namespace: str, key: str) -> bool:
+        """Delete value from cache."""
+        cache_key = self._make_key(namespace, key)
+        self.local_cache.delete(cache_key)
+
+        if not await self.is_available():
+            return False
+
+        try:
+            return bool(await self._redis.unlink(cache_key))
+        except Exception as e:
+            self._mark_unavailable(e)
+            logger.error(f"Async cache delete error: {e}")
+            return False
+
+    async def get_multiple(self, namespace: str, keys: List[str]) -> Dict[str, Any]:
+        """Get multiple values from cache."""
+        if not keys:
+            return {}
+
+        result = {}
+        missing_keys = []
+        for key in keys:
+            local_value = self.local_cache.get(self._make_key(namespace, key))
+            if local_value is not None:
+                result[key] = local_value
+            else:
+                missing_keys.append(key)
+
+        if not missing_keys or not await self.is_available():
+            return result
+
+        try:
+            cache_keys = [self._make_key(namespace, key) for key in missing_keys]
+            values = await self._redis.mget(cache_keys)
+            local_ttl = self.ttl_config.get(namespace, self.default_ttl)
+
+            for cache_key, key, value in zip(cache_keys, missing_keys, values):
+                if value is None:
+                    continue
+                decoded = self._deserialize_value(value)
+                if decoded is not None:
+                    result[key] = decoded
+                    self.local_cache.set(cache_key, decoded, local_ttl)
+
+            return result
+
+        except Exception as e:
+            self._mark_unavailable(e)
+            logger.error(f"Async cache mget error: {e}")
+            return result
+
+    async def set_multiple(
+        self, namespace: str, data: Dict[str, Any], ttl: Optional[int] = None
+    ) -> bool:
+        """Set multiple values in cache with one pipelined round trip."""
+        if not data or not await self.is_available():
+            return False
+
+        try:
+            cache_ttl = ttl or self.ttl_config.get(namespace, self.default_ttl)
+            pipe = self._redis.pipeline(transaction=False)
+
+            for key, value in data.items():
+                pipe.setex(self._make_key(namespace, key), cache_ttl, self.codec.encode(value))
+
+            results = await pipe.execute()
+
+            for key, value in data.items():
+                self.local_cache.set(self._make_key(namespace, key), value, cache_ttl)
+
+            return all(results)
+
+        except Exception as e:
+            self._mark_unavailable(e)
+            logger.error(f"Async cache mset error: {e}")
+            return False
+
+    async def increment(
+        self, namespace: str, key: str, amount: int = 1, ttl: Optional[int] = None
+    ) -> Optional[int]:
+        """Increment a counter in cache."""
+        if not await self.is_available():
+            return None
+
+        try:
+            cache_key = self._make_key(namespace, key)
+
+            pipe = self._redis.pipeline()
+            pipe.incr(cache_key, amount)
+            if ttl:
+                pipe.expire(cache_key, ttl)
+
+            results = await pipe.execute()
+            return results[0]
+
+        except Exception as e:
+            self._mark_unavailable(e)
+            logger.error(f"Async cache increment error: {e}")
+            return None
+
+    async def get_or_set(
+        self,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        tags: Optional[CacheTags] = None,
+    ) -> Any:
+        """Return a cached value, awaiting loader on a miss.
+
+        Concurrent misses for the same key within this event loop share a
+        single loader call. None results are returned but never cached.
+
+        Args:
+            namespace: Cache namespace (e.g., "geocoding")
+            key: Cache key within the namespace
+            loader: Zero-argument coroutine function producing the value
+            ttl: Optional TTL in seconds. If None, uses namespace-specific default
+            tags: Optional tags, or a callable deriving them from the value
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        cached_value = await self.get(namespace, key)
+        if cached_value is not None:
+            return cached_value
+
+        cache_key = self._make_key(namespace, key)
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            value = await loader()
+            if value is not None:
+                entry_tags = tags(value) if callable(tags) else tags
+                await self.set(namespace, key, value, ttl, entry_tags)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise the error; mark it retrieved for this caller
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(cache_key, None)
+
+    async def close(self) -> None:
+        """Close the client and disconnect the pool."""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+        if self._pool is not None:
+            await self._pool.disconnect()
+
+
+# One service per event loop; redis.asyncio connections cannot cross loops
+_async_cache_services: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncCacheService]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_cache_service() -> AsyncCacheService:
+    """Get the async cache service for the running event loop.
+
+    Returns:
+        AsyncCacheService: Instance bound to the current loop, created on first
+            access with its own shared connection pool
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    service = _async_cache_services.get(loop)
+    if service is None:
+        service = AsyncCacheService()
+        _async_cache_services[loop] = service
+    return service
+
+
+def cached_async(
+    namespace: str, ttl: Optional[int] = None, key_func: Optional[Callable] = None
+) -> Callable:
+    """Decorator caching the results of a coroutine function.
+
+    Async counterpart of ``cached``; ``cached`` delegates here automatically
+    when applied to a coroutine function.
+
+    Args:
+        namespace: Cache namespace for logical separation
+        ttl: Optional TTL in seconds. If None, uses namespace-specific default
+        key_func: Optional custom function to generate cache keys from arguments
+
+    Returns:
+        Callable: Decorator wrapping the coroutine function with caching
+
+    Note:
+        The decorated function gains awaitable invalidate(*args, **kwargs) and
+        invalidate_all() methods.
+    """
+
+    def decorator(func) -> Callable:
+        def make_key(*args, **kwargs) -> str:
+            if key_func:
+                return key_func(*args, **kwargs)
+            return f"{func.__name__}_{cache_key_generator(*args, **kwargs)}"
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            cache = get_async_cache_service()
+            return await cache.get_or_set(
+                namespace, make_key(*args, **kwargs), lambda: func(*args, **kwargs), ttl
+            )
+
+        async def invalidate(*args, **kwargs) -> bool:
+            return await get_async_cache_service().delete(namespace, make_key(*args, **kwargs))
+
+        async def invalidate_all() -> int:
+            # Namespace flushes run on the sync service's background worker
+            return await asyncio.wrap_future(
+                get_cache_service().flush_namespace_later(namespace)
+            )
+
+        wrapper.invalidate = invalidate
+        wrapper.invalidate_all = invalidate_all
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,260 @@
+"""
+Serialization codecs for cached values.
+
+Values are stored with a small header recording the serializer and the
+compression used, so entries written with different formats can coexist in
+Redis (e.g. during a rolling deploy or after changing ``cache.codec``).
+Headerless values are treated as legacy plain JSON.
+
+Header layout (3 bytes)::
+
+    0xC1 | format id | compression id
+
+0xC1 can never start a valid UTF-8 JSON document nor a msgpack object, so
+legacy values are unambiguous.
+"""
+
+import json
+import logging
+import zlib
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import inspect as sqlalchemy_inspect
+from sqlalchemy.exc import NoInspectionAvailable
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - optional dependency
+    lz4_frame = None
+
+logger = logging.getLogger(__name__)
+
+HEADER_MARKER = 0xC1
+
+FORMAT_JSON = "json"
+FORMAT_ORJSON = "orjson"
+FORMAT_MSGPACK = "msgpack"
+
+COMPRESSION_NONE = "none"
+COMPRESSION_ZLIB = "zlib"
+COMPRESSION_LZ4 = "lz4"
+
+_FORMAT_IDS = {FORMAT_JSON: b"j", FORMAT_ORJSON: b"o", FORMAT_MSGPACK: b"m"}
+_COMPRESSION_IDS = {COMPRESSION_NONE: b"-", COMPRESSION_ZLIB: b"z", COMPRESSION_LZ4: b"l"}
+_FORMATS_BY_ID = {value[0]: name for name, value in _FORMAT_IDS.items()}
+_COMPRESSIONS_BY_ID = {value[0]: name for name, value in _COMPRESSION_IDS.items()}
+
+
+class CacheCodecError(ValueError):
+    """Raised when a cached value cannot be encoded or decoded."""
+
+
+def to_primitive(obj: Any) -> Any:
+    """Convert a non-native value into JSON/msgpack compatible primitives.
+
+    Pydantic models are dumped in JSON mode and SQLAlchemy ORM instances are
+    reduced to their mapped column values, so session and relationship state
+    never ends up in the cache.
+
+    Args:
+        obj: Value the underlying serializer could not handle natively
+
+    Returns:
+        A primitive representation of obj
+
+    Raises:
+        TypeError: If obj has no known representation
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, timedelta):
+        return obj.total_seconds()
+    if isinstance(obj, (Decimal, UUID)):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+
+    try:
+        mapper = sqlalchemy_inspect(type(obj))
+    except NoInspectionAvailable:
+        mapper = None
+
+    if mapper is not None and hasattr(mapper, "column_attrs"):
+        return {attr.key: getattr(obj, attr.key) for attr in mapper.column_attrs}
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not cacheable")
+
+
+def available_formats() -> Dict[str, bool]:
+    """Report which serialization formats are usable in this environment."""
+    return {
+        FORMAT_JSON: True,
+        FORMAT_ORJSON: orjson is not None,
+        FORMAT_MSGPACK: msgpack is not None,
+    }
+
+
+class CacheCodec:
+    """Encode and decode cached values with an optional compression step."""
+
+    def __init__(
+        self,
+        format: str = "auto",
+        compression: str = "auto",
+        compression_threshold: int = 1024,
+        compression_level: int = 6,
+    ):
+        """Select serializer and compression.
+
+        Args:
+            format: "msgpack", "orjson", "json" or "auto" (fastest installed)
+            compression: "lz4", "zlib", "none" or "auto" (lz4 if installed)
+            compression_threshold: Payloads smaller than this many bytes are
+                stored uncompressed
+            compression_level: zlib compression level
+
+        Note:
+            Requesting a format or compression library that is not installed
+            logs a warning and falls back to the next best available option.
+        """
+        self.format = self._resolve_format(format)
+        self.compression = self._resolve_compression(compression)
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+
+    @property
+    def name(self) -> str:
+        """Human-readable codec description, e.g. "msgpack+lz4"."""
+        return f"{self.format}+{self.compression}"
+
+    def _resolve_format(self, requested: str) -> str:
+        available = available_formats()
+        if requested in available and available[requested]:
+            return requested
+        if requested not in ("auto", *available):
+            logger.warning(f"Unknown cache codec '{requested}', using auto")
+        elif requested != "auto":
+            logger.warning(f"Cache codec '{requested}' not installed, using auto")
+
+        for candidate in (FORMAT_MSGPACK, FORMAT_ORJSON, FORMAT_JSON):
+            if available[candidate]:
+                return candidate
+        return FORMAT_JSON
+
+    def _resolve_compression(self, requested: str) -> str:
+        if requested == COMPRESSION_LZ4 and lz4_frame is None:
+            logger.warning("lz4 not installed, using zlib for cache compression")
+            return COMPRESSION_ZLIB
+        if requested == "auto":
+            return COMPRESSION_LZ4 if lz4_frame is not None else COMPRESSION_ZLIB
+        if requested not in _COMPRESSION_IDS:
+            logger.warning(f"Unknown cache compression '{requested}', using zlib")
+            return COMPRESSION_ZLIB
+        return requested
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize and, above the size threshold, compress a value.
+
+        Raises:
+            CacheCodecError: If the value cannot be serialized
+        """
+        try:
+            payload = self._dump(value)
+        except (TypeError, ValueError, OverflowError) as e:
+            raise CacheCodecError(f"Failed to serialize cache value: {e}") from e
+
+        compression = COMPRESSION_NONE
+        if self.compression != COMPRESSION_NONE and len(payload) >= self.compression_threshold:
+            compressed = self._compress(payload)
+            # Incompressible payloads are kept as-is
+            if len(compressed) < len(payload):
+                payload = compressed
+                compression = self.compression
+
+        header = bytes([HEADER_MARKER]) + _FORMAT_IDS[self.format] + _COMPRESSION_IDS[compression]
+        return header + payload
+
+    def decode(self, data: bytes) -> Any:
+        """Decode a stored value written by any supported codec.
+
+        Raises:
+            CacheCodecError: If the value is corrupt or needs a library that
+                is not installed on this worker
+        """
+        if not data or data[0] != HEADER_MARKER:
+            # Legacy entries written before the codec header existed
+            try:
+                return json.loads(data.decode("utf-8"))
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                raise CacheCodecError(f"Failed to decode legacy cache value: {e}") from e
+
+        if len(data) < 3:
+            raise CacheCodecError("Truncated cache value header")
+
+        format = _FORMATS_BY_ID.get(data[1])
+        compression = _COMPRESSIONS_BY_ID.get(data[2])
+        if format is None or compression is None:
+            raise CacheCodecError("Unknown cache value header")
+
+        try:
+            payload = self._decompress(data[3:], compression)
+            return self._load(payload, format)
+        except CacheCodecError:
+            raise
+        except Exception as e:
+            raise CacheCodecError(f"Failed to decode {format}+{compression} value: {e}") from e
+
+    def _dump(self, value: Any) -> bytes:
+        if self.format == FORMAT_MSGPACK:
+            return msgpack.packb(value, default=to_primitive, use_bin_type=True)
+        if self.format == FORMAT_ORJSON:
+            return orjson.dumps(
+                value, default=to_primitive, option=orjson.OPT_NON_STR_KEYS
+            )
+        return json.dumps(value, default=to_primitive, separators=(",", ":")).encode("utf-8")
+
+    @staticmethod
+    def _load(payload: bytes, format: str) -> Any:
+        if format == FORMAT_MSGPACK:
+            if msgpack is None:
+                raise CacheCodecError("msgpack is required to decode this cache value")
+            return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+        if format == FORMAT_ORJSON:
+            # orjson output is plain JSON, so stdlib can read it when orjson is missing
+            return orjson.loads(payload) if orjson is not None else json.loads(payload)
+        return json.loads(payload)
+
+    def _compress(self, payload: bytes) -> bytes:
+        if self.compression == COMPRESSION_LZ4:
+            return lz4_frame.compress(payload)
+        return zlib.compress(payload, self.compression_level)
+
+    @staticmethod
+    def _decompress(payload: bytes, compression: str) -> bytes:
+        if compression == COMPRESSION_NONE:
+            return payload
+        if compression == COMPRESSION_LZ4:
+            if lz4_frame is None:
+                raise CacheCodecError("lz4 is required to decode this cache value")
+            return lz4_frame.decompress(payload)
+        return zlib.decompress(payload)
+
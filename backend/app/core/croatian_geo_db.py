@@ -3,9 +3,11 @@ Croatian Geographic Database
 Contains major Croatian cities, regions, and venues with coordinates for fallback geocoding.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import cached_property
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +22,142 @@ class CroatianLocation:
     confidence: float
     population: Optional[int] = None
     region: Optional[str] = None
+    city: Optional[str] = None  # city a venue is in
+
+# Fold Croatian letters so "Varaždin" and "Varazdin" match alike (keeps string length)
+_FOLD_TABLE = str.maketrans("čćšžđ", "ccszd")
+
+# Location types from most to least specific
+_SPECIFICITY = {"venue": 3, "landmark": 3, "city": 2, "region": 1}
+
+# Aliases too generic to match in free text ("brod" is also Croatian for "ship")
+_TEXT_IGNORED_ALIASES = {
+    "main city", "capital", "second city", "port city", "istria main",
+    "pearl of adriatic", "long village", "coastal region", "brod",
+}
+
+
+# Croatian case endings accepted after a location name, longest first
+_CASE_ENDINGS = ("ima", "ama", "ovi", "ove", "ova", "om", "em", "oj", "ju", "a", "e", "i", "u", "o")
+
+
+def _fold(text: str) -> str:
+    return text.lower().translate(_FOLD_TABLE)
+
+
+def _trie_pattern(keys: Iterable[str]) -> str:
+    """Build a regular expression matching any of the keys, shaped as a trie.
+
+    Shared prefixes are matched once, so each text position costs one walk
+    down the trie instead of one attempt per key. Greedy optionals make the
+    longest key win.
+    """
+    trie: Dict[str, dict] = {}
+    for key in keys:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        is_end = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not is_end:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if is_end else group
+
+    return build(trie) or "(?!)"
+
+
+@dataclass
+class LocationMatch:
+    """A known location mentioned in a text."""
+    location: CroatianLocation
+    text: str
+    position: int
+
+    @property
+    def city(self) -> Optional[str]:
+        """City of the match: the city itself, or the city a venue is in."""
+        if self.location.location_type == "city":
+            return self.location.name
+        return self.location.city
+
+
+class LocationMatcher:
+    """Precompiled matcher for known locations in free text.
+
+    All names and aliases are compiled into one trie-shaped regular
+    expression, so a text is scanned once regardless of how many locations
+    are known. The longest name wins at each position ("Arena Zagreb" over
+    "Zagreb"), and only whole words match, optionally with a case ending.
+    """
+
+    def __init__(self, locations: Iterable[CroatianLocation]):
+        self._locations: Dict[str, CroatianLocation] = {}
+        # More specific locations keep an alias both share
+        ranked = sorted(locations, key=lambda loc: -_SPECIFICITY.get(loc.location_type, 0))
+        for location in ranked:
+            for alias in [location.name, *location.aliases]:
+                key = _fold(alias)
+                if key not in _TEXT_IGNORED_ALIASES:
+                    self._locations.setdefault(key, location)
+
+        # Longer names may carry a case ending ("u Splitu"); short ones such as
+        # "vis" or "nin" must match exactly to avoid hits inside other words
+        long_keys = [key for key in self._locations if len(key) > 3]
+        short_keys = [key for key in self._locations if len(key) <= 3]
+        endings = "|".join(_CASE_ENDINGS)
+        self._pattern = re.compile(
+            rf"(?<!\w)(?:(?P<long>{_trie_pattern(long_keys)})(?:{endings})?"
+            rf"|(?P<short>{_trie_pattern(short_keys)}))(?!\w)"
+        )
+
+    def find_all(self, text: str) -> List[LocationMatch]:
+        """Find all known locations in a text, in order of appearance."""
+        if not text:
+            return []
+        return [
+            LocationMatch(self._locations[match.group("long") or match.group("short")], match.group(), match.start())
+            for match in self._pattern.finditer(_fold(text))
+        ]
+
+    def best_match(self, text: str) -> Optional[LocationMatch]:
+        """Find the most specific location mentioned in a text.
+
+        Venues beat cities and cities beat regions. Among cities the smallest
+        wins, as a big city is more often mentioned in passing ("Zagreb band
+        plays Sinj"). Remaining ties go to the earliest mention.
+        """
+        matches = self.find_all(text)
+        if not matches:
+            return None
+        return min(
+            matches,
+            key=lambda match: (
+                -_SPECIFICITY.get(match.location.location_type, 0),
+                match.location.population or 0,
+                match.position,
+            ),
+        )
+
+    def locality(self, address: str) -> Optional[LocationMatch]:
+        """Find the city an address is in.
+
+        Street names often contain a city name ("Ulica grada Vukovara 1,
+        Zagreb") and the locality comes last, so the last city after the last
+        comma wins, or else the last city mentioned anywhere.
+        """
+        matches = [match for match in self.find_all(address) if match.city]
+        if not matches:
+            return None
+        locality_start = address.rfind(",") + 1
+        in_locality = [match for match in matches if match.position >= locality_start]
+        return (in_locality or matches)[-1]
+
 
 class CroatianGeoDatabase:
     """Database of Croatian locations for fallback geocoding."""
@@ -86,6 +224,14 @@ class CroatianGeoDatabase:
             ("Nin", 44.2425, 15.1786, ["nin"], 1132, "Zadar County"),
             ("Novigrad", 45.3167, 13.5667, ["novigrad", "cittanova"], 4345, "Istria County"),
             ("Labin", 45.0950, 14.1200, ["labin", "albona"], 11642, "Istria County"),
+            ("Samobor", 45.8011, 15.7110, ["samobor"], 37633, "Zagreb County"),
+            ("Zaprešić", 45.8564, 15.8078, ["zapresic", "zaprešić"], 25223, "Zagreb County"),
+            ("Sinj", 43.7036, 16.6394, ["sinj"], 24826, "Split-Dalmatia County"),
+            ("Metković", 43.0542, 17.6481, ["metkovic", "metković"], 16788, "Dubrovnik-Neretva County"),
+            ("Gospić", 44.5461, 15.3747, ["gospic", "gospić"], 12745, "Lika-Senj County"),
+            ("Crikvenica", 45.1772, 14.6922, ["crikvenica"], 11122, "Primorje-Gorski Kotar County"),
+            ("Ploče", 43.0561, 17.4344, ["ploce", "ploče"], 10135, "Dubrovnik-Neretva County"),
+            ("Otočac", 44.8694, 15.2375, ["otocac", "otočac"], 9778, "Lika-Senj County"),
         ]
         
         # Convert to CroatianLocation objects
@@ -132,6 +278,70 @@ class CroatianGeoDatabase:
                 confidence=confidence
             )
         
+        # Venues scrapers recognise in event text. Venues without recorded
+        # coordinates use their city centre with a lower confidence.
+        venues_data = [
+            # Format: (name, coordinates, aliases, city)
+            ("Arena Zagreb", (45.7716, 15.9437), ["arena zagreb"], "Zagreb"),
+            ("Dom sportova", (45.8073, 15.9525), ["dom sportova"], "Zagreb"),
+            ("Jarun", (45.7818, 15.9199), ["jarun", "jezero jarun"], "Zagreb"),
+            ("Maksimir", (45.8238, 16.0175), ["maksimir", "park maksimir", "maksimir park"], "Zagreb"),
+            ("Koncertna dvorana Vatroslava Lisinskog", (45.8036, 15.9814), ["lisinski", "lisinski concert hall", "vatroslav lisinski concert hall"], "Zagreb"),
+            ("HNK Zagreb", (45.8097, 15.9700), ["hnk zagreb"], "Zagreb"),
+            ("Tvornica kulture", (45.8060, 15.9951), ["tvornica kulture"], "Zagreb"),
+            ("Kino Europa", (45.8122, 15.9733), ["kino europa"], "Zagreb"),
+            ("Kino Tuškanac", (45.8165, 15.9640), ["kino tuškanac"], "Zagreb"),
+            ("Galerija Klovićevi dvori", (45.8162, 15.9741), ["klovićevi dvori"], "Zagreb"),
+            ("Muzej suvremene umjetnosti", (45.7793, 15.9806), ["museum of contemporary art"], "Zagreb"),
+            ("Muzej grada Zagreba", (45.8167, 15.9757), ["zagreb city museum"], "Zagreb"),
+            ("Trg bana Jelačića", (45.8131, 15.9772), ["ban jelačić square"], "Zagreb"),
+            ("Zagrebački velesajam", (45.7760, 15.9720), ["zagreb fair"], "Zagreb"),
+            ("Stadion Poljud", (43.5197, 16.4316), ["poljud", "poljud stadium"], "Split"),
+            ("Spaladium Arena", (43.5328, 16.4697), [], "Split"),
+            ("Dioklecijanova palača", (43.5083, 16.4402), ["diocletian's palace", "dioklecijan's palace"], "Split"),
+            ("Podrumi Dioklecijanove palače", (43.5079, 16.4401), [], "Split"),
+            ("Trg Peristil", (43.5083, 16.4400), ["peristil", "peristyle"], "Split"),
+            ("Katedrala sv. Duje", (43.5081, 16.4404), ["cathedral of saint domnius"], "Split"),
+            ("HNK Split", (43.5095, 16.4381), [], "Split"),
+            ("Riva Split", (43.5075, 16.4395), [], "Split"),
+            ("Prokurative", (43.5087, 16.4365), [], "Split"),
+            ("Marjan", (43.5096, 16.4128), [], "Split"),
+            ("Bačvice", (43.5018, 16.4466), ["bacvice beach"], "Split"),
+            ("Galerija umjetnina", None, ["umjetnička galerija split"], "Split"),
+            ("Muzej grada Splita", None, ["split city museum", "gradski muzej split"], "Split"),
+            ("Arheološki muzej Split", None, [], "Split"),
+            ("Etnografski muzej Split", None, [], "Split"),
+            ("Muzej hrvatskih arheoloških spomenika", None, [], "Split"),
+            ("Gradska knjižnica Split", None, [], "Split"),
+            ("Dom mladih Split", None, [], "Split"),
+            ("Kulturni centar Split", None, [], "Split"),
+            ("Culture HUB Croatia", None, [], "Split"),
+            ("Kino Zlatna vrata", None, [], "Split"),
+            ("Kino Centaurus", None, [], "Split"),
+            ("Art paviljon", None, [], "Split"),
+            ("Galerija Kula", None, [], "Split"),
+            ("Split Park Festival", None, [], "Split"),
+            ("Arena Pula", (44.8732, 13.8501), ["pula arena", "amfiteatar pula"], "Pula"),
+            ("Malo rimsko kazalište", (44.8697, 13.8472), ["rimsko kazalište"], "Pula"),
+            ("Hipodrom Sinj", None, [], "Sinj"),
+            ("Ljetno kino Makarska", None, ["summer cinema makarska"], "Makarska"),
+            ("Amadria Park Opatija", None, ["amadria park"], "Opatija"),
+        ]
+
+        for name, coordinates, aliases, city in venues_data:
+            city_location = locations[city.lower()]
+            lat, lng = coordinates or (city_location.latitude, city_location.longitude)
+            locations[name.lower()] = CroatianLocation(
+                name=name,
+                latitude=lat,
+                longitude=lng,
+                location_type="venue",
+                aliases=[alias.lower() for alias in aliases],
+                confidence=0.85 if coordinates else 0.6,
+                region=city_location.region,
+                city=city_location.name,
+            )
+        
         return locations
     
     def _build_aliases_map(self) -> Dict[str, str]:
@@ -191,6 +401,26 @@ class CroatianGeoDatabase:
         
         return False
     
+    @cached_property
+    def matcher(self) -> LocationMatcher:
+        """Matcher over all locations, compiled on first use."""
+        return LocationMatcher(self.locations.values())
+    
+    def match_location(self, text: str) -> Optional[LocationMatch]:
+        """Find the most specific Croatian location mentioned in free text."""
+        return self.matcher.best_match(text)
+    
+    def match_address(self, address: str) -> Optional[LocationMatch]:
+        """Find the city of an address from its locality component."""
+        return self.matcher.locality(address)
+    
+    def find_venue(self, text: str, city: Optional[str] = None) -> Optional[CroatianLocation]:
+        """Find the first known venue mentioned in free text, optionally in one city."""
+        for match in self.matcher.find_all(text):
+            if match.location.location_type == "venue" and (city is None or match.location.city == city):
+                return match.location
+        return None
+    
     def get_fallback_coordinates(self, location_type: str = "city") -> Tuple[float, float]:
         """Get fallback coordinates for Croatia (Zagreb center)."""
         zagreb = self.locations.get("zagreb")
@@ -3,18 +3,35 @@ Advanced data quality validation and duplicate detection for scraped events.
 """
 
 import logging
+import multiprocessing
+import os
 import re
+import threading
 import unicodedata
-from datetime import date, timedelta
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
 from difflib import SequenceMatcher
-from typing import Any, Dict, List, Tuple
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 from urllib.parse import urlparse
 
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.database_optimization import build_mark_scraped, calculate_event_hash
+from app.core.event_ingestion import EventIngestionService
 from app.models.event import Event
 from app.models.schemas import EventCreate
 
+try:
+    from rapidfuzz.distance import Indel as rapidfuzz_indel
+except ImportError:  # pragma: no cover - optional dependency
+    rapidfuzz_indel = None
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -90,8 +107,13 @@ class DataQualityValidator:
     ]
 
     @staticmethod
+    @lru_cache(maxsize=16384)
     def normalize_text(text: str) -> str:
-        """Normalize text for comparison (remove accents, lowercase, etc.)."""
+        """Normalize text for comparison (remove accents, lowercase, etc.).
+
+        Memoized: the same titles and locations are compared many times per
+        batch.
+        """
         if not text:
             return ""
 
@@ -418,6 +440,87 @@ class DataQualityValidator:
         return validation_result
 
 
+@lru_cache(maxsize=16384)
+def _tokens(text: str) -> FrozenSet[str]:
+    """Word set of a normalized text."""
+    return frozenset(text.split())
+
+
+@lru_cache(maxsize=16384)
+def _shingles(text: str, size: int = 3) -> FrozenSet[str]:
+    """Character shingles of a normalized text."""
+    if len(text) <= size:
+        return frozenset([text]) if text else frozenset()
+    return frozenset(text[i:i + size] for i in range(len(text) - size + 1))
+
+
+def _jaccard(first: FrozenSet[str], second: FrozenSet[str]) -> float:
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def _sequence_similarity(text1: str, text2: str) -> float:
+    return SequenceMatcher(None, text1, text2).ratio()
+
+
+def _rapidfuzz_similarity(text1: str, text2: str) -> float:
+    # Indel similarity is 2 * LCS / total length, SequenceMatcher's ratio
+    # without its block heuristics; falls back to it when not installed
+    if rapidfuzz_indel is None:
+        return _sequence_similarity(text1, text2)
+    return rapidfuzz_indel.normalized_similarity(text1, text2)
+
+
+def _token_similarity(text1: str, text2: str) -> float:
+    return _jaccard(_tokens(text1), _tokens(text2))
+
+
+def _shingle_similarity(text1: str, text2: str) -> float:
+    return _jaccard(_shingles(text1), _shingles(text2))
+
+
+# Similarity functions over normalized text, selectable per compared field
+SIMILARITY_BACKENDS: Dict[str, Callable[[str, str], float]] = {
+    "sequence": _sequence_similarity,
+    "rapidfuzz": _rapidfuzz_similarity,
+    "token_jaccard": _token_similarity,
+    "shingle_jaccard": _shingle_similarity,
+}
+
+# Backends bounded by the character-multiset ratio used for candidate pruning
+_CHAR_BOUNDED_BACKENDS = frozenset({"sequence", "rapidfuzz"})
+
+
+@dataclass
+class EventFeatures:
+    """Normalized comparison fields of one event, computed once per batch."""
+
+    title: str
+    description: str
+    location: str
+    date: Optional[date]
+
+    @classmethod
+    def from_values(
+        cls,
+        title: Optional[str],
+        description: Optional[str],
+        location: Optional[str],
+        event_date: Optional[date],
+    ) -> "EventFeatures":
+        normalize = DataQualityValidator.normalize_text
+        return cls(normalize(title), normalize(description), normalize(location), event_date)
+
+    @classmethod
+    def from_event(cls, event: EventCreate) -> "EventFeatures":
+        return cls.from_values(event.title, event.description, event.location, event.date)
+
+    @cached_property
+    def title_chars(self) -> Counter:
+        return Counter(self.title)
+
+
 class DuplicateDetector:
     """Advanced duplicate detection for events."""
 
@@ -426,8 +529,27 @@ class DuplicateDetector:
     DESCRIPTION_SIMILARITY_THRESHOLD = 0.70
     LOCATION_SIMILARITY_THRESHOLD = 0.80
 
+    # Backend (see SIMILARITY_BACKENDS) scoring each field. The thresholds
+    # above were tuned for "sequence"; other backends trade some accuracy
+    # for speed and may need their own thresholds
+    SIMILARITY_BACKEND = {
+        "name": "sequence",
+        "description": "sequence",
+        "location": "sequence",
+    }
+
+    # Necessary conditions for any is_duplicate rule to match, used to prune
+    # pairs before scoring them. Every rule needs dates at most a week apart
+    # (rule 3 cannot reach 0.85 with a date score of 0.3), and the loosest
+    # title requirement is 0.625 (rule 3 with the same date and perfect
+    # location/description scores); 0.6 leaves room for float rounding.
+    CANDIDATE_MAX_DAYS = 7
+    CANDIDATE_MIN_NAME_SIMILARITY = 0.6
+
     @staticmethod
-    def calculate_text_similarity(text1: str, text2: str) -> float:
+    def calculate_text_similarity(
+        text1: str, text2: str, backend: str = "sequence"
+    ) -> float:
         """Calculate similarity between two text strings (0-1)."""
         if not text1 or not text2:
             return 0.0
@@ -439,7 +561,14 @@ class DuplicateDetector:
         if not norm1 or not norm2:
             return 0.0
 
-        return SequenceMatcher(None, norm1, norm2).ratio()
+        return SIMILARITY_BACKENDS[backend](norm1, norm2)
+
+    @classmethod
+    def _field_similarity(cls, field: str, text1: str, text2: str) -> float:
+        """Score two normalized field values with the field's backend."""
+        if not text1 or not text2:
+            return 0.0
+        return SIMILARITY_BACKENDS[cls.SIMILARITY_BACKEND[field]](text1, text2)
 
     @staticmethod
     def calculate_date_similarity(date1: date, date2: date) -> float:
@@ -468,13 +597,24 @@ class DuplicateDetector:
         cls, event1: EventCreate, event2: EventCreate
     ) -> Dict[str, float]:
         """Calculate comprehensive similarity between two events."""
+        return cls._feature_similarity(
+            EventFeatures.from_event(event1), EventFeatures.from_event(event2)
+        )
+
+    @classmethod
+    def _feature_similarity(
+        cls, features1: EventFeatures, features2: EventFeatures
+    ) -> Dict[str, float]:
+        """Similarity scores of two precomputed feature records."""
         similarity = {
-            "name": cls.calculate_text_similarity(event1.title, event2.title),
-            "description": cls.calculate_text_similarity(
-                event1.description, event2.description
+            "name": cls._field_similarity("name", features1.title, features2.title),
+            "description": cls._field_similarity(
+                "description", features1.description, features2.description
+            ),
+            "location": cls._field_similarity(
+                "location", features1.location, features2.location
             ),
-            "location": cls.calculate_text_similarity(event1.location, event2.location),
-            "date": cls.calculate_date_similarity(event1.date, event2.date),
+            "date": cls.calculate_date_similarity(features1.date, features2.date),
             "overall": 0.0,
         }
 
@@ -493,7 +633,16 @@ class DuplicateDetector:
         cls, event1: EventCreate, event2: EventCreate
     ) -> Tuple[bool, Dict[str, Any]]:
         """Determine if two events are duplicates."""
-        similarity = cls.calculate_event_similarity(event1, event2)
+        return cls._is_duplicate_features(
+            EventFeatures.from_event(event1), EventFeatures.from_event(event2)
+        )
+
+    @classmethod
+    def _is_duplicate_features(
+        cls, features1: EventFeatures, features2: EventFeatures
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """is_duplicate on precomputed feature records."""
+        similarity = cls._feature_similarity(features1, features2)
 
         # Primary duplicate detection rules
         is_duplicate = False
@@ -532,13 +681,70 @@ class DuplicateDetector:
             "confidence": similarity["overall"],
         }
 
+    @classmethod
+    def _could_match_names(cls, features1: EventFeatures, features2: EventFeatures) -> bool:
+        """Cheap necessary check on titles before full scoring.
+
+        Uses the character-multiset bound of SequenceMatcher.quick_ratio,
+        which also bounds the rapidfuzz backend. Other name backends are not
+        bounded by it, so every pair passes.
+        """
+        if cls.SIMILARITY_BACKEND["name"] not in _CHAR_BOUNDED_BACKENDS:
+            return True
+
+        length1, length2 = len(features1.title), len(features2.title)
+        total = length1 + length2
+        if not total:
+            return False
+        # Length-only bound (real_quick_ratio) first, it is free
+        if 2.0 * min(length1, length2) / total < cls.CANDIDATE_MIN_NAME_SIMILARITY:
+            return False
+        matches = sum((features1.title_chars & features2.title_chars).values())
+        return 2.0 * matches / total >= cls.CANDIDATE_MIN_NAME_SIMILARITY
+
+    @classmethod
+    def _find_candidate_pairs(cls, features: List[EventFeatures]) -> Dict[int, List[int]]:
+        """Map each event index to the later indices it could duplicate.
+
+        Events are blocked on a date window (sorted dates + bisect) and pairs
+        inside a window are kept only if _could_match_names. Both checks are
+        necessary conditions of is_duplicate, so no duplicate pair is ever
+        pruned.
+        """
+        dated = sorted(
+            (event.date, index)
+            for index, event in enumerate(features)
+            if event.date and event.title
+        )
+        dates = [event_date for event_date, _ in dated]
+        window = timedelta(days=cls.CANDIDATE_MAX_DAYS)
+
+        candidates: Dict[int, List[int]] = {}
+        for position, (event_date, index) in enumerate(dated):
+            window_end = bisect_right(dates, event_date + window)
+            for _, other in dated[position + 1:window_end]:
+                if cls._could_match_names(features[index], features[other]):
+                    first, second = min(index, other), max(index, other)
+                    candidates.setdefault(first, []).append(second)
+
+        for later in candidates.values():
+            later.sort()
+        return candidates
+
     @classmethod
     def find_duplicates_in_batch(
         cls, events: List[EventCreate]
     ) -> List[Dict[str, Any]]:
-        """Find duplicates within a batch of events."""
+        """Find duplicates within a batch of events.
+
+        Only candidate pairs from _find_candidate_pairs are scored; they are
+        visited in the same order as a full pairwise scan, so the grouping is
+        identical to comparing every pair.
+        """
         duplicates = []
         processed = set()
+        features = [EventFeatures.from_event(event) for event in events]
+        candidates = cls._find_candidate_pairs(features)
 
         for i, event1 in enumerate(events):
             if i in processed:
@@ -546,14 +752,14 @@ class DuplicateDetector:
 
             event_duplicates = []
 
-            for j, event2 in enumerate(events[i + 1 :], start=i + 1):
+            for j in candidates.get(i, ()):
                 if j in processed:
                     continue
 
-                is_dup, dup_info = cls.is_duplicate(event1, event2)
+                is_dup, dup_info = cls._is_duplicate_features(features[i], features[j])
                 if is_dup:
                     event_duplicates.append(
-                        {"index": j, "event": event2, "duplicate_info": dup_info}
+                        {"index": j, "event": events[j], "duplicate_info": dup_info}
                     )
                     processed.add(j)
 
@@ -574,46 +780,192 @@ class DuplicateDetector:
         cls, new_event: EventCreate, db: Session, days_window: int = 30
     ) -> List[Tuple[Event, Dict[str, Any]]]:
         """Find potential duplicates of a new event in the database."""
-        # Query events within date window for efficiency
-        date_start = new_event.date - timedelta(days=days_window)
-        date_end = new_event.date + timedelta(days=days_window)
+        return cls.find_duplicates_in_database_batch([new_event], db, days_window)[0]
 
-        existing_events = (
-            db.query(Event)
-            .filter(Event.date >= date_start, Event.date <= date_end)
+    @classmethod
+    def find_duplicates_in_database_batch(
+        cls, new_events: List[EventCreate], db: Session, days_window: int = 30
+    ) -> List[List[Tuple[Event, Dict[str, Any]]]]:
+        """Find database duplicates for a whole batch of new events.
+
+        Existing events around all new event dates are loaded with one
+        column-only query, indexed by date and scored in memory with the same
+        blocking as find_duplicates_in_batch. Full Event rows are then loaded
+        in a second query, for the matches only.
+
+        Args:
+            new_events: Events about to be saved
+            db: Database session
+            days_window: Maximum date distance searched. Capped at
+                CANDIDATE_MAX_DAYS, beyond which no rule can match
+
+        Returns:
+            One list of (existing Event, duplicate info) per new event, in order
+        """
+        window = timedelta(days=min(days_window, cls.CANDIDATE_MAX_DAYS))
+        dates = sorted({event.date for event in new_events if event.date})
+        if not dates:
+            return [[] for _ in new_events]
+
+        # Merge overlapping per-event windows into as few ranges as possible
+        ranges = []
+        for event_date in dates:
+            if ranges and event_date - window <= ranges[-1][1]:
+                ranges[-1][1] = event_date + window
+            else:
+                ranges.append([event_date - window, event_date + window])
+
+        rows = (
+            db.query(
+                Event.id, Event.title, Event.description, Event.location, Event.date, Event.time
+            )
+            .filter(or_(*(Event.date.between(start, end) for start, end in ranges)))
+            .order_by(Event.date, Event.id)
             .all()
         )
 
-        duplicates = []
+        existing = [
+            EventFeatures.from_values(row.title, row.description, row.location, row.date)
+            for row in rows
+        ]
+        existing_dates = [row.date for row in rows]
+
+        matches: List[List[Tuple[int, Dict[str, Any]]]] = []
+        for new_event in new_events:
+            event_matches = []
+            features = EventFeatures.from_event(new_event)
+            if features.date and features.title:
+                start = bisect_left(existing_dates, features.date - window)
+                end = bisect_right(existing_dates, features.date + window)
+                for position in range(start, end):
+                    if not cls._could_match_names(features, existing[position]):
+                        continue
+                    is_dup, dup_info = cls._is_duplicate_features(features, existing[position])
+                    if is_dup:
+                        event_matches.append((rows[position].id, dup_info))
+            matches.append(event_matches)
+
+        matched_ids = {event_id for event_matches in matches for event_id, _ in event_matches}
+        events_by_id = {}
+        if matched_ids:
+            events_by_id = {
+                event.id: event
+                for event in db.query(Event).filter(Event.id.in_(matched_ids)).all()
+            }
+
+        return [
+            [
+                (events_by_id[event_id], dup_info)
+                for event_id, dup_info in event_matches
+                if event_id in events_by_id
+            ]
+            for event_matches in matches
+        ]
+
+
+# Process pool for validation, shared across pipeline runs (spawning is slow)
+_validation_pool: Optional[ProcessPoolExecutor] = None
+_validation_pool_workers = 0
+_validation_pool_lock = threading.Lock()
+
+
+def _validate_chunk(events: List[EventCreate]) -> List[Dict[str, Any]]:
+    """Validate a chunk of events (runs in pool workers)."""
+    return [DataQualityValidator.validate_event(event) for event in events]
+
 
-        for existing_event in existing_events:
-            # Convert existing event to EventCreate for comparison
-            existing_event_create = EventCreate(
-                name=existing_event.title,
-                description=existing_event.description or "",
-                location=existing_event.location or "",
-                date=existing_event.date,
-                time=existing_event.time,
-                price=existing_event.price or "",
-                image=existing_event.image or "",
-                link=existing_event.link or "",
+def _get_validation_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared validation pool, (re)creating it for a new size."""
+    global _validation_pool, _validation_pool_workers
+    with _validation_pool_lock:
+        if _validation_pool is None or _validation_pool_workers != workers:
+            if _validation_pool is not None:
+                _validation_pool.shutdown(wait=False)
+            # spawn: forking a process that runs scheduler and cache threads is unsafe
+            _validation_pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
             )
+            _validation_pool_workers = workers
+        return _validation_pool
 
-            is_dup, dup_info = cls.is_duplicate(new_event, existing_event_create)
-            if is_dup:
-                duplicates.append((existing_event, dup_info))
 
-        return duplicates
+def shutdown_validation_pool() -> None:
+    """Stop the validation worker processes."""
+    global _validation_pool
+    with _validation_pool_lock:
+        if _validation_pool is not None:
+            _validation_pool.shutdown(wait=False, cancel_futures=True)
+            _validation_pool = None
+
+
+# processing_summary entries that add up across batches
+_SUMMARY_COUNTS = (
+    "original_count",
+    "valid_count",
+    "invalid_count",
+    "low_quality_count",
+    "batch_duplicates_count",
+    "db_duplicates_count",
+    "final_processable_count",
+)
 
 
 class DataQualityService:
     """Main service for data quality management in scraping pipeline."""
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        """Initialize the service.
+
+        Args:
+            db: Database session
+            workers: Validation processes (defaults to scraping.quality_workers;
+                0 means one per CPU, 1 validates inline)
+            chunk_size: Events per pool task (defaults to
+                scraping.quality_chunk_size)
+        """
         self.db = db
         self.validator = DataQualityValidator()
         self.duplicate_detector = DuplicateDetector()
 
+        workers = settings.scraping.quality_workers if workers is None else workers
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size or settings.scraping.quality_chunk_size)
+
+    def validate_events(self, events: List[EventCreate]) -> List[Dict[str, Any]]:
+        """Validate events, using the process pool for large batches.
+
+        Returns:
+            One validation result per event, in input order
+
+        Note:
+            Batches no larger than one chunk are validated inline, where the
+            pool round trip would cost more than it saves. If the pool fails
+            (e.g. a worker died) the batch is validated inline instead.
+        """
+        if self.workers <= 1 or len(events) <= self.chunk_size:
+            return _validate_chunk(events)
+
+        chunks = [
+            events[i:i + self.chunk_size] for i in range(0, len(events), self.chunk_size)
+        ]
+        try:
+            pool = _get_validation_pool(self.workers)
+            # map yields chunk results in submission order
+            return [
+                validation
+                for chunk_results in pool.map(_validate_chunk, chunks)
+                for validation in chunk_results
+            ]
+        except Exception as e:
+            logger.warning(f"Parallel validation failed, validating inline: {e}")
+            shutdown_validation_pool()
+            return _validate_chunk(events)
+
     def process_scraped_events(
         self,
         events: List[EventCreate],
@@ -634,9 +986,8 @@ class DataQualityService:
         logger.info(f"Processing {len(events)} scraped events...")
 
         # Step 1: Quality validation
-        for i, event in enumerate(events):
-            validation = self.validator.validate_event(event)
-
+        validations = self.validate_events(events)
+        for i, (event, validation) in enumerate(zip(events, validations)):
             if validation["is_valid"]:
                 if validation["quality_score"] >= quality_threshold:
                     results["valid_events"].append(
@@ -685,15 +1036,20 @@ class DataQualityService:
 
                 logger.info(f"Removed {len(indices_to_remove)} duplicate events from batch")
 
-        # Step 3: Check for duplicates in database
+        # Step 3: Check for duplicates in database (one query for the batch)
         final_valid_events = []
-        for item in results["valid_events"]:
+        db_duplicates_per_event = self.duplicate_detector.find_duplicates_in_database_batch(
+            [item["event"] for item in results["valid_events"]], self.db
+        )
+        for item, db_duplicates in zip(results["valid_events"], db_duplicates_per_event):
             event = item["event"]
-            db_duplicates = self.duplicate_detector.find_duplicates_in_database(
-                event, self.db
-            )
 
-            if db_duplicates:
+            # The same event scraped again goes to the upsert, which refreshes
+            # it and its last_scraped_at
+            event_hash = calculate_event_hash(event.model_dump()) if db_duplicates else None
+            if any(existing.scrape_hash == event_hash for existing, _ in db_duplicates):
+                final_valid_events.append(item)
+            elif db_duplicates:
                 results["duplicates_in_db"].append(
                     {"new_event": event, "existing_duplicates": db_duplicates}
                 )
@@ -725,30 +1081,88 @@ class DataQualityService:
         return results
 
     def save_processed_events(self, processed_results: Dict[str, Any]) -> int:
-        """Save processed events to database."""
-        valid_events = processed_results["valid_events"]
-        saved_count = 0
-
-        try:
-            for item in valid_events:
-                event_data = item["event"]
-                db_event = Event(**event_data.model_dump())
-                self.db.add(db_event)
-                saved_count += 1
-
+        """Upsert processed events through the shared ingestion service.
+
+        Stored events that a database duplicate was scraped from again (same
+        detail link) get their ``last_scraped_at`` refreshed as well, so
+        incremental runs skip them like any other recently scraped event.
+
+        Returns:
+            int: Number of events inserted or updated
+        """
+        valid_events = [item["event"] for item in processed_results["valid_events"]]
+
+        seen_again = {
+            existing.scrape_hash
+            for duplicate in processed_results["duplicates_in_db"]
+            for existing, _ in duplicate["existing_duplicates"]
+            if existing.scrape_hash
+            and existing.link
+            and existing.link == duplicate["new_event"].link
+        }
+        if seen_again:
+            self.db.execute(build_mark_scraped(seen_again, datetime.now(timezone.utc)))
             self.db.commit()
-            logger.info(f"Successfully saved {saved_count} events to database")
 
-        except Exception as e:
-            logger.error(f"Error saving processed events: {e}")
-            self.db.rollback()
-            raise
+        stats = EventIngestionService(self.db).ingest(valid_events)
+        processed_results["ingest_stats"] = stats
+        saved_count = stats["inserted"] + stats["updated"]
+        logger.info(f"Successfully saved {saved_count} events to database: {stats}")
 
         return saved_count
 
-    def generate_quality_report(
-        self, processed_results: Dict[str, Any]
+    @staticmethod
+    def merge_processed_results(
+        totals: Optional[Dict[str, Any]], batch: Dict[str, Any]
     ) -> Dict[str, Any]:
+        """Fold the results of one processed batch into running totals.
+
+        Args:
+            totals: Totals so far, or None for the first batch
+            batch: Results of ``process_scraped_events`` for one batch,
+                optionally with ``saved_events`` and ``ingest_stats``
+
+        Returns:
+            Totals with the same keys as ``process_scraped_events`` results
+
+        Note:
+            Only the validation of each event is kept (the events themselves
+            are already saved or dropped), and duplicate groups are reduced to
+            the summary counts, so totals of a streamed run stay small while
+            still feeding ``generate_quality_report``.
+        """
+        if totals is None:
+            totals = {
+                "total_events": 0,
+                "valid_events": [],
+                "invalid_events": [],
+                "low_quality_events": [],
+                "duplicates_found": [],
+                "duplicates_in_db": [],
+                "processing_summary": dict.fromkeys(_SUMMARY_COUNTS, 0),
+                "saved_events": 0,
+                "ingest_stats": {},
+            }
+
+        totals["total_events"] += batch["total_events"]
+        for key in ("valid_events", "invalid_events", "low_quality_events"):
+            totals[key].extend({"validation": item["validation"]} for item in batch[key])
+
+        summary = totals["processing_summary"]
+        for key, value in batch["processing_summary"].items():
+            if key in _SUMMARY_COUNTS:
+                summary[key] += value
+            else:
+                summary[key] = value
+
+        totals["saved_events"] += batch.get("saved_events", 0)
+        for key, value in batch.get("ingest_stats", {}).items():
+            totals["ingest_stats"][key] = totals["ingest_stats"].get(key, 0) + value
+
+        return totals
+
+    @staticmethod
+    def generate_quality_report(processed_results: Dict[str, Any]) -> Dict[str, Any]:
         """Generate comprehensive quality report."""
         summary = processed_results["processing_summary"]
 
@@ -783,8 +1197,8 @@ class DataQualityService:
                 "common_issues": common_issues,
             },
             "duplicate_analysis": {
-                "batch_duplicates": len(processed_results["duplicates_found"]),
-                "database_duplicates": len(processed_results["duplicates_in_db"]),
+                "batch_duplicates": summary["batch_duplicates_count"],
+                "database_duplicates": summary["db_duplicates_count"],
                 "duplicate_rate": 0.0,
             },
             "recommendations": [],
@@ -7,23 +7,171 @@ from __future__ import annotations
 
 import logging
 import hashlib
-from typing import Dict, List, Set, Tuple, Union
-from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+from datetime import datetime, timedelta, timezone
 from contextlib import asynccontextmanager
 
 from sqlalchemy import (
-    and_, select, update, delete, func, text
+    and_, literal_column, or_, select, update, delete, func, text
 )
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_session_factory
 from app.models.event import Event
 from app.models.schemas import EventCreate
 
 logger = logging.getLogger(__name__)
 
 
+# Columns a re-scrape must not overwrite (set by admins or generated once)
+INGEST_PRESERVED_FIELDS = frozenset({"slug", "is_featured", "event_status"})
+
+# Columns scrapers leave empty but other code fills in (geocoding, venue and
+# category assignment); a re-scrape only writes them when it has a value
+INGEST_FILL_ONLY_FIELDS = frozenset({"latitude", "longitude", "venue_id", "category_id"})
+
+# Columns that identify a row rather than describe it
+_INGEST_KEY_FIELDS = frozenset({"scrape_hash", "source", "last_scraped_at"})
+
+IngestStats = Dict[str, int]
+
+
+def empty_ingest_stats() -> IngestStats:
+    """Zeroed inserted/updated/unchanged counters."""
+    return {"inserted": 0, "updated": 0, "unchanged": 0}
+
+
+def calculate_event_hash(event_data: Mapping[str, Any]) -> str:
+    """Calculate the scrape hash identifying an event across scrapes.
+
+    Args:
+        event_data: Event fields; title, date, time, location and source are used
+
+    Returns:
+        str: Hex SHA-256 digest stored in ``events.scrape_hash``
+    """
+    hash_string = (
+        f"{event_data['title']}|{event_data['date']}|{event_data['time']}|"
+        f"{event_data['location']}|{event_data['source']}"
+    )
+    return hashlib.sha256(hash_string.encode()).hexdigest()
+
+
+def prepare_event_rows(
+    events: Iterable[EventCreate],
+    source: Optional[str] = None,
+    scraped_at: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """Turn scraped events into insert rows keyed by scrape hash.
+
+    Args:
+        events: Scraped events
+        source: Source identifier overriding each event's own source
+        scraped_at: Value for ``last_scraped_at`` (defaults to now)
+
+    Returns:
+        List of row dicts with ``scrape_hash`` and ``last_scraped_at`` set
+
+    Note:
+        Events sharing a hash are collapsed (the last one wins), since one
+        INSERT ... ON CONFLICT statement cannot touch the same row twice.
+    """
+    scraped_at = scraped_at or datetime.now(timezone.utc)
+    columns = set(Event.__table__.columns.keys()) - {"id"}
+    rows: Dict[str, Dict[str, Any]] = {}
+
+    for event in events:
+        row = {key: value for key, value in event.model_dump().items() if key in columns}
+        if source:
+            row["source"] = source
+        row["scrape_hash"] = calculate_event_hash(row)
+        row["last_scraped_at"] = scraped_at
+        rows[row["scrape_hash"]] = row
+
+    return list(rows.values())
+
+
+def build_event_upsert(rows: List[Dict[str, Any]], update_existing: bool = True):
+    """Build a multi-row INSERT ... ON CONFLICT (scrape_hash) statement.
+
+    Existing rows are only rewritten when a scraped field actually differs,
+    so unchanged events produce no row versions. Empty values never clear
+    the ``INGEST_FILL_ONLY_FIELDS`` of an existing row. The statement returns
+    ``scrape_hash`` and ``inserted`` (true for new rows) for every row it
+    wrote.
+
+    Args:
+        rows: Rows from ``prepare_event_rows`` (all with the same keys)
+        update_existing: Update changed rows instead of leaving them alone
+    """
+    stmt = insert(Event).values(rows)
+    conflict_target = {
+        "index_elements": [Event.scrape_hash],
+        "index_where": Event.scrape_hash.isnot(None),
+    }
+
+    if update_existing:
+        updated_fields = [
+            name for name in rows[0]
+            if name not in _INGEST_KEY_FIELDS and name not in INGEST_PRESERVED_FIELDS
+        ]
+        columns = Event.__table__.c
+        new_values = {
+            name: (
+                func.coalesce(stmt.excluded[name], columns[name])
+                if name in INGEST_FILL_ONLY_FIELDS
+                else stmt.excluded[name]
+            )
+            for name in updated_fields
+        }
+        stmt = stmt.on_conflict_do_update(
+            **conflict_target,
+            set_={
+                **new_values,
+                "last_scraped_at": stmt.excluded.last_scraped_at,
+                # ON CONFLICT does not apply the column's Python-side onupdate
+                "updated_at": func.now(),
+            },
+            where=or_(*(
+                columns[name].is_distinct_from(value)
+                for name, value in new_values.items()
+            )),
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(**conflict_target)
+
+    return stmt.returning(Event.scrape_hash, literal_column("xmax = 0").label("inserted"))
+
+
+def build_mark_scraped(hashes: Iterable[str], scraped_at: datetime):
+    """Build an UPDATE recording that unchanged events were seen again."""
+    return (
+        update(Event)
+        .where(Event.scrape_hash.in_(list(hashes)))
+        .values(last_scraped_at=scraped_at)
+    )
+
+
+def summarize_upsert(
+    rows: List[Dict[str, Any]], written: Iterable[Any]
+) -> Tuple[IngestStats, Set[str]]:
+    """Count upsert outcomes from the statement's RETURNING rows.
+
+    Returns:
+        Tuple of (stats, hashes of rows left unchanged)
+    """
+    stats = empty_ingest_stats()
+    written_hashes = set()
+    for row in written:
+        written_hashes.add(row.scrape_hash)
+        stats["inserted" if row.inserted else "updated"] += 1
+
+    unchanged = {row["scrape_hash"] for row in rows} - written_hashes
+    stats["unchanged"] = len(unchanged)
+    return stats, unchanged
+
+
 class DatabaseOptimizer:
     """Database optimization utilities for scraping operations."""
     
@@ -35,31 +183,33 @@ class DatabaseOptimizer:
     async def bulk_insert_events(
         self,
         events: List[EventCreate],
-        source: str,
+        source: Optional[str] = None,
         update_duplicates: bool = True
-    ) -> Dict[str, int]:
+    ) -> IngestStats:
         """
-        Efficiently insert events in bulk with duplicate handling.
+        Efficiently upsert events in bulk, keyed on scrape_hash.
         
         Args:
             events: List of events to insert
-            source: Source identifier
+            source: Source identifier (defaults to each event's source)
             update_duplicates: Whether to update existing events
             
         Returns:
-            Dictionary with statistics (inserted, updated, skipped)
+            Dictionary with statistics (inserted, updated, unchanged)
         """
+        stats = empty_ingest_stats()
         if not events:
-            return {"inserted": 0, "updated": 0, "skipped": 0}
+            return stats
         
         logger.info(f"Starting bulk insert of {len(events)} events from {source}")
         
-        stats = {"inserted": 0, "updated": 0, "skipped": 0}
+        scraped_at = datetime.now(timezone.utc)
+        rows = prepare_event_rows(events, source, scraped_at)
         
         # Process events in batches
-        for i in range(0, len(events), self.batch_size):
-            batch = events[i:i + self.batch_size]
-            batch_stats = await self._process_event_batch(batch, source, update_duplicates)
+        for i in range(0, len(rows), self.batch_size):
+            batch = rows[i:i + self.batch_size]
+            batch_stats = await self._process_event_batch(batch, scraped_at, update_duplicates)
             
             # Update total stats
             for key in stats:
@@ -68,179 +218,47 @@ class DatabaseOptimizer:
             logger.debug(f"Processed batch {i//self.batch_size + 1}: {batch_stats}")
         
         # Update search vectors for new events
-        await self._update_search_vectors(source)
+        if source:
+            await self._update_search_vectors(source)
         
         logger.info(f"Bulk insert completed for {source}: {stats}")
         return stats
     
     async def _process_event_batch(
         self,
-        batch: List[EventCreate],
-        source: str,
+        rows: List[Dict[str, Any]],
+        scraped_at: datetime,
         update_duplicates: bool
-    ) -> Dict[str, int]:
-        """Process a batch of events."""
-        stats = {"inserted": 0, "updated": 0, "skipped": 0}
-        
-        # Calculate hashes for all events in batch
-        event_hashes = {}
-        for event in batch:
-            event_hash = self._calculate_event_hash(event)
-            event_hashes[event_hash] = event
-        
-        # Check for existing events with same hashes
-        existing_hashes = await self._get_existing_hashes(list(event_hashes.keys()), source)
-        
-        # Separate new and existing events
-        new_events = []
-        existing_events = []
+    ) -> IngestStats:
+        """Upsert one batch of rows in a single transaction."""
+        result = await self.session.execute(build_event_upsert(rows, update_duplicates))
+        stats, unchanged = summarize_upsert(rows, result.all())
         
-        for event_hash, event in event_hashes.items():
-            if event_hash in existing_hashes:
-                if update_duplicates:
-                    existing_events.append((event_hash, event))
-                else:
-                    stats["skipped"] += 1
-            else:
-                new_events.append((event_hash, event))
-        
-        # Insert new events
-        if new_events:
-            inserted_count = await self._bulk_insert_new_events(new_events, source)
-            stats["inserted"] += inserted_count
-        
-        # Update existing events
-        if existing_events:
-            updated_count = await self._bulk_update_existing_events(existing_events, source)
-            stats["updated"] += updated_count
-        
-        return stats
-    
-    async def _bulk_insert_new_events(
-        self,
-        events: List[Tuple[str, EventCreate]],
-        source: str
-    ) -> int:
-        """Insert new events in bulk."""
-        if not events:
-            return 0
-        
-        # Prepare event data for bulk insert
-        event_data = []
-        for event_hash, event in events:
-            event_dict = event.dict()
-            event_dict['source'] = source
-            event_dict['scrape_hash'] = event_hash
-            event_dict['last_scraped_at'] = datetime.now()
-            event_data.append(event_dict)
-        
-        # Use PostgreSQL's INSERT with ON CONFLICT for better performance
-        stmt = insert(Event).values(event_data)
-        
-        # Handle conflicts by doing nothing (shouldn't happen with proper duplicate detection)
-        stmt = stmt.on_conflict_do_nothing(index_elements=['scrape_hash'])
-        
-        result = await self.session.execute(stmt)
-        await self.session.commit()
-        
-        return result.rowcount
-    
-    async def _bulk_update_existing_events(
-        self,
-        events: List[Tuple[str, EventCreate]],
-        source: str
-    ) -> int:
-        """Update existing events in bulk."""
-        if not events:
-            return 0
-        
-        updated_count = 0
-        
-        # Update events one by one (could be optimized further with bulk updates)
-        for event_hash, event in events:
-            # Check if event actually needs updating
-            if await self._should_update_event(event_hash, event, source):
-                stmt = (
-                    update(Event)
-                    .where(and_(Event.scrape_hash == event_hash, Event.source == source))
-                    .values(
-                        **event.dict(),
-                        last_scraped_at=datetime.now(),
-                        updated_at=datetime.now()
-                    )
-                )
-                
-                result = await self.session.execute(stmt)
-                if result.rowcount > 0:
-                    updated_count += 1
+        if unchanged:
+            await self.session.execute(build_mark_scraped(unchanged, scraped_at))
         
         await self.session.commit()
-        return updated_count
-    
-    async def _should_update_event(
-        self,
-        event_hash: str,
-        new_event: EventCreate,
-        source: str
-    ) -> bool:
-        """Check if an existing event should be updated."""
-        # Get existing event
-        stmt = select(Event).where(
-            and_(Event.scrape_hash == event_hash, Event.source == source)
-        )
-        result = await self.session.execute(stmt)
-        existing_event = result.scalar_one_or_none()
-        
-        if not existing_event:
-            return False
-        
-        # Check if significant fields have changed
-        significant_fields = ['title', 'date', 'time', 'price', 'description', 'location']
-        
-        for field in significant_fields:
-            if getattr(existing_event, field) != getattr(new_event, field):
-                return True
-        
-        # Check if event was last scraped more than 24 hours ago
-        if (existing_event.last_scraped_at and 
-            datetime.now() - existing_event.last_scraped_at > timedelta(hours=24)):
-            return True
-        
-        return False
-    
-    async def _get_existing_hashes(
-        self,
-        hashes: List[str],
-        source: str
-    ) -> Set[str]:
-        """Get existing event hashes for given source."""
-        if not hashes:
-            return set()
-        
-        stmt = select(Event.scrape_hash).where(
-            and_(Event.scrape_hash.in_(hashes), Event.source == source)
-        )
-        result = await self.session.execute(stmt)
-        return {row.scrape_hash for row in result}
+        return stats
     
     def _calculate_event_hash(self, event: EventCreate) -> str:
         """Calculate a unique hash for an event."""
-        # Use key fields to create a unique identifier
-        hash_string = f"{event.title}|{event.date}|{event.time}|{event.location}|{event.source}"
-        return hashlib.sha256(hash_string.encode()).hexdigest()
+        return calculate_event_hash(event.model_dump())
     
     async def _update_search_vectors(self, source: str) -> None:
         """Update search vectors for events from source."""
         try:
             # Update search vectors for events without them
+            # Same weighting and configuration as the update_search_vector trigger
             stmt = text("""
                 UPDATE events 
-                SET search_vector = to_tsvector('simple', 
-                    COALESCE(title, '') || ' ' || 
-                    COALESCE(description, '') || ' ' || 
-                    COALESCE(location, '') || ' ' ||
-                    COALESCE(organizer, '')
-                )
+                SET search_vector =
+                    setweight(to_tsvector('croatian_unaccent', COALESCE(title, '')), 'A') ||
+                    setweight(to_tsvector('croatian_unaccent', COALESCE(location, '')), 'B') ||
+                    setweight(to_tsvector('croatian_unaccent',
+                        COALESCE(organizer, '') || ' ' ||
+                        COALESCE(array_to_string(tags, ' '), '')
+                    ), 'B') ||
+                    setweight(to_tsvector('croatian_unaccent', COALESCE(description, '')), 'C')
                 WHERE source = :source 
                 AND (search_vector IS NULL OR updated_at > NOW() - INTERVAL '1 hour')
             """)
@@ -323,13 +341,18 @@ class DatabaseOptimizer:
                 "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_events_source_date ON events(source, date)",
                 "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_events_source_scraped_at ON events(source, last_scraped_at)",
                 "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_events_hash_source ON events(scrape_hash, source)",
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_events_link_scraped_at ON events(link, last_scraped_at)",
                 
                 # Performance indexes
                 "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_events_location_date ON events(location, date)",
                 "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_events_featured_status ON events(is_featured, event_status)",
                 
+                # Keyset pagination order used by EventsService.get_events_paginated
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_events_date_time_id ON events(date, time, id)",
+                
                 # Search optimization
                 "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_events_search_vector ON events USING gin(search_vector)",
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_events_title_trgm ON events USING gin(title gin_trgm_ops)",
             ]
             
             for index_sql in indexes:
@@ -373,12 +396,8 @@ class DatabaseOptimizer:
 @asynccontextmanager
 async def get_database_optimizer():
     """Context manager for database optimizer."""
-    async with get_db() as session:
-        optimizer = DatabaseOptimizer(session)
-        try:
-            yield optimizer
-        finally:
-            await session.close()
+    async with get_async_session_factory()() as session:
+        yield DatabaseOptimizer(session)
 
 
 
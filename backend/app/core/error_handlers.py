@@ -162,6 +162,26 @@ class CannotDeleteReferencedEntityError(StandardHTTPException):
         )
 
 
+class InvalidParameterError(StandardHTTPException):
+    """Exception for a request parameter with an unusable value."""
+    
+    def __init__(
+        self, 
+        field: str, 
+        message: str, 
+        correlation_id: Optional[str] = None
+    ):
+        super().__init__(
+            status_code=400,
+            code=ErrorCodes.FIELD_INVALID,
+            message=message,
+            category=ErrorCategory.VALIDATION,
+            severity=ErrorSeverity.LOW,
+            details=[ErrorDetail(code=ErrorCodes.FIELD_INVALID, message=message, field=field)],
+            correlation_id=correlation_id
+        )
+
+
 class DatabaseOperationError(StandardHTTPException):
     """Exception for database operation failures."""
     
@@ -0,0 +1,131 @@
+"""
+Shared ingestion path for scraped events.
+
+Every scraper saves through ``ingest_events``, which writes events in batches
+of multi-row ``INSERT ... ON CONFLICT (scrape_hash) DO UPDATE`` statements
+built by ``database_optimization`` (the same statements
+``DatabaseOptimizer.bulk_insert_events`` runs on the async engine). A batch
+costs two round trips at most, whatever its size.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.core.database_optimization import (
+    IngestStats,
+    build_event_upsert,
+    build_mark_scraped,
+    empty_ingest_stats,
+    prepare_event_rows,
+    summarize_upsert,
+)
+from app.models.schemas import EventCreate
+
+logger = logging.getLogger(__name__)
+
+
+class EventIngestionService:
+    """Bulk upsert of scraped events on a sync session."""
+
+    def __init__(self, db: Session, batch_size: int = 500):
+        self.db = db
+        self.batch_size = batch_size
+
+    def ingest(
+        self,
+        events: Iterable[EventCreate],
+        source: Optional[str] = None,
+        update_existing: bool = True,
+    ) -> IngestStats:
+        """Insert new events and update changed ones.
+
+        Args:
+            events: Scraped events
+            source: Source identifier overriding each event's own source
+            update_existing: Update events whose scraped fields changed
+
+        Returns:
+            Dict with inserted, updated, unchanged and failed counts
+
+        Note:
+            Each batch is committed on its own. If a batch is rejected (e.g.
+            one row violates a check constraint) it is retried row by row so
+            a single bad event does not drop the rest; rows that still fail
+            are logged and counted as failed.
+        """
+        stats = {**empty_ingest_stats(), "failed": 0}
+        scraped_at = datetime.now(timezone.utc)
+        rows = prepare_event_rows(events, source, scraped_at)
+
+        for i in range(0, len(rows), self.batch_size):
+            batch = rows[i:i + self.batch_size]
+            try:
+                batch_stats = self._upsert_batch(batch, scraped_at, update_existing)
+            except Exception as e:
+                self.db.rollback()
+                logger.warning(f"Bulk upsert of {len(batch)} events failed, retrying per event: {e}")
+                batch_stats = self._upsert_rows_individually(batch, scraped_at, update_existing)
+
+            for key, value in batch_stats.items():
+                stats[key] += value
+
+        logger.info(f"Ingested {len(rows)} events from {source or 'scrapers'}: {stats}")
+        return stats
+
+    def _upsert_batch(
+        self, rows: List[Dict[str, Any]], scraped_at: datetime, update_existing: bool
+    ) -> IngestStats:
+        result = self.db.execute(build_event_upsert(rows, update_existing))
+        stats, unchanged = summarize_upsert(rows, result.all())
+
+        if unchanged:
+            self.db.execute(build_mark_scraped(unchanged, scraped_at))
+
+        self.db.commit()
+        return stats
+
+    def _upsert_rows_individually(
+        self, rows: List[Dict[str, Any]], scraped_at: datetime, update_existing: bool
+    ) -> IngestStats:
+        stats = {**empty_ingest_stats(), "failed": 0}
+        for row in rows:
+            try:
+                row_stats = self._upsert_batch([row], scraped_at, update_existing)
+            except Exception as e:
+                self.db.rollback()
+                stats["failed"] += 1
+                logger.debug(f"Skipping event {row.get('title', 'Unknown')}: {e}")
+                continue
+
+            for key, value in row_stats.items():
+                stats[key] += value
+        return stats
+
+
+def ingest_events(
+    events: Iterable[EventCreate],
+    source: Optional[str] = None,
+    db: Optional[Session] = None,
+) -> IngestStats:
+    """Upsert scraped events, opening a session when none is given.
+
+    Args:
+        events: Scraped events
+        source: Source identifier overriding each event's own source
+        db: Optional database session. A new session is opened and closed
+            when not provided
+
+    Returns:
+        Dict with inserted, updated, unchanged and failed counts
+    """
+    owns_session = db is None
+    db = db or SessionLocal()
+    try:
+        return EventIngestionService(db).ingest(events, source)
+    finally:
+        if owns_session:
+            db.close()
@@ -0,0 +1,250 @@
+"""
+Response-level caching for event listing endpoints.
+
+Stores serialized ``EventResponse`` payloads in Redis through ``CacheService``,
+keyed on normalized ``EventSearchParams`` plus the response language, and
+provides the invalidation hooks used after event writes and scraper ingest.
+
+Each cached page is tagged so a single event write only drops the pages it can
+affect:
+
+- ``event:<id>`` for every event on the page
+- ``category:<id>`` / ``venue:<id>`` for pages scoped by those filters, or
+  ``events:open`` for pages that any event could enter
+- ``events:search`` for text searches
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
+
+from app.core.cache import get_cache_service
+from app.core.config import settings
+from app.models.schemas import EventResponse, EventSearchParams
+
+logger = logging.getLogger(__name__)
+
+# Namespaces holding cached event listing responses (TTLs live in CacheService.ttl_config)
+EVENTS_NAMESPACE = "events"
+FEATURED_EVENTS_NAMESPACE = "popular_events"
+SEARCH_RESULTS_NAMESPACE = "search_results"
+
+EVENT_LIST_NAMESPACES = (
+    EVENTS_NAMESPACE,
+    FEATURED_EVENTS_NAMESPACE,
+    SEARCH_RESULTS_NAMESPACE,
+)
+
+# Parameters that do not change the response body
+_NON_KEY_PARAMS = {"use_cache", "language"}
+
+# Pages not scoped to a category or venue, and text search pages
+OPEN_LISTING_TAG = "events:open"
+SEARCH_LISTING_TAG = "events:search"
+
+# Event fields deciding which listings an event appears in (filters and ordering)
+LISTING_FIELDS = frozenset(
+    {
+        "date",
+        "time",
+        "end_date",
+        "category_id",
+        "venue_id",
+        "location",
+        "is_featured",
+        "event_status",
+        "tags",
+        "latitude",
+        "longitude",
+    }
+)
+
+# Event fields matched by full-text search
+SEARCH_FIELDS = frozenset({"title", "description", "location", "organizer", "tags"})
+
+
+def event_list_namespace(search_params: EventSearchParams) -> str:
+    """Pick the cache namespace for a listing request.
+
+    Text searches go to ``search_results`` (shorter TTL), featured-only listings
+    to ``popular_events`` and everything else to ``events``.
+    """
+    if search_params.q:
+        return SEARCH_RESULTS_NAMESPACE
+    if search_params.is_featured:
+        return FEATURED_EVENTS_NAMESPACE
+    return EVENTS_NAMESPACE
+
+
+def build_event_list_cache_key(
+    search_params: EventSearchParams, language: str
+) -> str:
+    """Build a stable cache key from search parameters and language.
+
+    Equivalent requests map to the same key: text filters are case-folded and
+    whitespace-collapsed, tags are sorted and de-duplicated, coordinates are
+    rounded to ~10 m and unset parameters are dropped.
+
+    Args:
+        search_params: Search parameters of the request
+        language: Resolved response language code
+
+    Returns:
+        str: Cache key of the form ``<language>:<md5 of normalized params>``
+    """
+    params = search_params.model_dump(exclude=_NON_KEY_PARAMS, exclude_none=True)
+
+    for field in ("q", "city"):
+        if field in params:
+            params[field] = " ".join(params[field].lower().split())
+
+    if "tags" in params:
+        params["tags"] = sorted({tag.strip().lower() for tag in params["tags"]})
+
+    for field in ("latitude", "longitude"):
+        if field in params:
+            params[field] = round(params[field], 4)
+
+    normalized = json.dumps(params, sort_keys=True, default=str)
+    digest = hashlib.md5(normalized.encode("utf-8")).hexdigest()
+    return f"{language}:{digest}"
+
+
+def event_list_tags(
+    search_params: EventSearchParams, payload: Optional[Dict[str, Any]]
+) -> List[str]:
+    """Derive invalidation tags for a cached listing page.
+
+    Args:
+        search_params: Search parameters of the request
+        payload: Serialized ``EventResponse`` being cached
+
+    Returns:
+        List of tags (see module docstring)
+    """
+    tags = [f"event:{event['id']}" for event in (payload or {}).get("events", [])]
+
+    if search_params.category_id is not None:
+        tags.append(f"category:{search_params.category_id}")
+    if search_params.venue_id is not None:
+        tags.append(f"venue:{search_params.venue_id}")
+    if search_params.category_id is None and search_params.venue_id is None:
+        tags.append(OPEN_LISTING_TAG)
+
+    if search_params.q:
+        tags.append(SEARCH_LISTING_TAG)
+
+    return tags
+
+
+def event_change_tags(
+    event: Any, changed_fields: Optional[Iterable[str]] = None
+) -> Set[str]:
+    """Tags of listing pages affected by a change to an event.
+
+    Pages showing the event are always affected. Pages that do not show it
+    are only affected when a listing or search field changed, i.e. when the
+    event may now enter them.
+
+    Args:
+        event: Event ORM instance (state before or after the change)
+        changed_fields: Names of modified fields; None means a new or deleted event
+
+    Returns:
+        Set of tags to pass to ``invalidate_event_caches``
+    """
+    tags = {f"event:{event.id}"}
+    fields = LISTING_FIELDS | SEARCH_FIELDS if changed_fields is None else set(changed_fields)
+
+    if fields & LISTING_FIELDS:
+        tags.add(OPEN_LISTING_TAG)
+        if event.category_id is not None:
+            tags.add(f"category:{event.category_id}")
+        if event.venue_id is not None:
+            tags.add(f"venue:{event.venue_id}")
+
+    if fields & SEARCH_FIELDS:
+        tags.add(SEARCH_LISTING_TAG)
+
+    return tags
+
+
+def get_cached_event_response(
+    search_params: EventSearchParams,
+    language: str,
+    loader: Callable[[], Union[EventResponse, Dict[str, Any]]],
+    namespace: Optional[str] = None,
+) -> Union[EventResponse, Dict[str, Any]]:
+    """Return a cached listing response, computing and storing it on a miss.
+
+    Args:
+        search_params: Search parameters of the request
+        language: Resolved response language code
+        loader: Callable producing the response from the database
+        namespace: Optional namespace override (defaults to event_list_namespace)
+
+    Returns:
+        The cached JSON-ready payload on a hit, otherwise the loader result
+
+    Note:
+        Caching is skipped when disabled in settings or when the request sets
+        ``use_cache=false``. Concurrent misses for the same key run the loader
+        once (see CacheService.get_or_set). Cache failures never affect the
+        response; the loader result is returned regardless.
+    """
+    if not settings.enable_caching or not search_params.use_cache:
+        return loader()
+
+    cache = get_cache_service()
+    namespace = namespace or event_list_namespace(search_params)
+    key = build_event_list_cache_key(search_params, language)
+
+    computed = {}
+
+    def load_payload() -> Optional[Dict[str, Any]]:
+        response = computed["response"] = loader()
+        try:
+            if isinstance(response, EventResponse):
+                return response.model_dump(mode="json")
+            return EventResponse.model_validate(response).model_dump(mode="json")
+        except Exception as e:
+            logger.warning(f"Could not cache event listing response: {e}")
+            return None
+
+    payload = cache.get_or_set(
+        namespace,
+        key,
+        load_payload,
+        tags=lambda value: event_list_tags(search_params, value),
+    )
+    if "response" in computed:
+        return computed["response"]
+
+    logger.debug(f"Event listing cache hit: {namespace}:{key}")
+    return payload
+
+
+def invalidate_event_caches(tags: Iterable[str]) -> None:
+    """Drop the cached listing pages registered under the given tags.
+
+    Runs on the cache service's background invalidation worker so the
+    writing request does not wait on Redis.
+
+    Args:
+        tags: Tags from ``event_change_tags``
+    """
+    get_cache_service().invalidate_tags_later(tags)
+
+
+def invalidate_event_list_caches() -> None:
+    """Drop all cached event listing responses.
+
+    Used after scraper ingest, where the set of new or changed events is not
+    tracked individually. Single-event writes should use
+    ``invalidate_event_caches`` instead. The flush runs on the background
+    invalidation worker.
+    """
+    cache = get_cache_service()
+    for namespace in EVENT_LIST_NAMESPACES:
+        cache.flush_namespace_later(namespace)
@@ -1,18 +1,33 @@
 """Events service for handling complex event queries and business logic."""
 
+import base64
+import json
 import logging
+from datetime import date
 from decimal import Decimal
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Optional, Tuple, TypeVar
 
-from sqlalchemy import func, or_
+from sqlalchemy import Select, func, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Query, Session, joinedload
 
 from app.models.event import Event
 from app.models.schemas import EventSearchParams, EventResponse
+from app.core.error_handlers import InvalidParameterError, StandardHTTPException
 from app.core.translation import TranslationService, DEFAULT_LANGUAGE
 
 logger = logging.getLogger(__name__)
 
+# Text search configuration created by migration 015 (unaccent + simple dictionary)
+SEARCH_CONFIG = "croatian_unaccent"
+
+# Queries shorter than this are matched by title prefix instead of full-text search
+MIN_FULL_TEXT_QUERY_LENGTH = 3
+
+# ORM Query (sync service) or 2.0 Select (async service); both support
+# filter/order_by/offset/limit, so filtering and pagination code is shared
+EventsQuery = TypeVar("EventsQuery", Query, Select)
+
 
 def convert_decimal_coordinates(event) -> Any:
     """Convert Decimal coordinates to float for proper JSON serialization.
@@ -50,6 +65,44 @@ def convert_decimal_coordinates(event) -> Any:
     return event
 
 
+def encode_event_cursor(event: Event) -> str:
+    """Encode the keyset position of an event into an opaque cursor.
+
+    The cursor captures the ``(date, time, id)`` ordering key of the last event
+    on a page so the next page can seek directly past it instead of using
+    OFFSET.
+
+    Args:
+        event: Last Event object returned on the current page
+
+    Returns:
+        str: URL-safe base64 cursor string
+    """
+    payload = {"d": event.date.isoformat(), "t": event.time, "i": event.id}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_event_cursor(cursor: str) -> Tuple[date, str, int]:
+    """Decode an opaque cursor produced by encode_event_cursor.
+
+    Args:
+        cursor: Cursor string received from the client
+
+    Returns:
+        Tuple of (date, time, id) to seek after
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return date.fromisoformat(payload["d"]), str(payload["t"]), int(payload["i"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid events cursor: {cursor!r}") from e
+
+
 class EventsService:
     """Service class for handling event-related operations."""
     
@@ -57,6 +110,60 @@ class EventsService:
         self.db = db
         self.translation_service = translation_service
     
+    @staticmethod
+    def _normalize_search_query(q: Optional[str]) -> Optional[str]:
+        """Collapse whitespace in a search query, returning None if it is blank."""
+        if not q:
+            return None
+        normalized = " ".join(q.split())
+        return normalized or None
+    
+    @staticmethod
+    def _ts_query(q: str) -> Any:
+        """Build the websearch_to_tsquery expression for a search query."""
+        return func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    
+    def _apply_text_search(self, query: EventsQuery, q: str) -> EventsQuery:
+        """Filter a query by text search against the events search index.
+        
+        Full-text matches use the ``search_vector`` GIN index through
+        ``websearch_to_tsquery`` (supporting quoted phrases, ``or`` and ``-term``),
+        with diacritics folded by the ``croatian_unaccent`` configuration. Title
+        trigram similarity is OR-ed in so partial words and typos still match via
+        the ``idx_events_title_trgm`` index. Very short queries, which neither
+        index handles well, fall back to a title prefix match.
+        
+        Args:
+            query: Events query to filter
+            q: Normalized search query
+            
+        Returns:
+            Query: Filtered query
+        """
+        if len(q) < MIN_FULL_TEXT_QUERY_LENGTH:
+            return query.filter(Event.title.ilike(f"{q}%"))
+        
+        return query.filter(
+            or_(
+                Event.search_vector.op("@@")(self._ts_query(q)),
+                Event.title.op("%")(q),
+            )
+        )
+    
+    def _search_rank(self, search_params: EventSearchParams) -> Optional[Any]:
+        """Build the relevance expression used to order text search results.
+        
+        Returns:
+            Optional ranking expression, or None when the query has no usable
+            text search term
+        """
+        q = self._normalize_search_query(search_params.q)
+        if not q or len(q) < MIN_FULL_TEXT_QUERY_LENGTH:
+            return None
+        return func.ts_rank(Event.search_vector, self._ts_query(q)) + func.similarity(
+            Event.title, q
+        )
+    
     def get_language_from_header(self, accept_language: Optional[str]) -> str:
         """Extract language preference from Accept-Language header.
         
@@ -111,7 +218,8 @@ class EventsService:
         
         Args:
             search_params: EventSearchParams object containing filter criteria:
-                - q: Text search query for title, description, location
+                - q: Full-text search query over the search_vector column
+                  (title, location, organizer, tags, description)
                 - category_id: Filter by specific event category
                 - venue_id: Filter by specific venue
                 - city: Filter by city name (partial match)
@@ -135,89 +243,148 @@ class EventsService:
                 joinedload(Event.category),
                 joinedload(Event.venue)
             )
-            
-            # Apply filters with error handling
-            if search_params.category_id:
-                query = query.filter(Event.category_id == search_params.category_id)
-            
-            if search_params.venue_id:
-                query = query.filter(Event.venue_id == search_params.venue_id)
-            
-            if search_params.city:
-                query = query.filter(Event.location.ilike(f"%{search_params.city}%"))
-            
-            if search_params.date_from:
-                query = query.filter(Event.date >= search_params.date_from)
-            
-            if search_params.date_to:
-                query = query.filter(Event.date <= search_params.date_to)
-            
-            if search_params.is_featured is not None:
-                query = query.filter(Event.is_featured == search_params.is_featured)
-            
-            if search_params.event_status:
-                query = query.filter(Event.event_status == search_params.event_status)
-            
-            # Text search with error handling
-            if search_params.q:
-                try:
-                    search_term = f"%{search_params.q}%"
-                    query = query.filter(
-                        or_(
-                            Event.title.ilike(search_term),
-                            Event.description.ilike(search_term),
-                            Event.location.ilike(search_term)
-                        )
-                    )
-                except Exception as search_error:
-                    logger.warning(f"Error applying text search filter: {search_error}")
-            
-            # Geographic search with error handling
-            if (search_params.latitude is not None and 
-                search_params.longitude is not None and 
-                search_params.radius_km is not None):
-                
-                try:
-                    # Use Haversine formula for distance calculation
-                    query = query.filter(
-                        func.earth_distance(
-                            func.ll_to_earth(Event.latitude, Event.longitude),
-                            func.ll_to_earth(search_params.latitude, search_params.longitude)
-                        ) <= search_params.radius_km * 1000  # Convert km to meters
-                    )
-                except Exception as geo_error:
-                    logger.warning(f"Error applying geographic filter: {geo_error}")
-            
-            # Tags filter with error handling
-            if search_params.tags:
-                try:
-                    for tag in search_params.tags:
-                        query = query.filter(Event.tags.any(tag))
-                except Exception as tag_error:
-                    logger.warning(f"Error applying tags filter: {tag_error}")
-            
-            return query
+            return self._apply_filters(query, search_params)
             
         except Exception as e:
             logger.error(f"Error building events query: {e}", exc_info=True)
             # Return basic query on error
             return self.db.query(Event)
     
+    def _apply_filters(
+        self, query: EventsQuery, search_params: EventSearchParams
+    ) -> EventsQuery:
+        """Apply the search parameter filters to an events query or select."""
+        # Apply filters with error handling
+        if search_params.category_id:
+            query = query.filter(Event.category_id == search_params.category_id)
+        
+        if search_params.venue_id:
+            query = query.filter(Event.venue_id == search_params.venue_id)
+        
+        if search_params.city:
+            query = query.filter(Event.location.ilike(f"%{search_params.city}%"))
+        
+        if search_params.date_from:
+            query = query.filter(Event.date >= search_params.date_from)
+        
+        if search_params.date_to:
+            query = query.filter(Event.date <= search_params.date_to)
+        
+        if search_params.is_featured is not None:
+            query = query.filter(Event.is_featured == search_params.is_featured)
+        
+        if search_params.event_status:
+            query = query.filter(Event.event_status == search_params.event_status)
+        
+        # Text search with error handling
+        search_query = self._normalize_search_query(search_params.q)
+        if search_query:
+            try:
+                query = self._apply_text_search(query, search_query)
+            except Exception as search_error:
+                logger.warning(f"Error applying text search filter: {search_error}")
+        
+        # Geographic search with error handling
+        if (search_params.latitude is not None and 
+            search_params.longitude is not None and 
+            search_params.radius_km is not None):
+            
+            try:
+                # Use Haversine formula for distance calculation
+                query = query.filter(
+                    func.earth_distance(
+                        func.ll_to_earth(Event.latitude, Event.longitude),
+                        func.ll_to_earth(search_params.latitude, search_params.longitude)
+                    ) <= search_params.radius_km * 1000  # Convert km to meters
+                )
+            except Exception as geo_error:
+                logger.warning(f"Error applying geographic filter: {geo_error}")
+        
+        # Tags filter with error handling
+        if search_params.tags:
+            try:
+                for tag in search_params.tags:
+                    query = query.filter(Event.tags.any(tag))
+            except Exception as tag_error:
+                logger.warning(f"Error applying tags filter: {tag_error}")
+        
+        return query
+    
+    def _estimate_count(self, query: Query) -> int:
+        """Estimate the number of rows a query returns using the planner.
+
+        Runs ``EXPLAIN (FORMAT JSON)`` on the id-only form of the query and reads
+        the planner's row estimate, which avoids scanning every matching row the
+        way ``COUNT(*)`` does.
+
+        Args:
+            query: Filtered events query built by build_events_query
+
+        Returns:
+            int: Planner row estimate for the query
+        """
+        return self._explain_row_estimate(self.db, query.with_entities(Event.id).statement)
+
+    @staticmethod
+    def _explain_row_estimate(db: Session, statement: Select) -> int:
+        """Return the planner's row estimate for a select statement."""
+        compiled = statement.compile(dialect=db.get_bind().dialect)
+        params = compiled.params
+        if compiled.positional:
+            # e.g. asyncpg ($1, $2, ...) expects parameters in order
+            params = tuple(params[name] for name in compiled.positiontup)
+        plan = db.connection().exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}", params
+        ).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def _count_events(self, query: Query, count_mode: str) -> Optional[int]:
+        """Count matching events according to the requested count mode."""
+        if count_mode == "none":
+            return None
+
+        if count_mode == "estimated":
+            try:
+                return self._estimate_count(query)
+            except Exception as estimate_error:
+                logger.warning(
+                    f"Error estimating event count, falling back to exact count: {estimate_error}"
+                )
+
+        try:
+            return query.count()
+        except Exception as count_error:
+            logger.error(f"Error counting events: {count_error}")
+            # Fallback to basic count
+            return self.db.query(Event).count()
+
     def get_events_paginated(
         self, 
         search_params: EventSearchParams, 
         language: Optional[str] = None
-    ) -> Tuple[List[Event], int, int]:
+    ) -> Tuple[List[Event], Optional[int], Optional[int], Optional[str]]:
         """Get paginated events based on search parameters with transaction safety.
         
         Executes the event search query with pagination support, coordinate conversion,
-        and comprehensive error handling. Orders results by date/time and converts
-        Decimal coordinates to float for proper JSON serialization.
+        and comprehensive error handling. Orders results by date/time/id (text
+        searches by relevance first) and converts Decimal coordinates to float for
+        proper JSON serialization.
+        
+        Two pagination modes are supported:
+            - Offset mode (default): ``page``/``size`` translated to OFFSET/LIMIT
+            - Keyset mode: when ``cursor`` is set, the query seeks past the
+              ``(date, time, id)`` position encoded in the cursor, so deep pages
+              cost the same as the first one. ``page`` is ignored in this mode.
+              Relevance-ordered text searches always use offset mode.
         
         Args:
             search_params: EventSearchParams object with search criteria and pagination:
                 - page: Page number (1-based)
                 - size: Number of items per page
+                - cursor: Optional keyset cursor from a previous response
+                - count_mode: "exact", "estimated" (planner estimate) or "none"
                 - All other search/filter parameters
             language: Optional language code for localized content (currently unused
                 but reserved for future translation features)
@@ -225,46 +392,114 @@ class EventsService:
         Returns:
             Tuple containing:
                 - List[Event]: List of Event objects matching the search criteria
-                - int: Total number of events matching the search (for pagination)
-                - int: Total number of pages available
+                - Optional[int]: Total number of matching events, None when
+                  count_mode is "none"
+                - Optional[int]: Total number of pages, None when count_mode is "none"
+                - Optional[str]: Cursor for the next page, None on the last page
+                
+        Raises:
+            InvalidParameterError: If the cursor is malformed (HTTP 400)
                 
         Note:
-            Events are ordered by date (ascending) then time (ascending) for chronological
-            presentation. Includes fallback error handling that returns empty results
-            if the query fails completely.
+            Every page fetches one extra row to detect whether a next page exists,
+            so next_cursor is returned in offset mode too and clients can switch
+            to keyset mode after the first page. Includes fallback error handling
+            that returns empty results if the query fails completely.
         """
         
         try:
             # Build base query
             query = self.build_events_query(search_params)
             
-            # Get total count with error handling
-            try:
-                total = query.count()
-            except Exception as count_error:
-                logger.error(f"Error counting events: {count_error}")
-                # Fallback to basic count
-                total = self.db.query(Event).count()
-            
-            # Apply ordering
-            query = query.order_by(Event.date.asc(), Event.time.asc())
+            # Paginate first so a bad cursor is rejected before any query runs
+            page_query, rank = self._order_and_paginate(query, search_params)
             
-            # Apply pagination
-            offset = (search_params.page - 1) * search_params.size
-            events = query.offset(offset).limit(search_params.size).all()
-            
-            # Convert Decimal coordinates to float for proper serialization
-            events = [convert_decimal_coordinates(event) for event in events]
-            
-            # Calculate total pages
-            pages = (total + search_params.size - 1) // search_params.size
+            total = self._count_events(query, search_params.count_mode)
+            events = page_query.all()
             
-            return events, total, pages
+            return self._build_page(events, total, search_params, rank)
             
+        except StandardHTTPException:
+            # Client errors (e.g. a bad cursor) reach the exception handlers
+            raise
         except Exception as e:
             logger.error(f"Error in get_events_paginated: {e}", exc_info=True)
             # Return empty results on error
-            return [], 0, 0
+            return [], 0, 0, None
+    
+    def _order_and_paginate(
+        self, query: EventsQuery, search_params: EventSearchParams
+    ) -> Tuple[EventsQuery, Optional[Any]]:
+        """Apply ordering and offset/keyset pagination to an events query.
+        
+        Fetches one row more than the page size so _build_page can tell
+        whether a next page exists.
+        
+        Returns:
+            Tuple of the paginated query and the relevance rank expression
+            (None unless this is a ranked text search)
+            
+        Raises:
+            InvalidParameterError: If the cursor is malformed (HTTP 400)
+        """
+        # Text searches are ordered by relevance first; keyset cursors only
+        # describe the chronological order, so they are disabled for them
+        rank = self._search_rank(search_params)
+        
+        # Apply ordering (id breaks ties so the keyset order is total)
+        if rank is not None:
+            query = query.order_by(
+                rank.desc(), Event.date.asc(), Event.time.asc(), Event.id.asc()
+            )
+        else:
+            query = query.order_by(Event.date.asc(), Event.time.asc(), Event.id.asc())
+        
+        seek_position = None
+        if search_params.cursor and rank is None:
+            try:
+                seek_position = decode_event_cursor(search_params.cursor)
+            except ValueError as cursor_error:
+                # Restarting at page 1 would silently repeat results
+                raise InvalidParameterError(
+                    "cursor", "Invalid events cursor"
+                ) from cursor_error
+        
+        # Apply pagination
+        if seek_position:
+            query = query.filter(
+                tuple_(Event.date, Event.time, Event.id) > tuple_(*seek_position)
+            )
+        else:
+            offset = (search_params.page - 1) * search_params.size
+            query = query.offset(offset)
+        
+        return query.limit(search_params.size + 1), rank
+    
+    @staticmethod
+    def _build_page(
+        events: List[Event],
+        total: Optional[int],
+        search_params: EventSearchParams,
+        rank: Optional[Any],
+    ) -> Tuple[List[Event], Optional[int], Optional[int], Optional[str]]:
+        """Trim the look-ahead row and compute pages and the next cursor."""
+        has_more = len(events) > search_params.size
+        events = events[:search_params.size]
+        next_cursor = (
+            encode_event_cursor(events[-1]) if has_more and rank is None else None
+        )
+        
+        # Convert Decimal coordinates to float for proper serialization
+        events = [convert_decimal_coordinates(event) for event in events]
+        
+        # Calculate total pages
+        pages = (
+            (total + search_params.size - 1) // search_params.size
+            if total is not None
+            else None
+        )
+        
+        return events, total, pages, next_cursor
     
     def search_events(
         self, 
@@ -294,6 +529,7 @@ class EventsService:
                 - page: Current page number
                 - size: Number of events returned in this response
                 - pages: Total number of pages available for pagination
+                - next_cursor: Keyset cursor for the next page, if any
                 
         Note:
             This method orchestrates the complete event search workflow including
@@ -308,16 +544,22 @@ class EventsService:
                 language = self.get_language_from_header(accept_language)
             
             # Get paginated results with error handling
-            events, total, pages = self.get_events_paginated(search_params, language)
+            events, total, pages, next_cursor = self.get_events_paginated(
+                search_params, language
+            )
             
             return EventResponse(
                 events=events,
                 total=total,
                 page=search_params.page,
                 size=search_params.size,
-                pages=pages
+                pages=pages,
+                next_cursor=next_cursor
             )
             
+        except StandardHTTPException:
+            # Client errors (e.g. a bad cursor) reach the exception handlers
+            raise
         except Exception as e:
             logger.error(f"Error in search_events: {e}", exc_info=True)
             # Return empty response on error
@@ -327,4 +569,141 @@ class EventsService:
                 page=search_params.page,
                 size=search_params.size,
                 pages=0
-            )
\ No newline at end of file
+            )
+
+
+class AsyncEventsService(EventsService):
+    """EventsService for ``async def`` endpoints using an AsyncSession.
+    
+    Filtering, ordering and pagination rules are shared with EventsService;
+    only statement execution differs.
+    """
+    
+    def __init__(self, db: AsyncSession, translation_service: Optional[TranslationService] = None):
+        super().__init__(db, translation_service)
+    
+    def build_events_statement(
+        self, search_params: EventSearchParams, *columns: Any
+    ) -> Select:
+        """Build the events select statement for the given search parameters.
+        
+        Args:
+            search_params: EventSearchParams object containing filter criteria
+            *columns: Optional columns to select instead of full Event rows
+                (used for counting)
+                
+        Returns:
+            Select: Filtered statement; full Event rows eagerly load category
+                and venue
+        """
+        try:
+            if columns:
+                statement = select(*columns)
+            else:
+                statement = select(Event).options(
+                    joinedload(Event.category),
+                    joinedload(Event.venue)
+                )
+            return self._apply_filters(statement, search_params)
+            
+        except Exception as e:
+            logger.error(f"Error building events statement: {e}", exc_info=True)
+            # Return basic statement on error
+            return select(*columns) if columns else select(Event)
+    
+    async def _count_events_async(
+        self, search_params: EventSearchParams
+    ) -> Optional[int]:
+        """Count matching events according to the requested count mode."""
+        if search_params.count_mode == "none":
+            return None
+        
+        id_statement = self.build_events_statement(search_params, Event.id)
+        
+        if search_params.count_mode == "estimated":
+            try:
+                return await self.db.run_sync(self._explain_row_estimate, id_statement)
+            except Exception as estimate_error:
+                logger.warning(
+                    f"Error estimating event count, falling back to exact count: {estimate_error}"
+                )
+        
+        try:
+            return await self.db.scalar(
+                select(func.count()).select_from(id_statement.subquery())
+            )
+        except Exception as count_error:
+            logger.error(f"Error counting events: {count_error}")
+            # Fallback to basic count
+            return await self.db.scalar(select(func.count(Event.id)))
+    
+    async def get_events_paginated(
+        self, 
+        search_params: EventSearchParams, 
+        language: Optional[str] = None
+    ) -> Tuple[List[Event], Optional[int], Optional[int], Optional[str]]:
+        """Get paginated events based on search parameters.
+        
+        Async counterpart of EventsService.get_events_paginated with the same
+        ordering, cursor and count_mode semantics and return value.
+        """
+        try:
+            statement, rank = self._order_and_paginate(
+                self.build_events_statement(search_params), search_params
+            )
+            
+            total = await self._count_events_async(search_params)
+            result = await self.db.execute(statement)
+            events = list(result.unique().scalars().all())
+            
+            return self._build_page(events, total, search_params, rank)
+            
+        except StandardHTTPException:
+            # Client errors (e.g. a bad cursor) reach the exception handlers
+            raise
+        except Exception as e:
+            logger.error(f"Error in async get_events_paginated: {e}", exc_info=True)
+            # Return empty results on error
+            return [], 0, 0, None
+    
+    async def search_events(
+        self, 
+        search_params: EventSearchParams, 
+        accept_language: Optional[str] = None
+    ) -> EventResponse:
+        """Search events and build the paginated EventResponse.
+        
+        Async counterpart of EventsService.search_events.
+        """
+        try:
+            # Determine language
+            language = search_params.language
+            if not language:
+                language = self.get_language_from_header(accept_language)
+            
+            events, total, pages, next_cursor = await self.get_events_paginated(
+                search_params, language
+            )
+            
+            return EventResponse(
+                events=events,
+                total=total,
+                page=search_params.page,
+                size=search_params.size,
+                pages=pages,
+                next_cursor=next_cursor
+            )
+            
+        except StandardHTTPException:
+            # Client errors (e.g. a bad cursor) reach the exception handlers
+            raise
+        except Exception as e:
+            logger.error(f"Error in async search_events: {e}", exc_info=True)
+            # Return empty response on error
+            return EventResponse(
+                events=[],
+                total=0,
+                page=search_params.page,
+                size=search_params.size,
+                pages=0
+            )
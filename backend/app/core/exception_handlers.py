@@ -59,7 +59,7 @@ async def standard_http_exception_handler(
     
     return JSONResponse(
         status_code=exc.status_code,
-        content=error_response.dict()
+        content=error_response.model_dump(mode="json")
     )
 
 
@@ -123,7 +123,7 @@ async def validation_exception_handler(
     
     return JSONResponse(
         status_code=422,
-        content=error_response.dict()
+        content=error_response.model_dump(mode="json")
     )
 
 
@@ -207,7 +207,7 @@ async def generic_exception_handler(
     
     return JSONResponse(
         status_code=500,
-        content=error_response.dict()
+        content=error_response.model_dump(mode="json")
     )
 
 
@@ -6,11 +6,12 @@ Handles dynamic venue discovery and coordinate caching.
 import os
 import logging
 import asyncio
-from typing import Optional, Dict, List, Tuple
-from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, Dict, List, Tuple
+from dataclasses import asdict, dataclass
 import httpx
 from datetime import datetime, timedelta
 
+from app.core.async_cache import get_async_cache_service
 from app.core.database import SessionLocal
 from app.core.croatian_geo_db import croatian_geo_db
 from app.config.components import get_settings
@@ -18,6 +19,9 @@ from sqlalchemy import text
 
 logger = logging.getLogger(__name__)
 
+# Redis namespace for provider geocoding responses (TTL in cache.TTL_CONFIG)
+GEOCODING_CACHE_NAMESPACE = "geocoding"
+
 @dataclass
 class GeocodeResult:
     """Result of geocoding operation."""
@@ -65,10 +69,38 @@ class GeocodingService:
             self.croatia_bounds['west'] <= lng <= self.croatia_bounds['east']
         )
 
+    async def _cached_geocode(
+        self,
+        provider: str,
+        query: str,
+        fetch: Callable[[], Awaitable[Optional[GeocodeResult]]]
+    ) -> Optional[GeocodeResult]:
+        """Serve provider lookups from Redis, calling the provider on a miss."""
+        async def load() -> Optional[Dict]:
+            result = await fetch()
+            return asdict(result) if result else None
+
+        cache = get_async_cache_service()
+        cache_key = f"{provider}:{' '.join(query.lower().split())}"
+        data = await cache.get_or_set(GEOCODING_CACHE_NAMESPACE, cache_key, load)
+        return GeocodeResult(**data) if data else None
+
     async def geocode_with_mapbox(
         self, 
         location: str, 
         context: str = ""
+    ) -> Optional[GeocodeResult]:
+        """Geocode location using Mapbox API (results cached in Redis)."""
+        return await self._cached_geocode(
+            "mapbox",
+            f"{location}|{context}",
+            lambda: self._fetch_mapbox(location, context)
+        )
+
+    async def _fetch_mapbox(
+        self, 
+        location: str, 
+        context: str = ""
     ) -> Optional[GeocodeResult]:
         """Geocode location using Mapbox API."""
         if not self.mapbox_token:
@@ -337,20 +369,19 @@ class GeocodingService:
             return nominatim_result
         
         # Step 5: Last resort - use Croatian city center if location contains Croatian city name
-        for city_name, city_location in croatian_geo_db.locations.items():
-            if city_location.location_type == "city":
-                for alias in [city_name] + city_location.aliases:
-                    if alias in location.lower():
-                        logger.warning(f"Using city center fallback for {location} -> {city_location.name}")
-                        return GeocodeResult(
-                            latitude=city_location.latitude,
-                            longitude=city_location.longitude,
-                            accuracy='city_fallback',
-                            confidence=0.3,  # Low confidence for fallback
-                            source='croatian_db_fallback',
-                            place_name=f"{city_location.name} (approximate)",
-                            place_type='city'
-                        )
+        match = croatian_geo_db.match_address(location)
+        city_location = croatian_geo_db.locations.get(match.city.lower()) if match and match.city else None
+        if city_location:
+            logger.warning(f"Using city center fallback for {location} -> {city_location.name}")
+            return GeocodeResult(
+                latitude=city_location.latitude,
+                longitude=city_location.longitude,
+                accuracy='city_fallback',
+                confidence=0.3,  # Low confidence for fallback
+                source='croatian_db_fallback',
+                place_name=f"{city_location.name} (approximate)",
+                place_type='city'
+            )
         
         # Step 6: Ultimate fallback - Zagreb center for Croatian events
         if "croatia" in location.lower() or context.lower().startswith("croatia"):
@@ -371,6 +402,15 @@ class GeocodingService:
     async def geocode_with_nominatim(
         self, 
         location: str
+    ) -> Optional[GeocodeResult]:
+        """Geocode using Nominatim (OpenStreetMap) as fallback (results cached in Redis)."""
+        return await self._cached_geocode(
+            "nominatim", location, lambda: self._fetch_nominatim(location)
+        )
+
+    async def _fetch_nominatim(
+        self, 
+        location: str
     ) -> Optional[GeocodeResult]:
         """Geocode using Nominatim (OpenStreetMap) as fallback."""
         try:
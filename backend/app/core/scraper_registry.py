@@ -14,6 +14,8 @@ from datetime import datetime
 
 from pydantic import BaseModel
 
+from app.core.events_cache import invalidate_event_list_caches
+
 logger = logging.getLogger(__name__)
 
 
@@ -94,6 +96,10 @@ class ScraperRegistry:
             
             processing_time = (datetime.now() - start_time).total_seconds()
             
+            # Newly saved events make cached listings stale
+            if result.get("saved_events", 0) > 0:
+                invalidate_event_list_caches()
+            
             # Standardize the result
             return ScraperResult(
                 status=result.get("status", "success"),
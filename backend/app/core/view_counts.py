@@ -0,0 +1,128 @@
+"""
+Buffered event view counting.
+
+Detail reads record a view in a Redis hash (or, when Redis is unavailable, in
+a per-process buffer) instead of updating ``events.view_count`` inside the
+request. A background task started with the application periodically folds
+the pending counts into the database with one batched UPDATE, so hot events
+no longer take a row lock on every read.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import Counter
+from typing import Dict, Optional
+
+from sqlalchemy import bindparam, func
+from sqlalchemy.orm import Session
+
+from app.core.cache import get_cache_service
+from app.core.database import SessionLocal
+from app.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+# Redis hash of event_id -> views not yet written to the database
+VIEW_COUNTS_NAMESPACE = "view_counts"
+PENDING_VIEWS_KEY = "pending"
+
+# Seconds between batched writes while the application runs
+FLUSH_INTERVAL_SECONDS = 60
+
+# Fallback buffer used while Redis is unavailable
+_local_views: Counter = Counter()
+_local_views_lock = threading.Lock()
+
+_update_view_counts = (
+    Event.__table__.update()
+    .where(Event.__table__.c.id == bindparam("event_id"))
+    .values(view_count=func.coalesce(Event.__table__.c.view_count, 0) + bindparam("views"))
+)
+
+
+def record_event_view(event_id: int) -> None:
+    """Record one view of an event without touching the database."""
+    cache = get_cache_service()
+    if cache.increment_field(VIEW_COUNTS_NAMESPACE, PENDING_VIEWS_KEY, str(event_id)) is None:
+        with _local_views_lock:
+            _local_views[event_id] += 1
+
+
+def _take_pending_views() -> Dict[int, int]:
+    """Collect and clear pending views from Redis and the local buffer."""
+    pending: Counter = Counter()
+
+    redis_views = get_cache_service().pop_counters(VIEW_COUNTS_NAMESPACE, PENDING_VIEWS_KEY)
+    for event_id, views in (redis_views or {}).items():
+        pending[int(event_id)] += views
+
+    with _local_views_lock:
+        pending.update(_local_views)
+        _local_views.clear()
+
+    return {event_id: views for event_id, views in pending.items() if views > 0}
+
+
+def _restore_pending_views(pending: Dict[int, int]) -> None:
+    """Put views back into the local buffer after a failed flush."""
+    with _local_views_lock:
+        _local_views.update(pending)
+
+
+def flush_view_counts(db: Optional[Session] = None) -> int:
+    """Write pending view counts to ``events.view_count`` in one batch.
+
+    Args:
+        db: Optional database session. A new session is opened and closed
+            when not provided
+
+    Returns:
+        int: Number of views written
+
+    Note:
+        Rows are updated in id order so concurrent flushes from several
+        workers cannot deadlock. If the write fails, the counts are kept in
+        the local buffer and retried on the next flush.
+    """
+    pending = _take_pending_views()
+    if not pending:
+        return 0
+
+    owns_session = db is None
+    db = db or SessionLocal()
+    try:
+        db.execute(
+            _update_view_counts,
+            [
+                {"event_id": event_id, "views": views}
+                for event_id, views in sorted(pending.items())
+            ],
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        _restore_pending_views(pending)
+        logger.error(f"Failed to flush view counts for {len(pending)} events: {e}")
+        return 0
+    finally:
+        if owns_session:
+            db.close()
+
+    total_views = sum(pending.values())
+    logger.info(f"Flushed {total_views} views for {len(pending)} events")
+    return total_views
+
+
+async def run_view_count_flusher(interval: float = FLUSH_INTERVAL_SECONDS) -> None:
+    """Flush pending view counts every ``interval`` seconds until cancelled.
+
+    Runs as a task of the application lifespan, independent of the optional
+    scheduler, with the blocking database write in a worker thread.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(flush_view_counts)
+        except Exception as e:
+            logger.error(f"View count flush failed: {e}")
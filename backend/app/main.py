@@ -1,6 +1,7 @@
+import asyncio
 import logging
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import Dict
 
 from fastapi import FastAPI
@@ -29,6 +30,11 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Kruzna Karta Hrvatska API...")
     logger.info("Centralized exception handlers and correlation ID middleware configured")
 
+    # Write buffered event views periodically, with or without the scheduler
+    from app.core.view_counts import run_view_count_flusher
+
+    view_count_flusher = asyncio.create_task(run_view_count_flusher())
+
     # Start scheduler if enabled
     enable_scheduler = os.getenv("ENABLE_SCHEDULER", "false").lower() == "true"
     if enable_scheduler:
@@ -44,6 +50,24 @@ async def lifespan(app: FastAPI):
         from app.tasks.scheduler import stop_scheduler
 
         stop_scheduler()
+
+    # Write view counts still buffered by this worker
+    from app.core.view_counts import flush_view_counts
+
+    view_count_flusher.cancel()
+    with suppress(asyncio.CancelledError):
+        await view_count_flusher
+    flush_view_counts()
+
+    from app.core.data_quality import shutdown_validation_pool
+    from app.core.database import dispose_async_engine
+    from app.scraping.browser_pool import close_browser_pool
+    from app.scraping.http_client import close_http_clients
+
+    shutdown_validation_pool()
+    await close_browser_pool()
+    await close_http_clients()
+    await dispose_async_engine()
     logger.info("Shutting down Kruzna Karta Hrvatska API...")
 
 
@@ -1,6 +1,6 @@
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -186,10 +186,11 @@ class Event(EventBase):
 # Response Schemas
 class EventResponse(BaseModel):
     events: List[Event]
-    total: int
+    total: Optional[int]
     page: int
     size: int
-    pages: int
+    pages: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 class CategoryResponse(BaseModel):
@@ -222,6 +223,12 @@ class EventSearchParams(BaseModel):
     language: Optional[str] = Field(None, description="Language code for translations")
     page: int = Field(default=1, ge=1, description="Page number")
     size: int = Field(default=20, ge=1, le=100, description="Page size")
+    cursor: Optional[str] = Field(
+        None, description="Opaque keyset cursor from a previous response's next_cursor"
+    )
+    count_mode: Literal["exact", "estimated", "none"] = Field(
+        default="exact", description="How to compute the total: exact, estimated or none"
+    )
     use_cache: bool = Field(default=True, description="Use cached results for better performance")
 
 
@@ -1,18 +1,22 @@
 from typing import Dict, Optional
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.core.error_handlers import (
     CategoryNotFoundError,
     ResourceAlreadyExistsError,
     CannotDeleteReferencedEntityError
 )
+from app.core.events_service import AsyncEventsService
 from app.models.category import EventCategory
+from app.models.event import Event
 from app.models.schemas import (
     CategoryResponse,
     EventResponse,
+    EventSearchParams,
 )
 from app.models.schemas import EventCategory as CategorySchema
 from app.models.schemas import (
@@ -24,9 +28,9 @@ router = APIRouter(prefix="/categories", tags=["categories"])
 
 
 @router.get("/", response_model=CategoryResponse)
-def get_categories(
+async def get_categories(
     search: Optional[str] = Query(None, description="Search categories by name"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> CategoryResponse:
     """Get all event categories with optional search filtering.
     
@@ -50,18 +54,19 @@ def get_categories(
         This endpoint does not use pagination as the number of categories is
         typically small (10-50 categories).
     """
-    query = db.query(EventCategory)
+    statement = select(EventCategory)
 
     if search:
-        query = query.filter(EventCategory.name.ilike(f"%{search}%"))
+        statement = statement.where(EventCategory.name.ilike(f"%{search}%"))
 
-    categories = query.order_by(EventCategory.name.asc()).all()
+    result = await db.execute(statement.order_by(EventCategory.name.asc()))
+    categories = result.scalars().all()
 
     return CategoryResponse(categories=categories, total=len(categories))
 
 
 @router.get("/{category_id}", response_model=CategorySchema)
-def get_category(category_id: int, db: Session = Depends(get_db)) -> CategorySchema:
+async def get_category(category_id: int, db: AsyncSession = Depends(get_async_db)) -> CategorySchema:
     """Get a specific event category by its unique ID.
     
     Retrieves detailed information for a single category using its numeric
@@ -84,14 +89,14 @@ def get_category(category_id: int, db: Session = Depends(get_db)) -> CategorySch
     Raises:
         CategoryNotFoundError: If category with given ID is not found
     """
-    category = db.query(EventCategory).filter(EventCategory.id == category_id).first()
+    category = await db.get(EventCategory, category_id)
     if not category:
         raise CategoryNotFoundError(category_id)
     return category
 
 
 @router.get("/slug/{slug}", response_model=CategorySchema)
-def get_category_by_slug(slug: str, db: Session = Depends(get_db)) -> CategorySchema:
+async def get_category_by_slug(slug: str, db: AsyncSession = Depends(get_async_db)) -> CategorySchema:
     """Get a specific event category by its URL-friendly slug.
     
     Retrieves category information using the slug identifier, which is the
@@ -114,14 +119,14 @@ def get_category_by_slug(slug: str, db: Session = Depends(get_db)) -> CategorySc
     Raises:
         CategoryNotFoundError: If category with given slug is not found
     """
-    category = db.query(EventCategory).filter(EventCategory.slug == slug).first()
+    category = await db.scalar(select(EventCategory).where(EventCategory.slug == slug))
     if not category:
         raise CategoryNotFoundError(slug, by_slug=True)
     return category
 
 
 @router.post("/", response_model=CategorySchema)
-def create_category(category: EventCategoryCreate, db: Session = Depends(get_db)) -> CategorySchema:
+async def create_category(category: EventCategoryCreate, db: AsyncSession = Depends(get_async_db)) -> CategorySchema:
     """Create a new event category in the system.
     
     Administrative endpoint for adding new event categories. Categories are used
@@ -144,40 +149,36 @@ def create_category(category: EventCategoryCreate, db: Session = Depends(get_db)
         ResourceAlreadyExistsError: If a category with the same slug already exists
     """
     # Check if slug already exists
-    existing = (
-        db.query(EventCategory).filter(EventCategory.slug == category.slug).first()
+    existing = await db.scalar(
+        select(EventCategory).where(EventCategory.slug == category.slug)
     )
     if existing:
         raise ResourceAlreadyExistsError("Category", "slug", category.slug)
 
     db_category = EventCategory(**category.model_dump())
     db.add(db_category)
-    db.commit()
-    db.refresh(db_category)
+    await db.commit()
+    await db.refresh(db_category)
     return db_category
 
 
 @router.put("/{category_id}", response_model=CategorySchema)
-def update_category(
-    category_id: int, category: EventCategoryUpdate, db: Session = Depends(get_db)
+async def update_category(
+    category_id: int, category: EventCategoryUpdate, db: AsyncSession = Depends(get_async_db)
 ) -> CategorySchema:
     """Update an existing category."""
-    db_category = (
-        db.query(EventCategory).filter(EventCategory.id == category_id).first()
-    )
+    db_category = await db.get(EventCategory, category_id)
     if not db_category:
         raise CategoryNotFoundError(category_id)
 
     # Check if new slug conflicts with existing category
     update_data = category.model_dump(exclude_unset=True)
     if "slug" in update_data:
-        existing = (
-            db.query(EventCategory)
-            .filter(
+        existing = await db.scalar(
+            select(EventCategory).where(
                 EventCategory.slug == update_data["slug"],
                 EventCategory.id != category_id,
             )
-            .first()
         )
         if existing:
             raise ResourceAlreadyExistsError("Category", "slug", update_data["slug"])
@@ -186,13 +187,13 @@ def update_category(
     for field, value in update_data.items():
         setattr(db_category, field, value)
 
-    db.commit()
-    db.refresh(db_category)
+    await db.commit()
+    await db.refresh(db_category)
     return db_category
 
 
 @router.delete("/{category_id}")
-def delete_category(category_id: int, db: Session = Depends(get_db)) -> Dict[str, str]:
+async def delete_category(category_id: int, db: AsyncSession = Depends(get_async_db)) -> Dict[str, str]:
     """Delete an event category from the system.
     
     Administrative endpoint for removing categories. Before deletion, the system
@@ -211,38 +212,34 @@ def delete_category(category_id: int, db: Session = Depends(get_db)) -> Dict[str
         CategoryNotFoundError: If category with given ID is not found
         CannotDeleteReferencedEntityError: If category has associated events and cannot be deleted
     """
-    db_category = (
-        db.query(EventCategory).filter(EventCategory.id == category_id).first()
-    )
+    db_category = await db.get(EventCategory, category_id)
     if not db_category:
         raise CategoryNotFoundError(category_id)
 
     # Check if category has events
-    from app.models.event import Event
-
-    events_count = db.query(Event).filter(Event.category_id == category_id).count()
+    events_count = await db.scalar(
+        select(func.count(Event.id)).where(Event.category_id == category_id)
+    )
     if events_count > 0:
         raise CannotDeleteReferencedEntityError("category", category_id, events_count, "events")
 
-    db.delete(db_category)
-    db.commit()
+    await db.delete(db_category)
+    await db.commit()
     return {"message": "Category deleted successfully"}
 
 
 @router.get("/{category_id}/events")
-def get_category_events(
+async def get_category_events(
     category_id: int,
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> EventResponse:
     """Get all events for a specific category."""
-    # Import here to avoid circular imports
-    from app.routes.events import get_events
-
     # Verify category exists
-    category = db.query(EventCategory).filter(EventCategory.id == category_id).first()
+    category = await db.get(EventCategory, category_id)
     if not category:
         raise CategoryNotFoundError(category_id)
 
-    return get_events(category_id=category_id, page=page, size=size, db=db)
+    search_params = EventSearchParams(category_id=category_id, page=page, size=size)
+    return await AsyncEventsService(db).search_events(search_params)
@@ -40,8 +40,15 @@ def convert_decimal_coordinates(event: Any) -> Any:
     return event
 
 from app.core.database import get_db, safe_db_operation, health_check_db, reset_database_connections
+from app.core.events_cache import (
+    FEATURED_EVENTS_NAMESPACE,
+    event_change_tags,
+    get_cached_event_response,
+    invalidate_event_caches,
+)
 from app.core.events_service import EventsService
 from app.core.geocoding_service import geocoding_service
+from app.core.view_counts import record_event_view
 # Performance service removed for MVP simplification
 from app.core.translation import (
     DEFAULT_LANGUAGE,
@@ -107,13 +114,16 @@ def _safe_get_events_paginated(search_params: EventSearchParams):
         translation_service = get_translation_service()
         events_service = EventsService(db, translation_service)
         
-        events, total, pages = events_service.get_events_paginated(search_params)
+        events, total, pages, next_cursor = events_service.get_events_paginated(
+            search_params
+        )
         return {
             "events": events,
             "total": total,
             "pages": pages,
             "page": search_params.page,
-            "size": search_params.size
+            "size": search_params.size,
+            "next_cursor": next_cursor
         }
     
     return safe_db_operation(_paginated_operation)
@@ -146,28 +156,39 @@ def get_events(
             - language: Language code for translations
             - page: Page number for pagination (default: 1)
             - size: Items per page (default: 20, max: 100)
+            - cursor: Keyset cursor from a previous next_cursor (ignores page)
+            - count_mode: "exact" (default), "estimated" or "none"
         accept_language: HTTP Accept-Language header for automatic language detection
         
     Returns:
         EventResponse: Paginated response containing:
             - events: List of matching Event objects with full details
-            - total: Total number of matching events
+            - total: Total number of matching events (None when count_mode="none")
             - page: Current page number
             - size: Number of items returned
-            - pages: Total number of pages available
+            - pages: Total number of pages available (None when count_mode="none")
+            - next_cursor: Cursor for seeking to the next page, None on the last page
             
     Raises:
         DatabaseOperationError: If database operations fail
         ExternalServiceError: If external services are unavailable
         
     Note:
-        Uses centralized exception handling for consistent error responses
+        Responses are cached per normalized search parameters and language;
+        pass use_cache=false to bypass. Uses centralized exception handling
+        for consistent error responses
     """
     logger.info(f"Getting events with params: page={search_params.page}, size={search_params.size}")
     
-    # Use safe events service (performance optimization removed for MVP)
+    language = search_params.language or get_language_from_header(accept_language)
+    
+    # Serve identical listings from the response cache
     # Let centralized exception handlers manage any errors that bubble up
-    return _safe_search_events(search_params, accept_language)
+    return get_cached_event_response(
+        search_params,
+        language,
+        lambda: _safe_search_events(search_params, accept_language),
+    )
 
 
 @router.get("/featured", response_model=EventResponse)
@@ -177,10 +198,18 @@ def get_featured_events(
 ):
     """Get featured events with safe database operations.
     
-    Uses centralized exception handling for consistent error responses.
+    Responses are cached in the ``popular_events`` namespace since the
+    featured listing is identical for most visitors. Uses centralized exception
+    handling for consistent error responses.
     """
     logger.info(f"Getting featured events: page={page}, size={size}")
-    return _safe_get_featured_events(page, size)
+    search_params = EventSearchParams(page=page, size=size, is_featured=True)
+    return get_cached_event_response(
+        search_params,
+        DEFAULT_LANGUAGE,
+        lambda: _safe_get_featured_events(page, size),
+        namespace=FEATURED_EVENTS_NAMESPACE,
+    )
 
 
 @router.get("/search", response_model=EventResponse)
@@ -220,7 +249,11 @@ def search_events(params: EventSearchParams = Depends()) -> EventResponse:
         Uses centralized exception handling for consistent error responses.
     """
     logger.info(f"Searching events with query: {params.q}")
-    return _safe_search_events(params)
+    return get_cached_event_response(
+        params,
+        params.language or DEFAULT_LANGUAGE,
+        lambda: _safe_search_events(params),
+    )
 
 
 @router.get("/nearby", response_model=EventResponse)
@@ -274,7 +307,7 @@ def get_event(
             - Venue information (name, address, coordinates)
             - Pricing and booking information
             - Localized content based on language parameter
-            - Updated view count
+            - View count (updated in batches, see app.core.view_counts)
             
     Raises:
         EventNotFoundError: If event with given ID is not found
@@ -295,9 +328,8 @@ def get_event(
     if not event:
         raise EventNotFoundError(event_id)
 
-    # Increment view count
-    event.view_count = (event.view_count or 0) + 1
-    db.commit()
+    # Views are buffered and written in batches by the app's view count flusher
+    record_event_view(event.id)
 
     return event
 
@@ -315,9 +347,8 @@ def get_event_by_slug(slug: str, db: Session = Depends(get_db)) -> schemas.Event
     if not event:
         raise EventNotFoundError(event_id)
 
-    # Increment view count
-    event.view_count = (event.view_count or 0) + 1
-    db.commit()
+    # Views are buffered and written in batches by the app's view count flusher
+    record_event_view(event.id)
 
     return event
 
@@ -329,6 +360,7 @@ def create_event(event: EventCreate, db: Session = Depends(get_db)) -> schemas.E
     db.add(db_event)
     db.commit()
     db.refresh(db_event)
+    invalidate_event_caches(event_change_tags(db_event))
     return db_event
 
 
@@ -341,11 +373,14 @@ def update_event(event_id: int, event: EventUpdate, db: Session = Depends(get_db
 
     # Update only provided fields
     update_data = event.model_dump(exclude_unset=True)
+    # Pages matching the old category/venue may lose the event
+    stale_tags = event_change_tags(db_event, update_data.keys())
     for field, value in update_data.items():
         setattr(db_event, field, value)
 
     db.commit()
     db.refresh(db_event)
+    invalidate_event_caches(stale_tags | event_change_tags(db_event, update_data.keys()))
     return db_event
 
 
@@ -356,8 +391,11 @@ def delete_event(event_id: int, db: Session = Depends(get_db)) -> Dict[str, str]
     if not db_event:
         raise EventNotFoundError(event_id)
 
+    # Removing an event shifts later pages and totals of every listing it was in
+    stale_tags = event_change_tags(db_event)
     db.delete(db_event)
     db.commit()
+    invalidate_event_caches(stale_tags)
     return {"message": "Event deleted successfully"}
 
 
@@ -1,18 +1,21 @@
 from typing import Dict, List, Optional
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.core.error_handlers import (
     VenueNotFoundError,
     ResourceAlreadyExistsError,
     CannotDeleteReferencedEntityError
 )
+from app.core.events_service import AsyncEventsService
+from app.models.event import Event
 from app.models.schemas import Venue as VenueSchema
 from app.models.schemas import (
     EventResponse,
+    EventSearchParams,
     VenueCreate,
     VenueResponse,
     VenueSearchParams,
@@ -24,7 +27,7 @@ router = APIRouter(prefix="/venues", tags=["venues"])
 
 
 @router.get("/", response_model=VenueResponse)
-def get_venues(
+async def get_venues(
     q: Optional[str] = Query(None, description="Search venues by name"),
     city: Optional[str] = Query(None, description="Filter by city"),
     venue_type: Optional[str] = Query(None, description="Filter by venue type"),
@@ -37,7 +40,7 @@ def get_venues(
     radius_km: Optional[float] = Query(None, description="Search radius in kilometers"),
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(20, ge=1, le=100, description="Page size"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> VenueResponse:
     """Get venues with comprehensive filtering and geographic search capabilities.
     
@@ -71,7 +74,7 @@ def get_venues(
         and radius_km. Uses PostgreSQL earth_distance function for accurate
         geographic calculations.
     """
-    query = db.query(Venue)
+    query = select(Venue)
 
     # Apply filters
     if q:
@@ -95,14 +98,15 @@ def get_venues(
         )
 
     # Get total count before pagination
-    total = query.count()
+    total = await db.scalar(select(func.count()).select_from(query.subquery()))
 
     # Calculate pagination
     skip = (page - 1) * size
     pages = (total + size - 1) // size if total > 0 else 0
 
     # Apply pagination and ordering
-    venues = query.order_by(Venue.name.asc()).offset(skip).limit(size).all()
+    result = await db.execute(query.order_by(Venue.name.asc()).offset(skip).limit(size))
+    venues = result.scalars().all()
 
     return VenueResponse(
         venues=venues, total=total, page=page, size=len(venues), pages=pages
@@ -110,9 +114,9 @@ def get_venues(
 
 
 @router.get("/search", response_model=VenueResponse)
-def search_venues(params: VenueSearchParams = Depends(), db: Session = Depends(get_db)) -> VenueResponse:
+async def search_venues(params: VenueSearchParams = Depends(), db: AsyncSession = Depends(get_async_db)) -> VenueResponse:
     """Advanced venue search with all filters."""
-    return get_venues(
+    return await get_venues(
         q=params.q,
         city=params.city,
         venue_type=params.venue_type,
@@ -126,7 +130,7 @@ def search_venues(params: VenueSearchParams = Depends(), db: Session = Depends(g
 
 
 @router.get("/cities")
-def get_cities(db: Session = Depends(get_db)) -> Dict[str, List[str]]:
+async def get_cities(db: AsyncSession = Depends(get_async_db)) -> Dict[str, List[str]]:
     """Get a list of all cities that have registered venues.
     
     Utility endpoint for populating city filter dropdowns in the user interface.
@@ -144,12 +148,12 @@ def get_cities(db: Session = Depends(get_db)) -> Dict[str, List[str]]:
         This endpoint performs a DISTINCT query on venue cities, so only
         cities with at least one venue will appear in the results.
     """
-    cities = db.query(Venue.city).distinct().order_by(Venue.city.asc()).all()
-    return {"cities": [city[0] for city in cities]}
+    cities = await db.scalars(select(Venue.city).distinct().order_by(Venue.city.asc()))
+    return {"cities": list(cities)}
 
 
 @router.get("/types")
-def get_venue_types(db: Session = Depends(get_db)) -> Dict[str, List[str]]:
+async def get_venue_types(db: AsyncSession = Depends(get_async_db)) -> Dict[str, List[str]]:
     """Get a list of all venue types available in the system.
     
     Utility endpoint for populating venue type filter dropdowns in the user
@@ -168,27 +172,26 @@ def get_venue_types(db: Session = Depends(get_db)) -> Dict[str, List[str]]:
         This endpoint filters out venues with null venue_type values and
         returns only distinct types that are currently in use.
     """
-    types = (
-        db.query(Venue.venue_type)
-        .filter(Venue.venue_type.isnot(None))
+    types = await db.scalars(
+        select(Venue.venue_type)
+        .where(Venue.venue_type.isnot(None))
         .distinct()
         .order_by(Venue.venue_type.asc())
-        .all()
     )
-    return {"types": [type_[0] for type_ in types]}
+    return {"types": list(types)}
 
 
 @router.get("/nearby", response_model=VenueResponse)
-def get_nearby_venues(
+async def get_nearby_venues(
     latitude: float = Query(..., description="Latitude"),
     longitude: float = Query(..., description="Longitude"),
     radius_km: float = Query(10, description="Search radius in kilometers"),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> VenueResponse:
     """Get venues near a specific location."""
-    return get_venues(
+    return await get_venues(
         latitude=latitude,
         longitude=longitude,
         radius_km=radius_km,
@@ -199,7 +202,7 @@ def get_nearby_venues(
 
 
 @router.get("/{venue_id}", response_model=VenueSchema)
-def get_venue(venue_id: int, db: Session = Depends(get_db)) -> VenueSchema:
+async def get_venue(venue_id: int, db: AsyncSession = Depends(get_async_db)) -> VenueSchema:
     """Get a specific venue by ID.
     
     Args:
@@ -212,14 +215,14 @@ def get_venue(venue_id: int, db: Session = Depends(get_db)) -> VenueSchema:
     Raises:
         VenueNotFoundError: If venue with given ID is not found
     """
-    venue = db.query(Venue).filter(Venue.id == venue_id).first()
+    venue = await db.get(Venue, venue_id)
     if not venue:
         raise VenueNotFoundError(venue_id)
     return venue
 
 
 @router.post("/", response_model=VenueSchema)
-def create_venue(venue: VenueCreate, db: Session = Depends(get_db)) -> VenueSchema:
+async def create_venue(venue: VenueCreate, db: AsyncSession = Depends(get_async_db)) -> VenueSchema:
     """Create a new venue in the system.
     
     Administrative endpoint for adding new venues. Each venue must have a unique
@@ -242,23 +245,21 @@ def create_venue(venue: VenueCreate, db: Session = Depends(get_db)) -> VenueSche
         ResourceAlreadyExistsError: If a venue with the same name already exists in the same city
     """
     # Check if venue with same name and city already exists
-    existing = (
-        db.query(Venue)
-        .filter(Venue.name == venue.name, Venue.city == venue.city)
-        .first()
+    existing = await db.scalar(
+        select(Venue).where(Venue.name == venue.name, Venue.city == venue.city)
     )
     if existing:
         raise ResourceAlreadyExistsError("Venue", "name", f"{venue.name} in {venue.city}")
 
     db_venue = Venue(**venue.model_dump())
     db.add(db_venue)
-    db.commit()
-    db.refresh(db_venue)
+    await db.commit()
+    await db.refresh(db_venue)
     return db_venue
 
 
 @router.put("/{venue_id}", response_model=VenueSchema)
-def update_venue(venue_id: int, venue: VenueUpdate, db: Session = Depends(get_db)) -> VenueSchema:
+async def update_venue(venue_id: int, venue: VenueUpdate, db: AsyncSession = Depends(get_async_db)) -> VenueSchema:
     """Update an existing venue.
     
     Args:
@@ -273,7 +274,7 @@ def update_venue(venue_id: int, venue: VenueUpdate, db: Session = Depends(get_db
         VenueNotFoundError: If venue with given ID is not found
         ResourceAlreadyExistsError: If venue name conflicts with existing venue in same city
     """
-    db_venue = db.query(Venue).filter(Venue.id == venue_id).first()
+    db_venue = await db.get(Venue, venue_id)
     if not db_venue:
         raise VenueNotFoundError(venue_id)
 
@@ -283,12 +284,10 @@ def update_venue(venue_id: int, venue: VenueUpdate, db: Session = Depends(get_db
         new_name = update_data.get("name", db_venue.name)
         new_city = update_data.get("city", db_venue.city)
 
-        existing = (
-            db.query(Venue)
-            .filter(
+        existing = await db.scalar(
+            select(Venue).where(
                 Venue.name == new_name, Venue.city == new_city, Venue.id != venue_id
             )
-            .first()
         )
         if existing:
             raise ResourceAlreadyExistsError("Venue", "name", f"{new_name} in {new_city}")
@@ -297,13 +296,13 @@ def update_venue(venue_id: int, venue: VenueUpdate, db: Session = Depends(get_db
     for field, value in update_data.items():
         setattr(db_venue, field, value)
 
-    db.commit()
-    db.refresh(db_venue)
+    await db.commit()
+    await db.refresh(db_venue)
     return db_venue
 
 
 @router.delete("/{venue_id}")
-def delete_venue(venue_id: int, db: Session = Depends(get_db)) -> Dict[str, str]:
+async def delete_venue(venue_id: int, db: AsyncSession = Depends(get_async_db)) -> Dict[str, str]:
     """Delete a venue from the system.
     
     Administrative endpoint for removing venues. Before deletion, the system
@@ -322,28 +321,28 @@ def delete_venue(venue_id: int, db: Session = Depends(get_db)) -> Dict[str, str]
         VenueNotFoundError: If venue with given ID is not found
         CannotDeleteReferencedEntityError: If venue has associated events and cannot be deleted
     """
-    db_venue = db.query(Venue).filter(Venue.id == venue_id).first()
+    db_venue = await db.get(Venue, venue_id)
     if not db_venue:
         raise VenueNotFoundError(venue_id)
 
     # Check if venue has events
-    from app.models.event import Event
-
-    events_count = db.query(Event).filter(Event.venue_id == venue_id).count()
+    events_count = await db.scalar(
+        select(func.count(Event.id)).where(Event.venue_id == venue_id)
+    )
     if events_count > 0:
         raise CannotDeleteReferencedEntityError("venue", venue_id, events_count, "events")
 
-    db.delete(db_venue)
-    db.commit()
+    await db.delete(db_venue)
+    await db.commit()
     return {"message": "Venue deleted successfully"}
 
 
 @router.get("/{venue_id}/events")
-def get_venue_events(
+async def get_venue_events(
     venue_id: int,
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> EventResponse:
     """Get all events scheduled at a specific venue.
     
@@ -367,12 +366,10 @@ def get_venue_events(
     Raises:
         VenueNotFoundError: If venue with given ID is not found
     """
-    # Import here to avoid circular imports
-    from app.routes.events import get_events
-
     # Verify venue exists
-    venue = db.query(Venue).filter(Venue.id == venue_id).first()
+    venue = await db.get(Venue, venue_id)
     if not venue:
         raise VenueNotFoundError(venue_id)
 
-    return get_events(venue_id=venue_id, page=page, size=size, db=db)
+    search_params = EventSearchParams(venue_id=venue_id, page=page, size=size)
+    return await AsyncEventsService(db).search_events(search_params)
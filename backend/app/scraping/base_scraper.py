@@ -5,15 +5,22 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import time
 from abc import ABC, abstractmethod
 from datetime import date
 from typing import Any, Dict, List, Optional
 from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from app.models.schemas import EventCreate
+from app.scraping.html_parser import parse_html
+from app.scraping.http_cache import get_http_cache
+from app.scraping.http_client import get_http_client, http_get
+from app.scraping.incremental import drop_known_listings
+from app.scraping.rate_limit import AdaptivePacer, parse_retry_after
+from app.scraping.structured_data import listing_events, needs_detail
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -71,6 +78,11 @@ CROATIAN_MONTHS = {
 class BaseScraper(ABC):
     """Abstract base class for Croatian event scrapers with common functionality."""
 
+    # Parse only the matching subtrees of listing pages. Must keep both the
+    # event containers and the pagination links (and JSON-LD scripts to keep
+    # the structured-data fast path).
+    listing_parse_only: Optional[SoupStrainer] = None
+
     def __init__(
         self,
         base_url: str,
@@ -99,28 +111,25 @@ class BaseScraper(ABC):
         
         # HTTP client will be initialized in setup_client()
         self.client: Optional[httpx.AsyncClient] = None
+
+        # Bound concurrent detail page fetches and pace requests to the site
+        self.detail_semaphore = asyncio.Semaphore(max(1, _scraping_config.detail_concurrency))
+        self.pacer = AdaptivePacer(
+            min_delay=_scraping_config.pacing_min_delay,
+            max_delay=_scraping_config.pacing_max_delay,
+            target_latency=_scraping_config.pacing_target_latency,
+        )
         
         logger.info(f"Initialized {self.__class__.__name__} for {source_name}")
 
     async def setup_client(self) -> None:
-        """Setup HTTP client with appropriate configuration."""
+        """Attach the shared pooled HTTP client matching the proxy settings."""
         if self.client:
             return
-            
-        if self.use_proxy and not self.use_scraping_browser:
-            self.client = httpx.AsyncClient(
-                headers=self.headers,
-                proxies={"http": PROXY, "https": PROXY},
-                verify=False,
-                timeout=30.0,
-            )
-            logger.info("HTTP client configured with proxy")
-        else:
-            self.client = httpx.AsyncClient(
-                headers=self.headers,
-                timeout=30.0,
-            )
-            logger.info("HTTP client configured without proxy")
+
+        proxied = self.use_proxy and not self.use_scraping_browser
+        self.client = get_http_client(proxy=proxied, verify=not proxied)
+        logger.info(f"HTTP client configured {'with' if proxied else 'without'} proxy")
 
     async def fetch_with_retry(
         self, 
@@ -140,21 +149,29 @@ class BaseScraper(ABC):
             
         Raises:
             RuntimeError: If all retry attempts fail
+
+        Note:
+            Each attempt first waits for ``self.pacer``, which is adjusted
+            from the response time and status of every response.
         """
         await self.setup_client()
         
         for attempt in range(max_retries + 1):
             try:
-                if self.use_scraping_browser and self.use_proxy:
-                    params = {"url": url}
-                    response = await self.client.get(
-                        SCRAPING_BROWSER_EP,
-                        params=params,
-                        auth=(BRIGHTDATA_USER, BRIGHTDATA_PASSWORD),
-                    )
-                else:
-                    response = await self.client.get(url)
-                    
+                await self.pacer.wait()
+                started = time.monotonic()
+                response = await http_get(
+                    url,
+                    headers=self.headers,
+                    use_proxy=self.use_proxy,
+                    use_scraping_browser=self.use_scraping_browser,
+                )
+                self.pacer.record(
+                    response.status_code,
+                    time.monotonic() - started,
+                    parse_retry_after(response.headers.get("retry-after")),
+                )
+
                 response.raise_for_status()
                 logger.debug(f"Successfully fetched {url} on attempt {attempt + 1}")
                 return response
@@ -164,7 +181,7 @@ class BaseScraper(ABC):
                     logger.error(f"Failed to fetch {url} after {max_retries + 1} attempts: {e}")
                     raise RuntimeError(f"Request failed for {url} after {max_retries + 1} attempts: {e}")
                 
-                delay = backoff_factor * (2 ** attempt)
+                delay = max(backoff_factor * (2 ** attempt), self.pacer.delay)
                 logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}. Retrying in {delay}s...")
                 await asyncio.sleep(delay)
 
@@ -285,11 +302,10 @@ class BaseScraper(ABC):
         return urljoin(self.base_url, url)
 
     async def close(self) -> None:
-        """Close HTTP client and cleanup resources."""
+        """Release the HTTP client (the shared pool stays open for other scrapers)."""
         if self.client:
-            await self.client.aclose()
             self.client = None
-            logger.debug(f"Closed HTTP client for {self.__class__.__name__}")
+            logger.debug(f"Released HTTP client for {self.__class__.__name__}")
 
     @abstractmethod
     async def parse_event_detail(self, url: str) -> Dict[str, Any]:
@@ -327,63 +343,106 @@ class BaseScraper(ABC):
         """
         pass
 
-    async def scrape_events_page(self, url: str) -> tuple[List[Dict[str, Any]], Optional[str]]:
-        """Scrape events from a single page.
+    async def parse_listing_page(self, url: str) -> tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetch a listing page and parse its event elements.
         
         Args:
-            url: Page URL to scrape
+            url: Listing page URL
             
         Returns:
-            Tuple of (events list, next page URL)
+            Tuple of (listing data list, next page URL)
         """
-        logger.info(f"Scraping events page: {url}")
-        
-        try:
-            response = await self.fetch_with_retry(url)
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            events = []
-            containers = self._find_event_containers(soup)
-            
-            logger.info(f"Found {len(containers)} event containers")
-            
-            # Parse listing elements and gather detail URLs
+        response = await self.fetch_with_retry(url)
+
+        # An unchanged listing page yields the same listing data as last run
+        cache = get_http_cache()
+        cached_listing = cache.load_parsed(response) if cache else None
+        if cached_listing is not None:
+            logger.info(f"Listing page unchanged, reusing parsed listing for {url}")
+            return cached_listing["listing"], cached_listing["next_url"]
+
+        soup = parse_html(response.text, parse_only=self.listing_parse_only)
+        containers = self._find_event_containers(soup)
+
+        logger.info(f"Found {len(containers)} event containers")
+
+        # Structured data covering the whole page replaces the DOM heuristics
+        listing_data = listing_events(soup, self.source_name, url, len(containers))
+        if listing_data is None:
             listing_data = []
-            detail_urls = []
-            
             for container in containers:
                 if isinstance(container, Tag):
                     data = self.parse_listing_element(container)
                     if data:
                         listing_data.append(data)
-                        if data.get("link"):
-                            detail_urls.append(data["link"])
+
+        next_url = self._find_next_page_url(soup, url)
+
+        if cache:
+            cache.store_parsed(response, {"listing": listing_data, "next_url": next_url})
+
+        return listing_data, next_url
+
+    async def _parse_event_detail_bounded(self, url: str) -> Dict[str, Any]:
+        async with self.detail_semaphore:
+            return await self.parse_event_detail(url)
+
+    async def fetch_event_details(self, listing_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fetch detail pages of listed events and merge them into the listing data.
+        
+        At most ``settings.scraping.detail_concurrency`` detail pages are
+        fetched at once per scraper.
+        
+        Listings whose structured data is already complete skip the detail
+        page.
+        
+        Args:
+            listing_data: Events parsed from a listing page
             
-            # Fetch details concurrently if we have URLs
-            if detail_urls:
-                logger.info(f"Fetching details for {len(detail_urls)} events")
-                detail_tasks = [
-                    self.parse_event_detail(url) for url in detail_urls
-                ]
-                details = await asyncio.gather(*detail_tasks, return_exceptions=True)
-                
-                # Merge listing and detail data
-                for listing, detail in zip(listing_data, details):
-                    if isinstance(detail, dict):
-                        # Update listing with detail data, preserving listing values
-                        merged = {**detail, **{k: v for k, v in listing.items() if v}}
-                        events.append(merged)
-                    else:
-                        # Detail fetch failed, use listing data
-                        if isinstance(detail, Exception):
-                            logger.warning(f"Failed to fetch details for {listing.get('link')}: {detail}")
-                        events.append(listing)
+        Returns:
+            Events with detail data merged in (listing values take precedence)
+        """
+        with_links = [
+            listing for listing in listing_data
+            if listing.get("link") and needs_detail(listing, self.source_name)
+        ]
+        if not with_links:
+            return listing_data
+
+        logger.info(f"Fetching details for {len(with_links)} events")
+        details = await asyncio.gather(
+            *(self._parse_event_detail_bounded(listing["link"]) for listing in with_links),
+            return_exceptions=True,
+        )
+        details_by_listing = {id(listing): detail for listing, detail in zip(with_links, details)}
+
+        events = []
+        for listing in listing_data:
+            detail = details_by_listing.get(id(listing))
+            if isinstance(detail, dict):
+                # Update listing with detail data, preserving listing values
+                events.append({**detail, **{k: v for k, v in listing.items() if v}})
             else:
-                events = listing_data
-            
-            # Find next page URL
-            next_url = self._find_next_page_url(soup, url)
+                # No detail page or detail fetch failed, use listing data
+                if isinstance(detail, Exception):
+                    logger.warning(f"Failed to fetch details for {listing.get('link')}: {detail}")
+                events.append(listing)
+        return events
+
+    async def scrape_events_page(self, url: str) -> tuple[List[Dict[str, Any]], Optional[str]]:
+        """Scrape events from a single page.
+        
+        Args:
+            url: Page URL to scrape
             
+        Returns:
+            Tuple of (events list, next page URL)
+        """
+        logger.info(f"Scraping events page: {url}")
+        
+        try:
+            listing_data, next_url = await self.parse_listing_page(url)
+            events = await self.fetch_event_details(await drop_known_listings(listing_data))
             return events, next_url
             
         except Exception as e:
@@ -432,6 +491,10 @@ class BaseScraper(ABC):
     async def scrape_all_events(self, max_pages: int = 10) -> List[EventCreate]:
         """Scrape events from all pages up to max_pages.
         
+        The next listing page is fetched while the details of the current
+        one are being fetched. In incremental mode, known events are skipped
+        and pagination stops at the first page without new events.
+        
         Args:
             max_pages: Maximum number of pages to scrape
             
@@ -443,33 +506,52 @@ class BaseScraper(ABC):
         all_events = []
         current_url = self.events_url
         page = 0
+        listing_task: Optional[asyncio.Task] = None
         
         try:
-            while current_url and page < max_pages:
+            if max_pages > 0:
+                listing_task = asyncio.create_task(self.parse_listing_page(current_url))
+
+            while listing_task:
                 page += 1
                 logger.info(f"Scraping page {page}: {current_url}")
                 
-                raw_events, next_url = await self.scrape_events_page(current_url)
+                try:
+                    listing_data, next_url = await listing_task
+                except Exception as e:
+                    logger.error(f"Failed to scrape events page {current_url}: {e}")
+                    raise
+                listing_task = None
+
+                # In incremental mode, a page of known events ends the run
+                listing_data = await drop_known_listings(listing_data)
+
+                # Prefetch the next listing page while details are fetched
+                if next_url and listing_data and page < max_pages:
+                    listing_task = asyncio.create_task(self.parse_listing_page(next_url))
+
+                raw_events = await self.fetch_event_details(listing_data)
                 
                 # Transform raw events to EventCreate objects
+                valid_events = 0
                 for raw_event in raw_events:
                     event = self.transform_to_event(raw_event)
                     if event:
                         all_events.append(event)
+                        valid_events += 1
                 
-                logger.info(f"Page {page}: Found {len(raw_events)} raw events, {len([e for e in raw_events if self.transform_to_event(e)])} valid events")
+                logger.info(f"Page {page}: Found {len(raw_events)} raw events, {valid_events} valid events")
                 
-                if not next_url or not raw_events:
+                if not listing_task:
                     logger.info("No more pages or events found, stopping")
                     break
                     
                 current_url = next_url
                 
-                # Be nice to the server
-                await asyncio.sleep(1)
-                
         finally:
+            if listing_task and not listing_task.done():
+                listing_task.cancel()
             await self.close()
         
         logger.info(f"Scraping completed for {self.source_name}: {len(all_events)} total events")
-        return all_events
\ No newline at end of file
+        return all_events
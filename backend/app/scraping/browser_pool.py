@@ -0,0 +1,300 @@
+"""
+Shared Playwright browser pool for scrapers.
+
+Every Playwright scraper used to start its own ``async_playwright()`` and
+Chromium, so short runs were dominated by browser cold starts, and sources
+scraped concurrently ran several browsers at once. ``BrowserPool`` starts
+Playwright once per event loop and keeps one Chromium per proxy setting.
+Scrapers lease isolated browser contexts from it, at most
+``scraping.browser_max_contexts`` at a time. A browser that has served
+``scraping.browser_recycle_after`` navigations is retired: new leases get a
+fresh browser, and the old one closes when its last context is released.
+
+Remote scraping browsers (BrightData over CDP) are billed per session and
+cannot be shared. Leases for a CDP endpoint therefore get their own
+connection, which still counts towards the context limit.
+
+Contexts route their requests through a ``ResourceBlocker``, which aborts
+images, media and fonts (``scraping.browser_blocked_resource_types``) and
+tracker domains (``scraping.browser_blocked_domains``). Scrapers can pass
+``allowed_domains`` to also drop every other third-party request. Scrapers
+read the DOM only, so this saves page load time and proxy bandwidth.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+from app.config.components import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Chromium flags for containers and basic automation hiding
+BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--no-first-run",
+    "--no-default-browser-check",
+]
+
+
+def _matches_domain(host: str, domains: Iterable[str]) -> bool:
+    return any(host == domain or host.endswith("." + domain) for domain in domains)
+
+
+class ResourceBlocker:
+    """Playwright route handler aborting requests scrapers do not need."""
+
+    def __init__(
+        self,
+        blocked_types: Iterable[str] = (),
+        blocked_domains: Iterable[str] = (),
+        allowed_domains: Optional[Iterable[str]] = None,
+    ):
+        """
+        Args:
+            blocked_types: Playwright resource types to abort (``image``, ``font``, ...)
+            blocked_domains: Domains whose requests, subdomains included, are aborted
+            allowed_domains: If given, requests to any other domain are aborted
+        """
+        self.blocked_types = frozenset(blocked_types)
+        self.blocked_domains = tuple(domain.lower() for domain in blocked_domains)
+        self.allowed_domains = (
+            tuple(domain.lower() for domain in allowed_domains) if allowed_domains is not None else None
+        )
+        self.blocked = 0
+
+    @classmethod
+    def from_settings(cls, allowed_domains: Optional[Iterable[str]] = None) -> "ResourceBlocker":
+        scraping = get_settings().scraping
+        return cls(
+            scraping.browser_blocked_resource_types,
+            scraping.browser_blocked_domains,
+            allowed_domains,
+        )
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """Whether a request for ``url`` of the given resource type is aborted."""
+        if resource_type in self.blocked_types:
+            return True
+        host = (urlsplit(url).hostname or "").lower()
+        if not host:
+            return False
+        if _matches_domain(host, self.blocked_domains):
+            return True
+        return self.allowed_domains is not None and not _matches_domain(host, self.allowed_domains)
+
+    async def handle(self, route: Any) -> None:
+        request = route.request
+        if self.should_block(request.url, request.resource_type):
+            self.blocked += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+
+class _PooledBrowser:
+    """A launched browser with its lease and navigation counters."""
+
+    def __init__(self, browser: Any):
+        self.browser = browser
+        self.leases = 0
+        self.navigations = 0
+        self.retired = False
+
+
+class BrowserPool:
+    """Chromium instances shared by all scrapers on one event loop."""
+
+    def __init__(self, max_contexts: int = 3, recycle_after: int = 200):
+        self.max_contexts = max(1, max_contexts)
+        self.recycle_after = recycle_after
+        self._slots = asyncio.Semaphore(self.max_contexts)
+        self._lock = asyncio.Lock()
+        self._playwright = None
+        self._browsers: Dict[Optional[str], _PooledBrowser] = {}
+
+    async def _start_playwright(self):
+        if self._playwright is None:
+            # Raises ImportError without Playwright; scrapers fall back on it
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+        return self._playwright
+
+    async def _checkout_browser(self, proxy: Optional[str]) -> _PooledBrowser:
+        async with self._lock:
+            pooled = self._browsers.get(proxy)
+            if pooled and pooled.browser.is_connected() and pooled.navigations < self.recycle_after:
+                pooled.leases += 1
+                return pooled
+
+            if pooled:
+                logger.info(f"Recycling browser after {pooled.navigations} navigations")
+                await self._retire(pooled)
+
+            playwright = await self._start_playwright()
+            browser = await playwright.chromium.launch(
+                headless=True,
+                args=BROWSER_ARGS,
+                proxy={"server": proxy} if proxy else None,
+            )
+            logger.info(f"Browser launched (proxy={'yes' if proxy else 'no'})")
+            pooled = self._browsers[proxy] = _PooledBrowser(browser)
+            pooled.leases += 1
+            return pooled
+
+    async def _retire(self, pooled: _PooledBrowser) -> None:
+        pooled.retired = True
+        if pooled.leases == 0:
+            await self._close_browser(pooled.browser)
+
+    async def _release_browser(self, pooled: _PooledBrowser) -> None:
+        async with self._lock:
+            pooled.leases -= 1
+            if pooled.retired and pooled.leases == 0:
+                await self._close_browser(pooled.browser)
+
+    @staticmethod
+    async def _close_browser(browser: Any) -> None:
+        try:
+            await browser.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser: {e}")
+
+    @staticmethod
+    async def _install_blocker(context: Any, allowed_domains: Optional[Iterable[str]]) -> ResourceBlocker:
+        blocker = ResourceBlocker.from_settings(allowed_domains)
+        await context.route("**/*", blocker.handle)
+        return blocker
+
+    @staticmethod
+    async def _close_context(context: Any, blocker: Optional[ResourceBlocker]) -> None:
+        if blocker and blocker.blocked:
+            logger.debug(f"Blocked {blocker.blocked} requests in browser context")
+        await context.close()
+
+    @asynccontextmanager
+    async def context(
+        self,
+        proxy: Optional[str] = None,
+        cdp_endpoint: Optional[str] = None,
+        block_resources: Optional[bool] = None,
+        allowed_domains: Optional[Iterable[str]] = None,
+        **context_options: Any,
+    ) -> AsyncIterator[Any]:
+        """Lease an isolated browser context.
+
+        Args:
+            proxy: Proxy server URL for the browser
+            cdp_endpoint: Connect to this remote browser instead of launching one
+            block_resources: Abort unneeded requests (see ``ResourceBlocker``),
+                defaults to ``scraping.browser_block_resources``
+            allowed_domains: Abort requests to any domain not in this list
+            **context_options: Passed to ``Browser.new_context``
+
+        Yields:
+            BrowserContext: Context closed when the block exits
+        """
+        if block_resources is None:
+            block_resources = get_settings().scraping.browser_block_resources
+
+        async with self._slots:
+            if cdp_endpoint:
+                playwright = await self._start_playwright()
+                browser = await playwright.chromium.connect_over_cdp(cdp_endpoint)
+                try:
+                    context = await browser.new_context(**context_options)
+                    blocker = None
+                    try:
+                        if block_resources:
+                            blocker = await self._install_blocker(context, allowed_domains)
+                        yield context
+                    finally:
+                        await self._close_context(context, blocker)
+                finally:
+                    await self._close_browser(browser)
+                return
+
+            pooled = await self._checkout_browser(proxy)
+            try:
+                context = await pooled.browser.new_context(**context_options)
+                blocker = None
+
+                def count_navigation(request: Any) -> None:
+                    if request.is_navigation_request():
+                        pooled.navigations += 1
+
+                context.on("request", count_navigation)
+                try:
+                    if block_resources:
+                        blocker = await self._install_blocker(context, allowed_domains)
+                    yield context
+                finally:
+                    await self._close_context(context, blocker)
+            finally:
+                await self._release_browser(pooled)
+
+    @asynccontextmanager
+    async def page(
+        self,
+        proxy: Optional[str] = None,
+        cdp_endpoint: Optional[str] = None,
+        block_resources: Optional[bool] = None,
+        allowed_domains: Optional[Iterable[str]] = None,
+        **context_options: Any,
+    ) -> AsyncIterator[Any]:
+        """Lease a page in its own browser context (see ``context``)."""
+        async with self.context(
+            proxy, cdp_endpoint, block_resources, allowed_domains, **context_options
+        ) as context:
+            yield await context.new_page()
+
+    async def close(self) -> None:
+        """Close all browsers and stop Playwright."""
+        async with self._lock:
+            browsers, self._browsers = list(self._browsers.values()), {}
+            for pooled in browsers:
+                await self._close_browser(pooled.browser)
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+
+# Playwright objects are bound to the event loop they were created on
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BrowserPool]" = weakref.WeakKeyDictionary()
+_pools_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Get the browser pool of the running event loop.
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    with _pools_lock:
+        pool = _pools.get(loop)
+        if pool is None:
+            scraping = get_settings().scraping
+            pool = _pools[loop] = BrowserPool(
+                max_contexts=scraping.browser_max_contexts,
+                recycle_after=scraping.browser_recycle_after,
+            )
+    return pool
+
+
+async def close_browser_pool() -> None:
+    """Close the browser pool of the running event loop, if one was started."""
+    with _pools_lock:
+        pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
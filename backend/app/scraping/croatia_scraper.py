@@ -5,15 +5,15 @@ This scraper handles the Vue.js-based dynamic content and extracts event informa
 
 import logging
 import re
-from datetime import date, datetime
+from datetime import date
 from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
 from app.config.components import get_settings
-from app.core.database import SessionLocal
+from app.core.event_ingestion import ingest_events
 from app.core.geocoding_service import geocoding_service
-from app.models.event import Event
 from app.models.schemas import EventCreate
+from app.scraping.browser_pool import get_browser_pool
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -705,26 +705,22 @@ class CroatiaPlaywrightScraper:
         self, start_url: str = EVENTS_URL, max_pages: int = 5, fetch_details: bool = False
     ) -> List[Dict]:
         """Scrape events using Playwright to handle Vue.js content."""
-        from playwright.async_api import async_playwright
-
         all_events = []
         page_count = 0
 
-        async with async_playwright() as p:
-            if USE_PROXY and SCRAPING_CONFIG.is_websocket_endpoint:
-                # Use WebSocket connection for Bright Data scraping browser
-                logger.info(f"Connecting to Bright Data scraping browser: {BRD_WSS}")
-                browser = await p.chromium.connect_over_cdp(BRD_WSS)
-            elif USE_PROXY:
-                # Use regular Chromium with proxy
-                logger.info(f"Launching Chromium with proxy: {PROXY}")
-                browser = await p.chromium.launch(proxy={"server": PROXY})
-            else:
-                # Local browser without proxy
-                logger.info("Launching local Chromium browser")
-                browser = await p.chromium.launch()
+        if USE_PROXY and SCRAPING_CONFIG.is_websocket_endpoint:
+            # Use WebSocket connection for Bright Data scraping browser
+            logger.info(f"Connecting to Bright Data scraping browser: {BRD_WSS}")
+            browser_options = {"cdp_endpoint": BRD_WSS}
+        elif USE_PROXY:
+            # Use the pooled Chromium with proxy
+            logger.info(f"Using pooled Chromium with proxy: {PROXY}")
+            browser_options = {"proxy": PROXY}
+        else:
+            # Local browser without proxy
+            browser_options = {}
 
-            page = await browser.new_page()
+        async with get_browser_pool().page(**browser_options) as page:
 
             try:
                 logger.info(f"→ Fetching Croatia.hr events from {start_url}")
@@ -1063,9 +1059,6 @@ class CroatiaPlaywrightScraper:
             except Exception as e:
                 logger.error(f"Error during scraping: {e}")
 
-            finally:
-                await browser.close()
-
         return all_events
 
 
@@ -1115,49 +1108,20 @@ class CroatiaScraper:
             logger.warning(f"Geocoding failed, continuing without coordinates: {e}")
             geocoding_results = {}
 
-        db = SessionLocal()
-        saved_count = 0
-
-        try:
-            for event_data in events:
-                # Check if event already exists (by name and date)
-                existing = (
-                    db.query(Event)
-                    .filter(
-                        Event.title == event_data.title, Event.date == event_data.date
-                    )
-                    .first()
+        # Add geocoding coordinates where available
+        geocoded_events = []
+        for event_data in events:
+            result = geocoding_results.get(event_data.location)
+            if result:
+                event_data = event_data.model_copy(
+                    update={"latitude": result.latitude, "longitude": result.longitude}
                 )
+                logger.debug(f"Added coordinates for {event_data.location}: {result.latitude}, {result.longitude}")
+            geocoded_events.append(event_data)
 
-                if not existing:
-                    # Create event with explicit timestamps and geocoding
-                    current_time = datetime.now()
-                    event_dict = event_data.model_dump()
-                    event_dict['created_at'] = current_time
-                    event_dict['updated_at'] = current_time
-                    
-                    # Add geocoding coordinates if available
-                    if event_data.location in geocoding_results:
-                        result = geocoding_results[event_data.location]
-                        event_dict['latitude'] = result.latitude
-                        event_dict['longitude'] = result.longitude
-                        logger.debug(f"Added coordinates for {event_data.location}: {result.latitude}, {result.longitude}")
-                    
-                    db_event = Event(**event_dict)
-                    db.add(db_event)
-                    saved_count += 1
-                else:
-                    logger.info(f"Event already exists: {event_data.title}")
-
-            db.commit()
-            logger.info(f"Saved {saved_count} new events to database from Croatia.hr")
-
-        except Exception as e:
-            logger.error(f"Error saving Croatia.hr events to database: {e}")
-            db.rollback()
-            raise
-        finally:
-            db.close()
+        stats = ingest_events(geocoded_events)
+        saved_count = stats["inserted"] + stats["updated"]
+        logger.info(f"Saved {saved_count} events to database from Croatia.hr ({stats['inserted']} new)")
 
         return saved_count
 
@@ -2,15 +2,18 @@
 Enhanced scraping pipeline with comprehensive data quality validation and duplicate detection.
 """
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 
 logger = logging.getLogger(__name__)
 
+from backend.app.core.config import settings
 from backend.app.core.data_quality import DataQualityService
 from backend.app.core.database import SessionLocal
+from backend.app.core.events_cache import invalidate_event_list_caches
 from backend.app.models.schemas import EventCreate
 from app.scraping.croatia_scraper import CroatiaScraper
 from app.scraping.entrio_scraper import EntrioScraper
@@ -24,17 +27,40 @@ from app.scraping.tzdubrovnik_scraper import DubrovnikScraper
 from app.scraping.visitvarazdin_scraper import VisitVarazdinScraper
 from app.scraping.visitkarlovac_scraper import VisitKarlovacScraper
 from app.scraping.visitopatija_scraper import VisitOpatijaScraper
+from app.scraping.browser_pool import close_browser_pool
+from app.scraping.http_client import close_http_clients
+from app.scraping.incremental import incremental_scraping
+from app.scraping.structured_data import get_structured_data_stats
 
+# Scrapers accepting use_playwright / fetch_details
+ENHANCED_SOURCES = {
+    "ulaznice.hr", "visitrijeka.hr", "visitsplit.com", "visitopatija.com",
+    "visitvarazdin.hr", "turizamvukovar.hr", "zadar.travel", "infozagreb.hr",
+}
 
 
 class EnhancedScrapingPipeline:
     """Advanced scraping pipeline with quality validation and duplicate detection."""
 
     def __init__(
-        self, quality_threshold: float = 60.0, enable_duplicate_detection: bool = True
+        self,
+        quality_threshold: float = 60.0,
+        enable_duplicate_detection: bool = True,
+        max_concurrent_sources: Optional[int] = None,
+        source_timeout: Optional[float] = None,
     ):
         self.quality_threshold = quality_threshold
         self.enable_duplicate_detection = enable_duplicate_detection
+        self.max_concurrent_sources = (
+            max_concurrent_sources
+            if max_concurrent_sources is not None
+            else settings.scraping.max_concurrent_sources
+        )
+        self.source_timeout = (
+            source_timeout if source_timeout is not None else settings.scraping.source_timeout
+        )
+        self.stream_batch_size = max(1, settings.scraping.stream_batch_size)
+        self.stream_queue_size = settings.scraping.stream_queue_size
         self.entrio_scraper = EntrioScraper()
         self.croatia_scraper = CroatiaScraper()
         self.infozagreb_scraper = InfoZagrebScraper()
@@ -48,10 +74,14 @@ class EnhancedScrapingPipeline:
         self.visitkarlovac_scraper = VisitKarlovacScraper()
         self.visitopatija_scraper = VisitOpatijaScraper()
 
-    async def scrape_all_sources(self, max_pages_per_source: int = 5, use_playwright: bool = True, fetch_details: bool = False) -> Dict[str, Any]:
-        """Scrape events from all sources with enhanced quality processing and address extraction."""
+    async def scrape_all_sources(self, max_pages_per_source: int = 5, use_playwright: bool = True, fetch_details: bool = False, incremental: bool = False) -> Dict[str, Any]:
+        """Scrape events from all sources with enhanced quality processing and address extraction.
+
+        With ``incremental``, scrapers skip events stored by a recent run and
+        stop paginating once a page holds no new events (see incremental.py).
+        """
         logger.info("=== Starting Enhanced Scraping Pipeline ===")
-        logger.info(f"Configuration: Playwright={use_playwright}, Detail fetching={fetch_details}")
+        logger.info(f"Configuration: Playwright={use_playwright}, Detail fetching={fetch_details}, Incremental={incremental}")
         start_time = datetime.now()
 
         pipeline_results = {
@@ -63,7 +93,8 @@ class EnhancedScrapingPipeline:
             "total_processing_time": 0,
             "enhanced_features": {
                 "playwright_enabled": use_playwright,
-                "detail_fetching_enabled": fetch_details
+                "detail_fetching_enabled": fetch_details,
+                "incremental": incremental,
             }
         }
 
@@ -82,23 +113,117 @@ class EnhancedScrapingPipeline:
             ("visitkarlovac.hr", self.visitkarlovac_scraper, max_pages_per_source),
             ("visitopatija.com", self.visitopatija_scraper, max_pages_per_source),
         ]
-        all_scraped_events = []
+        # Sources are independent sites, so they run concurrently under a global
+        # cap. Scraped events stream through a bounded queue into quality
+        # processing, which validates, de-duplicates and saves them in batches
+        # while the remaining sources are still being scraped.
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrent_sources))
+        event_queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, self.stream_queue_size))
+        consumer = asyncio.create_task(self._consume_event_stream(event_queue))
+
+        with incremental_scraping(incremental):
+            source_results = await asyncio.gather(
+                *(
+                    self._scrape_source(
+                        semaphore, event_queue, source_name, scraper, max_pages,
+                        use_playwright, fetch_details
+                    )
+                    for source_name, scraper, max_pages in sources_config
+                )
+            )
+        await event_queue.put(None)
+
+        # Results are reported in configuration order
+        for (source_name, _, _), source_result in zip(sources_config, source_results):
+            pipeline_results["sources"][source_name] = source_result
+
+        total_scraped = sum(source["events_scraped"] for source in source_results)
+        logger.info("\n--- Combined Scraping Results ---")
+        logger.info(f"Total events scraped: {total_scraped}")
+        enhanced_count = sum(1 for source_data in pipeline_results["sources"].values() 
+                           if source_data.get("enhanced_features_used", False))
+        logger.info(f"Enhanced scrapers used: {enhanced_count}/12 (8 enhanced scrapers available: ulaznice.hr, visitrijeka.hr, visitsplit.com, visitopatija.com, visitvarazdin.hr, turizamvukovar.hr, zadar.travel, infozagreb.hr)")
+
+        # Wait for the last quality batches to be written
+        combined_results = await consumer
+        if combined_results:
+            pipeline_results["combined_results"] = combined_results
+            pipeline_results["saved_events"] = combined_results["saved_events"]
+        else:
+            pipeline_results["combined_results"] = {
+                "processing_summary": {
+                    "original_count": 0,
+                    "final_processable_count": 0,
+                }
+            }
+
+        # Calculate total processing time
+        end_time = datetime.now()
+        pipeline_results["total_processing_time"] = (
+            end_time - start_time
+        ).total_seconds()
+        pipeline_results["pipeline_end"] = end_time
+
+        logger.info("\n=== Pipeline Complete ===")
+        logger.info(
+            f"Total processing time: {pipeline_results['total_processing_time']:.2f}s"
+        )
+        logger.info(f"Events saved: {pipeline_results['saved_events']}")
+
+        return pipeline_results
+
+    async def _scrape_source(
+        self,
+        semaphore: asyncio.Semaphore,
+        event_queue: asyncio.Queue,
+        source_name: str,
+        scraper: Any,
+        max_pages: int,
+        use_playwright: bool,
+        fetch_details: bool,
+    ) -> Dict[str, Any]:
+        """Scrape one source of ``scrape_all_sources`` once a slot is free.
+
+        The scraped events are put on ``event_queue`` in batches after the
+        concurrency slot is released, so a slow consumer holds back queueing
+        but not the other sources.
+
+        Returns:
+            The ``pipeline_results["sources"]`` entry of the source. Errors and
+            timeouts are reported in the entry instead of being raised, so one
+            failing site does not cancel the others.
+        """
+        source_result = await self._run_source_scraper(
+            semaphore, source_name, scraper, max_pages, use_playwright, fetch_details
+        )
+        events = source_result.pop("events")
 
-        for source_name, scraper, max_pages in sources_config:
+        for i in range(0, len(events), self.stream_batch_size):
+            await event_queue.put(events[i:i + self.stream_batch_size])
+
+        return source_result
+
+    async def _run_source_scraper(
+        self,
+        semaphore: asyncio.Semaphore,
+        source_name: str,
+        scraper: Any,
+        max_pages: int,
+        use_playwright: bool,
+        fetch_details: bool,
+    ) -> Dict[str, Any]:
+        """Run the scraper of one source under the concurrency cap and timeout."""
+        async with semaphore:
             logger.info(f"\n--- Scraping {source_name} ---")
             source_start = datetime.now()
+            enhanced = source_name in ENHANCED_SOURCES
 
             try:
                 # Check if scraper supports enhanced features
-                scraper_method = getattr(scraper, 'scrape_events', None)
-                if scraper_method:
-                    import inspect
-                    sig = inspect.signature(scraper_method)
-                    
-                    # Enhanced scrapers (Ulaznice, VisitRijeka, VisitSplit, VisitOpatija, VisitVarazdin, Vukovar, Zadar, InfoZagreb) support additional parameters
-                    if source_name in ["ulaznice.hr", "visitrijeka.hr", "visitsplit.com", "visitopatija.com", "visitvarazdin.hr", "turizamvukovar.hr", "zadar.travel", "infozagreb.hr"]:
+                if getattr(scraper, 'scrape_events', None):
+                    if enhanced:
                         # Use enhanced parameters for enhanced scrapers
-                        events = await scraper.scrape_events(
+                        scrape = scraper.scrape_events(
                             max_pages=max_pages,
                             use_playwright=use_playwright,
                             fetch_details=fetch_details
@@ -106,120 +231,154 @@ class EnhancedScrapingPipeline:
                         logger.info(f"Using enhanced scraping for {source_name}")
                     else:
                         # Use standard parameters for other scrapers
-                        events = await scraper.scrape_events(max_pages=max_pages)
+                        scrape = scraper.scrape_events(max_pages=max_pages)
                         logger.info(f"Using standard scraping for {source_name}")
+                    events = await asyncio.wait_for(scrape, timeout=self.source_timeout)
                 else:
                     # Fallback for scrapers without scrape_events method
                     events = []
 
-                source_end = datetime.now()
-                source_duration = (source_end - source_start).total_seconds()
+                source_duration = (datetime.now() - source_start).total_seconds()
+                enhancement_note = " (enhanced)" if enhanced else ""
+                logger.info(
+                    f"✓ {source_name}: {len(events)} events scraped in {source_duration:.2f}s{enhancement_note}"
+                )
 
-                pipeline_results["sources"][source_name] = {
+                return {
                     "status": "success",
                     "events_scraped": len(events),
                     "scraping_duration": source_duration,
                     "events": events,
-                    "enhanced_features_used": source_name in ["ulaznice.hr", "visitrijeka.hr", "visitsplit.com", "visitopatija.com", "visitvarazdin.hr", "turizamvukovar.hr", "zadar.travel", "infozagreb.hr"]
+                    "enhanced_features_used": enhanced
                 }
 
-                all_scraped_events.extend(events)
-                enhancement_note = " (enhanced)" if source_name in ["ulaznice.hr", "visitrijeka.hr", "visitsplit.com", "visitopatija.com", "visitvarazdin.hr", "turizamvukovar.hr", "zadar.travel", "infozagreb.hr"] else ""
-                logger.info(
-                    f"✓ {source_name}: {len(events)} events scraped in {source_duration:.2f}s{enhancement_note}"
-                )
-
             except Exception as e:
-                source_end = datetime.now()
-                source_duration = (source_end - source_start).total_seconds()
+                source_duration = (datetime.now() - source_start).total_seconds()
+                if isinstance(e, asyncio.TimeoutError):
+                    error_message = f"Timed out after {self.source_timeout:g}s"
+                else:
+                    error_message = str(e)
+
+                logger.error(f"✗ {source_name}: Failed after {source_duration:.2f}s - {error_message}")
 
-                pipeline_results["sources"][source_name] = {
+                return {
                     "status": "error",
-                    "error_message": str(e),
+                    "error_message": error_message,
                     "events_scraped": 0,
                     "scraping_duration": source_duration,
                     "events": [],
                     "enhanced_features_used": False
                 }
 
-                logger.error(f"✗ {source_name}: Failed after {source_duration:.2f}s - {e}")
+    async def _consume_event_stream(
+        self, event_queue: asyncio.Queue
+    ) -> Optional[Dict[str, Any]]:
+        """Run quality processing on queued events until the ``None`` marker.
+
+        Events are processed in batches of ``stream_batch_size``. Each batch is
+        committed before the next one is checked, so a duplicate of an event
+        saved from an earlier batch is caught by the database duplicate check.
+
+        Returns:
+            Merged results of all batches with a quality report, or None when
+            no events were queued
+        """
+        totals: Optional[Dict[str, Any]] = None
+        failed_events = 0
+        processing_duration = 0.0
+        batch: List[EventCreate] = []
+        finished = False
+
+        while not finished:
+            events = await event_queue.get()
+            if events is None:
+                finished = True
+            else:
+                batch.extend(events)
+
+            if batch and (finished or len(batch) >= self.stream_batch_size):
+                batch_start = datetime.now()
+                try:
+                    processed_results = await asyncio.to_thread(self._run_quality_batch, batch)
+                    totals = DataQualityService.merge_processed_results(totals, processed_results)
+                except Exception as e:
+                    # Keep consuming so producers never block on a full queue
+                    logger.error(f"Quality processing failed for {len(batch)} events: {e}")
+                    failed_events += len(batch)
+                processing_duration += (datetime.now() - batch_start).total_seconds()
+                batch = []
+
+        if totals is None:
+            if failed_events:
+                raise RuntimeError(f"Quality processing failed for all {failed_events} events")
+            return None
+
+        totals["failed_events"] = failed_events
+        totals["quality_report"] = DataQualityService.generate_quality_report(totals)
+        totals["processing_duration"] = processing_duration
+        self._print_quality_summary(totals)
+        return totals
 
-        logger.info("\n--- Combined Scraping Results ---")
-        logger.info(f"Total events scraped: {len(all_scraped_events)}")
-        enhanced_count = sum(1 for source_data in pipeline_results["sources"].values() 
-                           if source_data.get("enhanced_features_used", False))
-        logger.info(f"Enhanced scrapers used: {enhanced_count}/12 (8 enhanced scrapers available: ulaznice.hr, visitrijeka.hr, visitsplit.com, visitopatija.com, visitvarazdin.hr, turizamvukovar.hr, zadar.travel, infozagreb.hr)")
+    async def _process_events_with_quality_check(
+        self, events: List[EventCreate]
+    ) -> Dict[str, Any]:
+        """Process events with comprehensive quality validation.
 
-        # Process events with quality validation and duplicate detection
-        if all_scraped_events:
-            pipeline_results["combined_results"] = (
-                await self._process_events_with_quality_check(all_scraped_events)
-            )
-        else:
-            pipeline_results["combined_results"] = {
-                "processing_summary": {
-                    "original_count": 0,
-                    "final_processable_count": 0,
-                }
-            }
+        The CPU-bound quality stage runs in a worker thread (validation itself
+        fans out to the data quality process pool) so the event loop stays
+        free for scraping I/O.
+        """
+        return await asyncio.to_thread(self._run_quality_check, events)
 
-        # Calculate total processing time
-        end_time = datetime.now()
-        pipeline_results["total_processing_time"] = (
-            end_time - start_time
-        ).total_seconds()
-        pipeline_results["pipeline_end"] = end_time
+    def _run_quality_check(self, events: List[EventCreate]) -> Dict[str, Any]:
+        """Validate, de-duplicate and save events, then report (blocking)."""
+        logger.info("\n--- Quality Processing Pipeline ---")
+        processing_start = datetime.now()
 
-        logger.info("\n=== Pipeline Complete ===")
-        logger.info(
-            f"Total processing time: {pipeline_results['total_processing_time']:.2f}s"
+        processed_results = self._run_quality_batch(events)
+
+        # Generate quality report
+        processed_results["quality_report"] = DataQualityService.generate_quality_report(
+            processed_results
         )
-        logger.info(f"Events saved: {pipeline_results['saved_events']}")
 
-        return pipeline_results
+        processing_end = datetime.now()
+        processing_duration = (processing_end - processing_start).total_seconds()
+        processed_results["processing_duration"] = processing_duration
 
-    async def _process_events_with_quality_check(
-        self, events: List[EventCreate]
-    ) -> Dict[str, Any]:
-        """Process events with comprehensive quality validation."""
-        logger.info("\n--- Quality Processing Pipeline ---")
-        processing_start = datetime.now()
+        # Print quality summary
+        self._print_quality_summary(processed_results)
+
+        return processed_results
 
+    def _run_quality_batch(self, events: List[EventCreate]) -> Dict[str, Any]:
+        """Validate, de-duplicate and save one batch of events (blocking)."""
         db = SessionLocal()
         try:
             # Initialize data quality service
             quality_service = DataQualityService(db)
 
             # Process events with quality validation and duplicate detection
-            logger.info("Running quality validation and duplicate detection...")
+            logger.info(f"Running quality validation and duplicate detection on {len(events)} events...")
             processed_results = quality_service.process_scraped_events(
                 events=events,
                 quality_threshold=self.quality_threshold,
                 remove_duplicates=self.enable_duplicate_detection,
             )
 
-            # Generate quality report
-            quality_report = quality_service.generate_quality_report(processed_results)
-            processed_results["quality_report"] = quality_report
-
             # Save valid events to database
-            if processed_results["valid_events"]:
+            if processed_results["valid_events"] or processed_results["duplicates_in_db"]:
                 logger.info(
                     f"Saving {len(processed_results['valid_events'])} valid events to database..."
                 )
                 saved_count = quality_service.save_processed_events(processed_results)
                 processed_results["saved_events"] = saved_count
+                if saved_count:
+                    invalidate_event_list_caches()
             else:
                 logger.info("No valid events to save")
                 processed_results["saved_events"] = 0
 
-            processing_end = datetime.now()
-            processing_duration = (processing_end - processing_start).total_seconds()
-            processed_results["processing_duration"] = processing_duration
-
-            # Print quality summary
-            self._print_quality_summary(processed_results)
-
             return processed_results
 
         except Exception as e:
@@ -329,7 +488,7 @@ class EnhancedScrapingPipeline:
             source_name = source_mapping.get(source.lower(), source)
             
             # Enhanced scrapers support additional parameters
-            if source_name in ["ulaznice.hr", "visitrijeka.hr", "visitsplit.com", "visitopatija.com", "visitvarazdin.hr", "turizamvukovar.hr", "zadar.travel", "infozagreb.hr"]:
+            if source_name in ENHANCED_SOURCES:
                 events = await scraper.scrape_events(
                     max_pages=max_pages,
                     use_playwright=use_playwright,
@@ -557,6 +716,18 @@ class ScrapingMetricsCollector:
 
             report_lines.append("")
 
+        # Structured-data fast path
+        structured_stats = pipeline_results.get("structured_data", {})
+        if structured_stats:
+            report_lines.append("⚡ Structured Data Fast Path:")
+            for source, stats in structured_stats.items():
+                report_lines.append(
+                    f"  • {source}: listings {stats['listing_hit_rate']:.0%}, "
+                    f"details {stats['detail_hit_rate']:.0%} "
+                    f"({stats.get('details_skipped', 0)} detail fetches skipped)"
+                )
+            report_lines.append("")
+
         # Recommendations
         if analysis["recommendations"]:
             report_lines.extend(
@@ -576,18 +747,25 @@ class ScrapingMetricsCollector:
 # Convenience functions for API endpoints
 async def run_enhanced_scraping_pipeline(
     max_pages_per_source: int = 5, quality_threshold: float = 60.0, 
-    use_playwright: bool = True, fetch_details: bool = False
+    use_playwright: bool = True, fetch_details: bool = False, incremental: bool = False
 ) -> Dict[str, Any]:
     """Run the enhanced scraping pipeline with all sources and optional address extraction."""
     pipeline = EnhancedScrapingPipeline(
         quality_threshold=quality_threshold, enable_duplicate_detection=True
     )
 
-    results = await pipeline.scrape_all_sources(
-        max_pages_per_source=max_pages_per_source,
-        use_playwright=use_playwright,
-        fetch_details=fetch_details
-    )
+    try:
+        results = await pipeline.scrape_all_sources(
+            max_pages_per_source=max_pages_per_source,
+            use_playwright=use_playwright,
+            fetch_details=fetch_details,
+            incremental=incremental,
+        )
+    finally:
+        await close_browser_pool()
+        await close_http_clients()
+
+    results["structured_data"] = get_structured_data_stats()
 
     # Generate performance analysis
     performance_analysis = ScrapingMetricsCollector.analyze_pipeline_performance(
@@ -611,7 +789,11 @@ async def run_single_source_enhanced_scraping(
         quality_threshold=quality_threshold, enable_duplicate_detection=True
     )
 
-    return await pipeline.scrape_single_source(
-        source=source, max_pages=max_pages, 
-        use_playwright=use_playwright, fetch_details=fetch_details
-    )
+    try:
+        return await pipeline.scrape_single_source(
+            source=source, max_pages=max_pages, 
+            use_playwright=use_playwright, fetch_details=fetch_details
+        )
+    finally:
+        await close_browser_pool()
+        await close_http_clients()
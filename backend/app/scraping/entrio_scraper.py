@@ -11,15 +11,17 @@ from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import httpx
-import requests
-from bs4 import BeautifulSoup, Tag
-from sqlalchemy import select, tuple_
+from bs4 import Tag
 
-from backend.app.core.database import SessionLocal
+from backend.app.core.croatian_geo_db import croatian_geo_db
+from backend.app.core.event_ingestion import ingest_events
 # Temporarily disabled until OpenAI dependency is added
 # from backend.app.core.llm_location_service import llm_location_service
-from backend.app.models.event import Event
 from backend.app.models.schemas import EventCreate
+from app.scraping.browser_pool import get_browser_pool
+from app.scraping.html_parser import parse_html
+from app.scraping.http_client import http_get
+from app.scraping.incremental import drop_known_listings
 
 # Import configuration
 from backend.app.config.components import get_settings
@@ -140,66 +142,11 @@ class EventDataTransformer:
     @staticmethod
     def extract_location_from_text(title: str, description: str = "") -> str:
         """Extract location from event title and description."""
-        text = f"{title} {description}".lower()
-        
-        # Known Croatian cities and venues in order of specificity
-        croatian_locations = [
-            # Specific venues first
-            ("poljud", "Split"),
-            ("arena pula", "Pula"),
-            ("pula arena", "Pula"),
-            ("amfiteatar pula", "Pula"),
-            ("rimsko kazalište", "Pula"),
-            ("malo rimsko kazalište", "Pula"),
-            ("jarun", "Zagreb"),
-            ("maksimir", "Zagreb"),
-            ("dom sportova", "Zagreb"),
-            ("arena zagreb", "Zagreb"),
-            ("hipodrom sinj", "Sinj"),
-            ("ljetno kino makarska", "Makarska"),
-            ("summer cinema makarska", "Makarska"),
-            ("opatija", "Opatija"),
-            ("amadria park", "Opatija"),
-            
-            # Cities
-            ("split", "Split"),
-            ("pula", "Pula"),
-            ("rijeka", "Rijeka"),
-            ("zadar", "Zadar"),
-            ("dubrovnik", "Dubrovnik"),
-            ("osijek", "Osijek"),
-            ("sisak", "Sisak"),
-            ("karlovac", "Karlovac"),
-            ("varaždin", "Varaždin"),
-            ("sinj", "Sinj"),
-            ("makarska", "Makarska"),
-            ("trogir", "Trogir"),
-            ("hvar", "Hvar"),
-            ("korčula", "Korčula"),
-            ("rovinj", "Rovinj"),
-            ("poreč", "Poreč"),
-            ("umag", "Umag"),
-            ("krk", "Krk"),
-            ("crikvenica", "Crikvenica"),
-            ("senj", "Senj"),
-            ("gospić", "Gospić"),
-            ("metković", "Metković"),
-            ("ploče", "Ploče"),
-            ("otočac", "Otočac"),
-            ("samobor", "Samobor"),
-            ("velika gorica", "Velika Gorica"),
-            ("zaprešić", "Zaprešić"),
-            # Zagreb should be last as it's too common
-            ("zagreb", "Zagreb"),
-        ]
-        
-        # Search for location mentions
-        for keyword, city in croatian_locations:
-            if keyword in text:
-                return city
+        # Venues resolve to their city; a region alone is not specific enough
+        match = croatian_geo_db.match_location(f"{title} {description}")
         
         # If no specific location found, return None to skip event
-        return None
+        return match.city if match else None
 
     @staticmethod
     def extract_location_from_enhanced_data(scraped_data: Dict) -> str:
@@ -373,76 +320,25 @@ class EventDataTransformer:
 
 
 class EntrioRequestsScraper:
-    """Scraper using requests and BeautifulSoup."""
-
-    def __init__(self):
-        self.session = requests.Session()
+    """Scraper using httpx and BeautifulSoup."""
 
     async def fetch_async(self, url: str) -> httpx.Response:
         """Asynchronously fetch URL with proxy support."""
         try:
-            if USE_SB and USE_PROXY:
-                params = {"url": url}
-                async with httpx.AsyncClient(
-                    headers=HEADERS,
-                    auth=(USER, PASSWORD),
-                    verify=False,
-                ) as client:
-                    resp = await client.get(
-                        SCRAPING_BROWSER_EP,
-                        params=params,
-                        timeout=30,
-                    )
-            elif USE_PROXY:
-                async with httpx.AsyncClient(
-                    headers=HEADERS,
-                    proxies={"http": PROXY, "https": PROXY},
-                    verify=False,
-                ) as client:
-                    resp = await client.get(url, timeout=30)
-            else:
-                async with httpx.AsyncClient(headers=HEADERS) as client:
-                    resp = await client.get(url, timeout=30)
+            resp = await http_get(
+                url, headers=HEADERS, use_proxy=USE_PROXY, use_scraping_browser=USE_SB, timeout=30
+            )
             resp.raise_for_status()
             return resp
         except httpx.HTTPError as e:
             logger.error(f"Request failed for {url}: {e}")
             raise
 
-    def fetch(self, url: str) -> requests.Response:
-        """Fetch URL with proxy support."""
-        try:
-            if USE_SB and USE_PROXY:
-                params = {"url": url}
-                resp = self.session.get(
-                    SCRAPING_BROWSER_EP,
-                    params=params,
-                    headers=HEADERS,
-                    auth=(USER, PASSWORD),
-                    timeout=30,
-                    verify=False,
-                )
-            elif USE_PROXY:
-                resp = self.session.get(
-                    url,
-                    headers=HEADERS,
-                    proxies={"http": PROXY, "https": PROXY},
-                    timeout=30,
-                    verify=False,
-                )
-            else:
-                resp = self.session.get(url, headers=HEADERS, timeout=30)
-            resp.raise_for_status()
-            return resp
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed for {url}: {e}")
-            raise
-
-    def extract_location_from_event_page(self, event_url: str) -> Dict:
+    async def extract_location_from_event_page(self, event_url: str) -> Dict:
         """Extract detailed location information from event detail page using real Entrio.hr selectors."""
         try:
-            response = self.fetch(event_url)
-            soup = BeautifulSoup(response.text, "html.parser")
+            response = await self.fetch_async(event_url)
+            soup = parse_html(response.text)
             
             location_data = {}
             
@@ -649,7 +545,7 @@ class EntrioRequestsScraper:
         """Scrape events from a single page."""
         logger.info(f"→ Fetching {url}")
         resp = await self.fetch_async(url)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = parse_html(resp.text)
 
         events = []
 
@@ -676,17 +572,21 @@ class EntrioRequestsScraper:
                 break
 
         # Parse events
+        listings = []
         for event_element in event_elements:
             if isinstance(event_element, Tag):
                 event_data = self.parse_event_from_element(event_element)
                 if event_data and len(event_data) > 1:
-                    # Try to extract detailed location data if we have a link
-                    if event_data.get("link"):
-                        detailed_location_data = self.extract_location_from_event_page(event_data["link"])
-                        if detailed_location_data:
-                            # Merge the detailed location data
-                            event_data.update(detailed_location_data)
-                    events.append(event_data)
+                    listings.append(event_data)
+
+        for event_data in await drop_known_listings(listings):
+            # Try to extract detailed location data if we have a link
+            if event_data.get("link"):
+                detailed_location_data = await self.extract_location_from_event_page(event_data["link"])
+                if detailed_location_data:
+                    # Merge the detailed location data
+                    event_data.update(detailed_location_data)
+            events.append(event_data)
 
         # Find next page
         next_page_url = None
@@ -742,11 +642,21 @@ class EntrioRequestsScraper:
 class EntrioPlaywrightScraper:
     """Scraper using Playwright for JavaScript-heavy pages."""
 
+    def __init__(self, fast_mode: Optional[bool] = None):
+        """
+        Args:
+            fast_mode: Skip human simulation and fixed delays. Defaults to
+                ``scraping.browser_fast_mode`` when going through the scraping
+                browser, which solves Cloudflare challenges on its own.
+        """
+        if fast_mode is None:
+            fast_mode = _scraping_config.browser_fast_mode and USE_PROXY
+        self.fast_mode = fast_mode
+
     async def scrape_with_playwright(
         self, start_url: str = "https://entrio.hr/", max_pages: int = 5, fetch_details: bool = False
     ) -> List[Dict]:
         """Scrape events using Playwright with anti-detection."""
-        from playwright.async_api import async_playwright
         import random
 
         all_events = []
@@ -758,57 +668,28 @@ class EntrioPlaywrightScraper:
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0"
         ]
 
-        async with async_playwright() as p:
-            # Launch with maximum anti-detection
-            if USE_PROXY:
-                browser = await p.chromium.connect_over_cdp(BRD_WSS)
-            else:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--no-sandbox',
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-dev-shm-usage',
-                        '--disable-web-security',
-                        '--disable-features=VizDisplayCompositor',
-                        '--disable-background-timer-throttling',
-                        '--disable-backgrounding-occluded-windows',
-                        '--disable-renderer-backgrounding',
-                        '--disable-field-trial-config',
-                        '--disable-back-forward-cache',
-                        '--disable-ipc-flooding-protection',
-                        '--no-first-run',
-                        '--no-default-browser-check',
-                        '--no-pings',
-                        '--password-store=basic',
-                        '--use-mock-keychain'
-                    ]
-                )
-
-            # Create realistic browser context
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent=random.choice(user_agents),
-                locale='hr-HR',
-                timezone_id='Europe/Zagreb',
-                geolocation={'latitude': 45.8150, 'longitude': 15.9819},  # Zagreb coordinates
-                permissions=['geolocation'],
-                extra_http_headers={
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                    'Accept-Language': 'hr-HR,hr;q=0.9,en-US;q=0.8,en;q=0.7',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'DNT': '1',
-                    'Connection': 'keep-alive',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Sec-Fetch-User': '?1',
-                    'Upgrade-Insecure-Requests': '1'
-                }
-            )
-            
-            page = await context.new_page()
-            
+        # Launch with maximum anti-detection (through the scraping browser when proxied)
+        async with get_browser_pool().page(
+            cdp_endpoint=BRD_WSS if USE_PROXY else None,
+            viewport={'width': 1920, 'height': 1080},
+            user_agent=random.choice(user_agents),
+            locale='hr-HR',
+            timezone_id='Europe/Zagreb',
+            geolocation={'latitude': 45.8150, 'longitude': 15.9819},  # Zagreb coordinates
+            permissions=['geolocation'],
+            extra_http_headers={
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+                'Accept-Language': 'hr-HR,hr;q=0.9,en-US;q=0.8,en;q=0.7',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'DNT': '1',
+                'Connection': 'keep-alive',
+                'Sec-Fetch-Dest': 'document',
+                'Sec-Fetch-Mode': 'navigate',
+                'Sec-Fetch-Site': 'none',
+                'Sec-Fetch-User': '?1',
+                'Upgrade-Insecure-Requests': '1'
+            },
+        ) as page:
             # Add stealth script
             await page.add_init_script("""
                 Object.defineProperty(navigator, 'webdriver', {
@@ -851,7 +732,7 @@ class EntrioPlaywrightScraper:
                 all_events.extend(homepage_events)
                 
                 # Now try to access events page with advanced Cloudflare bypass
-                await self.access_events_page_with_bypass(page, all_events, max_pages)
+                await self.access_events_page_with_bypass(page, all_events, max_pages, fetch_details=fetch_details)
 
                 logger.info(f"Total events found: {len(all_events)}")
                 
@@ -861,13 +742,12 @@ class EntrioPlaywrightScraper:
             except Exception as e:
                 logger.error(f"Failed to scrape page {start_url}: {e}")
 
-            await browser.close()
-
         return all_events
 
-    async def access_events_page_with_bypass(self, page, all_events, max_pages):
+    async def access_events_page_with_bypass(self, page, all_events, max_pages, fetch_details: bool = False):
         """Advanced Cloudflare bypass to access events page."""
-        
+        import random
+
         logger.info("Attempting to access events page with advanced bypass...")
         
         # Method 1: Handle cookie acceptance and human simulation
@@ -933,77 +813,6 @@ class EntrioPlaywrightScraper:
         except Exception as e:
             logger.error(f"Method 1 failed: {e}")
 
-    async def handle_cookie_acceptance(self, page):
-        """Handle cookie acceptance overlays and popups."""
-        try:
-            # Wait a bit for any overlays to appear
-            await page.wait_for_timeout(2000)
-            
-            # Look for cookie acceptance buttons/overlays
-            cookie_selectors = [
-                '.accept__overlay',
-                '.js-accept-overlay',
-                '.cookie-accept',
-                '.cookie-consent button',
-                'button:text("Accept")',
-                'button:text("Prihvati")',
-                'button:text("OK")',
-                '.accept-cookies',
-                '[class*="cookie"] button',
-                '[class*="accept"] button'
-            ]
-            
-            for selector in cookie_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        logger.debug(f"Found cookie element: {selector}")
-                        # Try to remove overlay or click accept
-                        if 'overlay' in selector:
-                            await page.evaluate(f'document.querySelector("{selector}")?.remove()')
-                        else:
-                            await element.click()
-                        await page.wait_for_timeout(1000)
-                        logger.debug(f"Handled cookie element: {selector}")
-                        break
-                except:
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"Cookie handling failed: {e}")
-
-    async def simulate_human_behavior(self, page):
-        """Simulate realistic human browsing behavior."""
-        import random
-        
-        try:
-            # Simulate realistic mouse movements
-            for _ in range(3):
-                x = random.randint(100, 1000)
-                y = random.randint(100, 600)
-                await page.mouse.move(x, y)
-                await page.wait_for_timeout(random.randint(200, 800))
-            
-            # Simulate scrolling
-            await page.evaluate("""
-                () => {
-                    const scrollAmount = Math.random() * 500 + 200;
-                    window.scrollTo({
-                        top: scrollAmount,
-                        behavior: 'smooth'
-                    });
-                }
-            """)
-            
-            await page.wait_for_timeout(random.randint(1000, 3000))
-            
-            # Scroll back up
-            await page.evaluate("window.scrollTo({ top: 0, behavior: 'smooth' })")
-            await page.wait_for_timeout(random.randint(1000, 2000))
-            
-        except Exception as e:
-            logger.error(f"Human simulation failed: {e}")
-        
         # Method 2: Enhanced direct URL bypass with stealth techniques
         logger.info("Step 2: Trying advanced direct URL bypass...")
         
@@ -1021,7 +830,8 @@ class EntrioPlaywrightScraper:
                 logger.info(f"Attempt {attempt + 1}: Trying {url}")
                 
                 # Wait with human-like delay
-                await page.wait_for_timeout(random.randint(5000, 10000))
+                if not self.fast_mode:
+                    await page.wait_for_timeout(random.randint(5000, 10000))
                 
                 # Simulate coming from Google search
                 await page.set_extra_http_headers({
@@ -1045,7 +855,8 @@ class EntrioPlaywrightScraper:
                 response = await page.goto(url, wait_until="networkidle", timeout=30000)
                 
                 # Wait for page to fully load and any dynamic content
-                await page.wait_for_timeout(8000)
+                if not self.fast_mode:
+                    await page.wait_for_timeout(8000)
                 
                 # Handle any additional overlays that might appear
                 await self.handle_cookie_acceptance(page)
@@ -1094,6 +905,80 @@ class EntrioPlaywrightScraper:
         
         logger.warning("⚠️ All advanced bypass methods failed, using homepage events only")
 
+    async def handle_cookie_acceptance(self, page):
+        """Handle cookie acceptance overlays and popups."""
+        try:
+            # Wait a bit for any overlays to appear
+            await page.wait_for_timeout(2000)
+            
+            # Look for cookie acceptance buttons/overlays
+            cookie_selectors = [
+                '.accept__overlay',
+                '.js-accept-overlay',
+                '.cookie-accept',
+                '.cookie-consent button',
+                'button:text("Accept")',
+                'button:text("Prihvati")',
+                'button:text("OK")',
+                '.accept-cookies',
+                '[class*="cookie"] button',
+                '[class*="accept"] button'
+            ]
+            
+            for selector in cookie_selectors:
+                try:
+                    element = await page.query_selector(selector)
+                    if element:
+                        logger.debug(f"Found cookie element: {selector}")
+                        # Try to remove overlay or click accept
+                        if 'overlay' in selector:
+                            await page.evaluate(f'document.querySelector("{selector}")?.remove()')
+                        else:
+                            await element.click()
+                        await page.wait_for_timeout(1000)
+                        logger.debug(f"Handled cookie element: {selector}")
+                        break
+                except:
+                    continue
+                    
+        except Exception as e:
+            logger.error(f"Cookie handling failed: {e}")
+
+    async def simulate_human_behavior(self, page):
+        """Simulate realistic human browsing behavior (skipped in fast mode)."""
+        import random
+
+        if self.fast_mode:
+            return
+
+        try:
+            # Simulate realistic mouse movements
+            for _ in range(3):
+                x = random.randint(100, 1000)
+                y = random.randint(100, 600)
+                await page.mouse.move(x, y)
+                await page.wait_for_timeout(random.randint(200, 800))
+            
+            # Simulate scrolling
+            await page.evaluate("""
+                () => {
+                    const scrollAmount = Math.random() * 500 + 200;
+                    window.scrollTo({
+                        top: scrollAmount,
+                        behavior: 'smooth'
+                    });
+                }
+            """)
+            
+            await page.wait_for_timeout(random.randint(1000, 3000))
+            
+            # Scroll back up
+            await page.evaluate("window.scrollTo({ top: 0, behavior: 'smooth' })")
+            await page.wait_for_timeout(random.randint(1000, 2000))
+            
+        except Exception as e:
+            logger.error(f"Human simulation failed: {e}")
+
     async def fetch_event_details(self, page, event_url: str) -> Dict:
         """Fetch detailed address information from event page."""
         try:
@@ -1402,66 +1287,16 @@ class EntrioScraper:
         return events
 
     def save_events_to_database(self, events: List[EventCreate]) -> int:
-        """Insert events using a bulk query and return number of new rows."""
-        if not events:
-            return 0
+        """Upsert events through the shared ingestion service.
 
-        db = SessionLocal()
-
-        try:
-            # Prepare incoming data for database
-            event_dicts = []
-            for e in events:
-                event_dict = e.model_dump()
-                # Remove id field as it's auto-generated by database
-                event_dict.pop("id", None)
-                event_dicts.append(event_dict)
-            
-            pairs = [(e["title"], e["date"]) for e in event_dicts]
-
-            # Fetch all existing events for these (title, date) pairs
-            existing = db.execute(
-                select(Event.title, Event.date).where(
-                    tuple_(Event.title, Event.date).in_(pairs)
-                )
-            ).all()
-            existing_pairs = set(existing)
-
-            # Filter to only new events
-            to_insert = [
-                e for e in event_dicts if (e["title"], e["date"]) not in existing_pairs
-            ]
-
-            if to_insert:
-                # Use direct SQLAlchemy Core insert to avoid any field mapping issues
-                
-                # Insert each event individually to avoid bulk insert mapping issues
-                saved_count = 0
-                for event_data in to_insert:
-                    try:
-                        # Create Event object directly
-                        event = Event(**event_data)
-                        db.add(event)
-                        db.flush()  # Get the ID without committing
-                        saved_count += 1
-                    except Exception as e:
-                        # Skip duplicate or invalid events
-                        db.rollback()
-                        logger.debug(f"Skipping event {event_data.get('title', 'Unknown')}: {e}")
-                        continue
-                
-                db.commit()
-                return saved_count
-
-            db.commit()
+        Returns:
+            int: Number of events inserted or updated
+        """
+        if not events:
             return 0
 
-        except Exception as e:
-            logger.error(f"Error saving events to database: {e}")
-            db.rollback()
-            raise
-        finally:
-            db.close()
+        stats = ingest_events(events)
+        return stats["inserted"] + stats["updated"]
 
 
 # Convenience functions for API endpoints
@@ -0,0 +1,51 @@
+"""
+HTML parsing for scrapers.
+
+Scrapers used to build every soup with BeautifulSoup's pure-Python
+"html.parser", which made parsing the largest CPU cost of scraping workers.
+``parse_html`` builds the same BeautifulSoup tree with the parser named in
+``scraping.html_parser`` (lxml's C parser by default), so existing ``select``
+and ``find`` code keeps working. Without lxml installed it falls back to
+"html.parser".
+
+``parse_only`` takes a ``SoupStrainer`` to build only the matching subtrees,
+for example the event list of a listing page, skipping navigation, footers
+and inline scripts.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Optional, Union
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+from app.config.components import get_settings
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_PARSER = "html.parser"
+
+
+@lru_cache(maxsize=None)
+def _available_parser(name: str) -> str:
+    """Return ``name`` if BeautifulSoup can use it, otherwise the fallback."""
+    try:
+        BeautifulSoup("", name)
+    except FeatureNotFound:
+        logger.warning(f"HTML parser {name!r} is not installed, falling back to {FALLBACK_PARSER}")
+        return FALLBACK_PARSER
+    return name
+
+
+def parse_html(markup: Union[str, bytes], parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse an HTML document with the configured parser.
+
+    Args:
+        markup: HTML text or bytes
+        parse_only: Build only the elements matching this strainer
+
+    Returns:
+        BeautifulSoup: Parsed document
+    """
+    features = _available_parser(get_settings().scraping.html_parser)
+    return BeautifulSoup(markup, features, parse_only=parse_only)
@@ -0,0 +1,267 @@
+"""
+On-disk HTTP cache with conditional requests for scraper fetches.
+
+Most tourism-board pages change rarely, yet every run downloaded them again.
+``HttpCache`` keeps the validators (ETag, Last-Modified), a hash and the body
+of each successful page, keyed by URL. Later fetches send ``If-None-Match`` /
+``If-Modified-Since``; a 304 is answered from the stored body, and a 200 whose
+body hash matches the stored one is flagged as unchanged as well. Callers can
+then reuse what they parsed from the page last time (``load_parsed`` /
+``store_parsed``) instead of parsing it again.
+
+Entries not fetched again within ``scraping.http_cache_max_age_hours`` are
+ignored on lookup and deleted by ``prune``, which runs when the cache is
+first opened in a process.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import httpx
+
+from app.config.components import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Relative cache directories are resolved against the backend directory, not the CWD
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# Key of the cache state in ``httpx.Response.extensions``
+CACHE_EXTENSION = "http_cache"
+
+# Cache states of a response
+MISS = "miss"  # no stored copy yet
+MODIFIED = "modified"  # stored copy replaced by a different body
+UNCHANGED = "unchanged"  # 200 with the stored body
+NOT_MODIFIED = "not_modified"  # 304, body replayed from the cache
+
+
+@dataclass
+class CachedPage:
+    """Validators and body hash stored for one URL."""
+
+    url: str
+    body_hash: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_type: Optional[str] = None
+    stored_at: float = 0.0
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers turning a GET into a conditional request."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def cache_state(response: httpx.Response) -> Optional[str]:
+    """Return the cache state of a response, or None if it bypassed the cache."""
+    info = response.extensions.get(CACHE_EXTENSION)
+    return info["state"] if info else None
+
+
+def is_unchanged(response: httpx.Response) -> bool:
+    """Whether a response carries the same body as the previous fetch."""
+    return cache_state(response) in (UNCHANGED, NOT_MODIFIED)
+
+
+class HttpCache:
+    """HTTP response cache stored as files under one directory.
+
+    Args:
+        directory: Cache directory
+        max_age: Seconds after which an entry that was not fetched again
+            expires; None keeps entries forever
+    """
+
+    def __init__(self, directory: Union[str, Path], max_age: Optional[float] = None):
+        self.directory = Path(directory)
+        self.max_age = max_age
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.max_age is not None and time.time() - stored_at > self.max_age
+
+    def _path(self, url: str, suffix: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / key[:2] / f"{key}{suffix}"
+
+    def _write(self, path: Path, data: bytes) -> None:
+        """Write a file atomically so concurrent readers never see partial data."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def lookup(self, url: str) -> Optional[CachedPage]:
+        """Get the stored validators of a URL."""
+        try:
+            page = CachedPage(**json.loads(self._path(url, ".json").read_bytes()))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable HTTP cache entry for {url}: {e}")
+            return None
+        # An expired entry is fetched unconditionally and then overwritten
+        return None if self._expired(page.stored_at) else page
+
+    def prune(self) -> int:
+        """Delete entries that expired or cannot be read.
+
+        Returns:
+            int: Number of entries removed
+        """
+        if self.max_age is None:
+            return 0
+
+        removed = 0
+        for meta_path in self.directory.glob("*/*.json"):
+            if meta_path.name.endswith(".parsed.json"):
+                continue
+            try:
+                stored_at = float(json.loads(meta_path.read_bytes()).get("stored_at", 0.0))
+            except (OSError, ValueError, TypeError, AttributeError):
+                stored_at = 0.0
+            if not self._expired(stored_at):
+                continue
+
+            key = meta_path.name[: -len(".json")]
+            try:
+                for suffix in (".json", ".body", ".parsed.json"):
+                    (meta_path.parent / f"{key}{suffix}").unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Could not remove HTTP cache entry {key}: {e}")
+                continue
+            removed += 1
+        return removed
+
+    def _store(self, page: CachedPage, body: Optional[bytes] = None) -> None:
+        if body is not None:
+            self._write(self._path(page.url, ".body"), body)
+        self._write(self._path(page.url, ".json"), json.dumps(asdict(page)).encode("utf-8"))
+
+    def apply(
+        self, url: str, response: httpx.Response, cached: Optional[CachedPage]
+    ) -> Optional[httpx.Response]:
+        """Record a response and tag it with its cache state.
+
+        Args:
+            url: Page URL the response belongs to
+            response: Response to a (possibly conditional) request
+            cached: Entry the request was made with
+
+        Returns:
+            The response to hand to the caller: a 304 is replaced by the stored
+            page. None when a 304 arrives but the stored body is gone, in which
+            case the page has to be fetched again without validators.
+        """
+        try:
+            if response.status_code == 304 and cached:
+                return self._replay(url, response, cached)
+            if response.status_code != 200:
+                return response
+
+            body = response.content
+            body_hash = hashlib.sha256(body).hexdigest()
+            if cached is None:
+                state = MISS
+            elif cached.body_hash == body_hash:
+                state = UNCHANGED
+            else:
+                state = MODIFIED
+
+            page = CachedPage(
+                url=url,
+                body_hash=body_hash,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+                content_type=response.headers.get("content-type"),
+                stored_at=time.time(),
+            )
+            self._store(page, None if state == UNCHANGED else body)
+            response.extensions[CACHE_EXTENSION] = {"url": url, "state": state, "body_hash": body_hash}
+            return response
+
+        except OSError as e:
+            # A full or read-only disk must not break scraping
+            logger.warning(f"HTTP cache write failed for {url}: {e}")
+            return response
+
+    def _replay(
+        self, url: str, response: httpx.Response, cached: CachedPage
+    ) -> Optional[httpx.Response]:
+        try:
+            body = self._path(url, ".body").read_bytes()
+        except FileNotFoundError:
+            return None
+
+        headers = {"content-type": cached.content_type} if cached.content_type else {}
+        return httpx.Response(
+            200,
+            headers=headers,
+            content=body,
+            request=response.request,
+            extensions={
+                CACHE_EXTENSION: {"url": url, "state": NOT_MODIFIED, "body_hash": cached.body_hash}
+            },
+        )
+
+    def load_parsed(self, response: httpx.Response) -> Optional[Any]:
+        """Get data stored with ``store_parsed`` for the same page body."""
+        info = response.extensions.get(CACHE_EXTENSION)
+        if not info or info["state"] not in (UNCHANGED, NOT_MODIFIED):
+            return None
+        try:
+            stored = json.loads(self._path(info["url"], ".parsed.json").read_bytes())
+        except (OSError, ValueError):
+            return None
+        return stored["data"] if stored.get("body_hash") == info["body_hash"] else None
+
+    def store_parsed(self, response: httpx.Response, data: Any) -> None:
+        """Store JSON-serializable data parsed from a cached response's body."""
+        info = response.extensions.get(CACHE_EXTENSION)
+        if not info:
+            return
+        try:
+            payload = json.dumps({"body_hash": info["body_hash"], "data": data}, default=str)
+            self._write(self._path(info["url"], ".parsed.json"), payload.encode("utf-8"))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not cache parsed data for {info['url']}: {e}")
+
+
+_http_cache: Optional[HttpCache] = None
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """Get the scraper HTTP cache, or None when it is disabled in settings."""
+    global _http_cache
+    scraping = get_settings().scraping
+    if not scraping.http_cache_enabled:
+        return None
+    if _http_cache is None:
+        directory = Path(scraping.http_cache_dir).expanduser()
+        if not directory.is_absolute():
+            directory = BACKEND_DIR / directory
+        _http_cache = HttpCache(directory, max_age=scraping.http_cache_max_age_hours * 3600)
+        try:
+            removed = _http_cache.prune()
+        except OSError as e:
+            logger.warning(f"HTTP cache pruning failed: {e}")
+        else:
+            if removed:
+                logger.info(f"Pruned {removed} expired HTTP cache entries from {directory}")
+    return _http_cache
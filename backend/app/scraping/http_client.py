@@ -0,0 +1,159 @@
+"""
+Shared pooled HTTP clients for scrapers.
+
+Scrapers used to open a new ``httpx.AsyncClient`` per scraper or even per
+request, so most pages paid for a fresh TCP and TLS handshake (twice when
+going through the BrightData proxy). ``get_http_client`` hands out one client
+per connection mode and event loop instead. Each client keeps connections
+alive in per-host pools, speaks HTTP/2 when ``h2`` is installed, and runs the
+per-domain rate limiter before every request. ``http_get`` also turns
+fetches of previously seen pages into conditional requests (see http_cache).
+"""
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import weakref
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from app.config.components import get_settings
+from app.scraping.http_cache import get_http_cache
+from app.scraping.rate_limit import get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# httpx negotiates HTTP/2 only with the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Clients are bound to the event loop their connections were opened on, so
+# each loop (e.g. every asyncio.run of a scheduler job) gets its own set
+_ClientKey = Tuple[bool, bool]
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[_ClientKey, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+
+def _build_client(proxy: bool, verify: bool) -> httpx.AsyncClient:
+    scraping = get_settings().scraping
+    client = httpx.AsyncClient(
+        headers=scraping.headers_dict,
+        proxy=scraping.proxy_url if proxy else None,
+        verify=verify,
+        http2=scraping.http2 and HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(float(scraping.timeout)),
+        limits=httpx.Limits(
+            max_connections=scraping.http_max_connections,
+            max_keepalive_connections=scraping.http_max_keepalive_connections,
+            keepalive_expiry=scraping.http_keepalive_expiry,
+        ),
+        event_hooks={"request": [get_rate_limiter().request_hook]},
+    )
+    logger.info(
+        f"HTTP client created (proxy={proxy}, verify={verify}, "
+        f"http2={scraping.http2 and HTTP2_AVAILABLE})"
+    )
+    return client
+
+
+def get_http_client(proxy: bool = False, verify: bool = True) -> httpx.AsyncClient:
+    """Get the shared client of the running event loop for a connection mode.
+
+    Args:
+        proxy: Route requests through the BrightData proxy from ScrapingConfig
+        verify: Verify TLS certificates (the proxy re-signs them, so proxied
+            and scraping browser requests are made with ``verify=False``)
+
+    Returns:
+        httpx.AsyncClient: Pooled client; callers must not close it
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    key = (proxy, verify)
+
+    with _clients_lock:
+        clients = _clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None or client.is_closed:
+            client = clients[key] = _build_client(proxy, verify)
+    return client
+
+
+async def _send(
+    url: str,
+    headers: Optional[Dict[str, str]],
+    use_proxy: bool,
+    use_scraping_browser: bool,
+    timeout: Optional[float],
+) -> httpx.Response:
+    request_timeout = httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+
+    if use_scraping_browser and use_proxy:
+        scraping = get_settings().scraping
+        return await get_http_client(verify=False).get(
+            scraping.scraping_browser_endpoint,
+            params={"url": url},
+            headers=headers,
+            auth=(scraping.brightdata_user, scraping.brightdata_password),
+            timeout=request_timeout,
+        )
+    if use_proxy:
+        return await get_http_client(proxy=True, verify=False).get(
+            url, headers=headers, timeout=request_timeout
+        )
+    return await get_http_client().get(url, headers=headers, timeout=request_timeout)
+
+
+async def http_get(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    use_proxy: bool = False,
+    use_scraping_browser: bool = False,
+    timeout: Optional[float] = None,
+    use_cache: bool = True,
+) -> httpx.Response:
+    """GET a page through the shared client matching a scraper's settings.
+
+    Args:
+        url: Page URL
+        headers: Extra headers merged over the default scraping headers
+        use_proxy: Go through the BrightData proxy
+        use_scraping_browser: Together with ``use_proxy``, fetch the page via
+            the BrightData scraping browser endpoint instead
+        timeout: Request timeout in seconds (defaults to scraping.timeout)
+        use_cache: Make a conditional request from the on-disk HTTP cache and
+            record the response there
+
+    Returns:
+        httpx.Response: The response; status is not checked. With the cache,
+        a 304 comes back as the stored 200 page and ``is_unchanged`` tells
+        whether the body is the same as last time.
+    """
+    cache = get_http_cache() if use_cache else None
+    cached = cache.lookup(url) if cache else None
+    if cached is None:
+        response = await _send(url, headers, use_proxy, use_scraping_browser, timeout)
+        return cache.apply(url, response, None) if cache else response
+
+    conditional_headers = {**(headers or {}), **cached.conditional_headers()}
+    response = await _send(url, conditional_headers, use_proxy, use_scraping_browser, timeout)
+    result = cache.apply(url, response, cached)
+    if result is None:
+        logger.warning(f"Cached body missing for {url}, fetching it again")
+        response = await _send(url, headers, use_proxy, use_scraping_browser, timeout)
+        result = cache.apply(url, response, None)
+    return result
+
+
+async def close_http_clients() -> None:
+    """Close the shared clients of the running event loop."""
+    with _clients_lock:
+        clients = _clients.pop(asyncio.get_running_loop(), {})
+
+    for client in clients.values():
+        await client.aclose()
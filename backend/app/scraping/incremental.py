@@ -0,0 +1,115 @@
+"""
+Incremental scraping: skip events already stored by a recent run.
+
+Hourly runs used to fetch the detail page of every listed event even though
+almost all of them were saved by the previous run. While incremental mode is
+on (``incremental_scraping()``), scrapers pass each parsed listing page
+through ``drop_known_listings`` before fetching details. That makes one
+query per page and drops entries whose detail link was scraped within
+``scraping.incremental_max_age_hours`` and whose listing title still matches
+the stored one. A page that is entirely known comes back empty, which stops
+pagination in the scrapers' page loops.
+
+The daily full run does not use incremental mode. Events it finds again are
+re-saved through the ingestion upsert, or, when duplicate detection matches
+them to a stored event with the same detail link, have that event's
+``last_scraped_at`` refreshed (see ``DataQualityService``). Either way the
+timestamp this module and ``cleanup_old_events`` rely on stays current.
+"""
+
+import asyncio
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import select
+
+from app.config.components import get_settings
+from app.core.database import SessionLocal
+from app.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+# Tasks and threads started inside incremental_scraping() inherit the flag
+_incremental: ContextVar[bool] = ContextVar("incremental_scraping", default=False)
+
+
+@contextmanager
+def incremental_scraping(enabled: bool = True) -> Iterator[None]:
+    """Turn incremental mode on for scrapes run inside the block."""
+    token = _incremental.set(enabled)
+    try:
+        yield
+    finally:
+        _incremental.reset(token)
+
+
+def is_incremental() -> bool:
+    """Whether the current scrape runs in incremental mode."""
+    return _incremental.get()
+
+
+def _normalize_title(title: Any) -> str:
+    return " ".join(str(title).split()).casefold()
+
+
+def _find_known_titles(links: List[str], since: datetime) -> Dict[str, str]:
+    """Map detail links scraped since a point in time to their stored titles."""
+    db = SessionLocal()
+    try:
+        rows = db.execute(
+            select(Event.link, Event.title).where(
+                Event.link.in_(links),
+                Event.last_scraped_at >= since,
+            )
+        ).all()
+        return {row.link: row.title for row in rows}
+    finally:
+        db.close()
+
+
+async def drop_known_listings(
+    listings: List[Dict[str, Any]], max_age: Optional[timedelta] = None
+) -> List[Dict[str, Any]]:
+    """Drop listing entries of recently scraped, unchanged events.
+
+    Does nothing outside incremental mode.
+
+    Args:
+        listings: Events parsed from one listing page
+        max_age: How recently an event must have been scraped to be skipped
+            (defaults to ``scraping.incremental_max_age_hours``)
+
+    Returns:
+        The listings still worth scraping, in their original order
+    """
+    if not is_incremental():
+        return listings
+
+    links = list({listing["link"] for listing in listings if listing.get("link")})
+    if not links:
+        return listings
+
+    if max_age is None:
+        max_age = timedelta(hours=get_settings().scraping.incremental_max_age_hours)
+    since = datetime.now(timezone.utc) - max_age
+
+    try:
+        known = await asyncio.to_thread(_find_known_titles, links, since)
+    except Exception as e:
+        logger.warning(f"Known event lookup failed, scraping the page in full: {e}")
+        return listings
+
+    fresh = []
+    for listing in listings:
+        stored_title = known.get(listing.get("link"))
+        title = listing.get("title")
+        if stored_title is not None and (not title or _normalize_title(title) == _normalize_title(stored_title)):
+            continue
+        fresh.append(listing)
+
+    if len(fresh) < len(listings):
+        logger.info(f"Incremental mode: skipping {len(listings) - len(fresh)}/{len(listings)} known events")
+    return fresh
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import re
+from contextlib import AsyncExitStack
 from datetime import date
 from typing import Dict, List, Optional, Any, Union
 from urllib.parse import urljoin
@@ -13,6 +13,12 @@ from urllib.parse import urljoin
 from bs4 import BeautifulSoup, Tag
 
 from app.scraping.base_scraper import BaseScraper
+from app.scraping.browser_pool import get_browser_pool
+from app.scraping.html_parser import parse_html
+from app.scraping.http_client import http_get
+from app.scraping.incremental import drop_known_listings
+from app.scraping.structured_data import detail_fields, is_complete, listing_events, needs_detail
+from backend.app.core.croatian_geo_db import croatian_geo_db
 from backend.app.models.schemas import EventCreate
 
 logger = logging.getLogger(__name__)
@@ -194,8 +200,11 @@ class InfoZagrebTransformer:
                 result["detected_address"] = matches[0].strip()
                 break
         
-        # Extract Zagreb city information
-        if "Zagreb" in text:
+        # Known Zagreb venues, then Zagreb city information
+        venue = croatian_geo_db.find_venue(text, city="Zagreb")
+        if venue:
+            result["venue"] = venue.name
+        if venue or "Zagreb" in text:
             result["city"] = "Zagreb"
         
         return result
@@ -293,17 +302,13 @@ class InfoZagrebTransformer:
 class InfoZagrebRequestsScraper:
     """Scraper using httpx and BeautifulSoup with enhanced location extraction."""
 
-    def __init__(self):
-        import httpx
-        self.client = httpx.AsyncClient(
-            headers={
-                "user-agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 ScraperBot/1.0"
-            }
-        )
+    HEADERS = {
+        "user-agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 ScraperBot/1.0"
+    }
 
     async def fetch(self, url: str) -> httpx.Response:
         try:
-            resp = await self.client.get(url, timeout=30)
+            resp = await http_get(url, headers=self.HEADERS, timeout=30)
             resp.raise_for_status()
             return resp
         except Exception as e:
@@ -312,7 +317,13 @@ class InfoZagrebRequestsScraper:
 
     async def parse_event_detail(self, url: str) -> Dict:
         resp = await self.fetch(url)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = parse_html(resp.text)
+
+        # Selectors only fill in what the page's structured data lacks
+        structured = detail_fields(soup, "infozagreb", url)
+        if is_complete(structured):
+            return structured
+
         data: Dict[str, str] = {}
 
         title_el = soup.select_one("h1")
@@ -361,7 +372,7 @@ class InfoZagrebRequestsScraper:
         if price_el:
             data["price"] = price_el.get_text(strip=True)
 
-        return data
+        return {**data, **structured}
 
     def parse_listing_element(self, el: Tag) -> Dict:
         data: Dict[str, str] = {}
@@ -397,7 +408,7 @@ class InfoZagrebRequestsScraper:
 
     async def scrape_events_page(self, url: str) -> Tuple[List[Dict], Optional[str]]:
         resp = await self.fetch(url)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = parse_html(resp.text)
 
         events: List[Dict] = []
         containers: List[Tag] = []
@@ -408,18 +419,20 @@ class InfoZagrebRequestsScraper:
                 containers = found
                 break
 
-        for el in containers:
-            if isinstance(el, Tag):
-                data = self.parse_listing_element(el)
-                link = data.get("link")
-                if link:
-                    try:
-                        detail = await self.parse_event_detail(link)
-                        data.update({k: v for k, v in detail.items() if v})
-                    except Exception:
-                        pass
-                if data:
-                    events.append(data)
+        # Structured data covering the whole page replaces the DOM heuristics
+        listings = listing_events(soup, "infozagreb", url, len(containers)) or [
+            self.parse_listing_element(el) for el in containers if isinstance(el, Tag)
+        ]
+        for data in await drop_known_listings(listings):
+            link = data.get("link")
+            if link and needs_detail(data, "infozagreb"):
+                try:
+                    detail = await self.parse_event_detail(link)
+                    data.update({k: v for k, v in detail.items() if v})
+                except Exception:
+                    pass
+            if data:
+                events.append(data)
 
         next_url = None
         next_link = soup.select_one('a[rel="next"], .pagination-next a, a.next')
@@ -443,7 +456,8 @@ class InfoZagrebRequestsScraper:
         return all_events
 
     async def close(self) -> None:
-        await self.client.aclose()
+        """Kept for API compatibility; the shared HTTP client stays open."""
+        return None
 
 
 class InfoZagrebScraper(BaseScraper):
@@ -461,43 +475,41 @@ class InfoZagrebScraper(BaseScraper):
         self.transformer = InfoZagrebTransformer()
         
         # Legacy browser automation setup (for compatibility)
-        self.playwright = None
         self.browser = None
         self.context = None
+        self._browser_lease: Optional[AsyncExitStack] = None
         
     async def setup_browser_client(self) -> None:
-        """Setup Playwright browser for JavaScript-heavy sites."""
+        """Lease a browser context from the shared pool for JavaScript-heavy sites."""
+        if self._browser_lease:
+            return
+
+        lease = AsyncExitStack()
         try:
-            from playwright.async_api import async_playwright
-            
-            if not self.playwright:
-                self.playwright = await async_playwright().start()
-                self.browser = await self.playwright.chromium.launch(
-                    headless=True,
-                    args=['--no-sandbox', '--disable-dev-shm-usage']
-                )
-                self.context = await self.browser.new_context(
+            self.context = await lease.enter_async_context(
+                get_browser_pool().context(
                     user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
                 )
-                logger.info("Playwright browser initialized successfully")
+            )
+            self.browser = self.context.browser
+            self._browser_lease = lease
+            logger.info("Playwright browser context leased successfully")
         except ImportError:
+            await lease.aclose()
             logger.warning("Playwright not available, falling back to static scraping")
         except Exception as e:
+            await lease.aclose()
             logger.error(f"Failed to setup browser client: {e}")
 
     async def close_browser(self) -> None:
-        """Clean up browser resources."""
+        """Return the browser context to the shared pool."""
         try:
-            if self.context:
-                await self.context.close()
-            if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
+            if self._browser_lease:
+                await self._browser_lease.aclose()
         except Exception as e:
             logger.error(f"Error closing browser: {e}")
         finally:
-            self.playwright = None
+            self._browser_lease = None
             self.browser = None
             self.context = None
 
@@ -577,21 +589,12 @@ class InfoZagrebPlaywrightScraper:
     async def scrape_with_playwright(self, start_url: str = "https://www.infozagreb.hr/en/events", max_pages: int = 5, fetch_details: bool = False) -> List[Dict]:
         """Scrape events using Playwright with enhanced address extraction."""
         try:
-            from playwright.async_api import async_playwright
-            
             all_events = []
             
-            async with async_playwright() as p:
-                # Configure browser
-                browser = await p.chromium.launch(headless=True)
-                
-                context = await browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-                )
-                
-                page = await context.new_page()
-                
+            async with get_browser_pool().page(
+                viewport={'width': 1920, 'height': 1080},
+                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            ) as page:
                 try:
                     logger.info(f"Navigating to {start_url}")
                     await page.goto(start_url, wait_until="domcontentloaded", timeout=30000)
@@ -785,8 +788,6 @@ class InfoZagrebPlaywrightScraper:
                     
                 except Exception as e:
                     logger.error(f"Error during scraping: {e}")
-                
-                await browser.close()
             
             return all_events
             
@@ -838,48 +839,15 @@ class InfoZagrebPlaywrightScraper:
                 logger.debug(f"Found {len(containers)} containers with InfoZagreb selector: {selector}")
                 return containers
         
-        # Advanced fallback: look for structured data
-        script_tags = soup.find_all('script', type='application/ld+json')
-        if script_tags:
-            logger.debug("Found structured data scripts, attempting to parse events")
-            structured_events = self._parse_structured_data(script_tags)
-            if structured_events:
-                return structured_events
-        
         # Final fallback to any article or div with event-related classes
         containers = soup.select("article, div[class*='event'], li[class*='event'], div[class*='post']")
         logger.debug(f"Final fallback found {len(containers)} containers")
         return containers
     
-    def _parse_structured_data(self, script_tags: List[Tag]) -> List[Tag]:
-        """Parse JSON-LD structured data for events."""
-        structured_containers = []
-        for script in script_tags:
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, list):
-                    data = data[0] if data else {}
-                
-                if data.get('@type') == 'Event' or 'Event' in str(data.get('@type', '')):
-                    # Create a pseudo-container for structured data
-                    container = Tag(name='div', attrs={'class': 'structured-event'})
-                    container.string = json.dumps(data)
-                    structured_containers.append(container)
-                    
-            except (json.JSONDecodeError, TypeError) as e:
-                logger.debug(f"Failed to parse structured data: {e}")
-                continue
-                
-        return structured_containers
-
     def parse_listing_element(self, el: Tag) -> Dict[str, Any]:
         """Enhanced parsing of event info from listing page element."""
         data: Dict[str, Any] = {}
         
-        # Handle structured data elements
-        if el.get('class') and 'structured-event' in el.get('class', []):
-            return self._parse_structured_event(el)
-        
         # Get full text for advanced parsing
         full_text = el.get_text(separator=" ", strip=True)
         
@@ -926,22 +894,6 @@ class InfoZagrebPlaywrightScraper:
         
         return data
     
-    def _parse_structured_event(self, el: Tag) -> Dict[str, Any]:
-        """Parse structured data event."""
-        try:
-            event_data = json.loads(el.string)
-            return {
-                "title": event_data.get("name", ""),
-                "description": event_data.get("description", ""),
-                "date": event_data.get("startDate", ""),
-                "location": self._format_structured_location(event_data.get("location", {})),
-                "link": event_data.get("url", ""),
-                "image": event_data.get("image", ""),
-                "price": self._format_structured_price(event_data.get("offers", {})),
-            }
-        except (json.JSONDecodeError, TypeError):
-            return {}
-    
     def _extract_title(self, el: Tag, full_text: str) -> Optional[str]:
         """Extract event title using multiple strategies."""
         # Strategy 1: Look for specific title selectors
@@ -1133,36 +1085,6 @@ class InfoZagrebPlaywrightScraper:
         
         return None
     
-    def _format_structured_location(self, location_data: Union[Dict, str]) -> str:
-        """Format structured data location."""
-        if isinstance(location_data, str):
-            return location_data
-        
-        if isinstance(location_data, dict):
-            name = location_data.get("name", "")
-            address = location_data.get("address", {})
-            
-            if isinstance(address, dict):
-                street = address.get("streetAddress", "")
-                city = address.get("addressLocality", "")
-                return f"{name}, {street}, {city}".strip(", ")
-            
-            return name
-        
-        return "Zagreb"
-    
-    def _format_structured_price(self, offers_data: Union[Dict, List]) -> str:
-        """Format structured data price."""
-        if isinstance(offers_data, list) and offers_data:
-            offers_data = offers_data[0]
-        
-        if isinstance(offers_data, dict):
-            price = offers_data.get("price", "")
-            currency = offers_data.get("priceCurrency", "")
-            return f"{price} {currency}".strip()
-        
-        return "Check website"
-
     async def parse_event_detail(self, url: str) -> Dict[str, Any]:
         """Enhanced event detail parsing with fallback strategies."""
         # Try browser automation first for JavaScript-heavy sites
@@ -1190,33 +1112,9 @@ class InfoZagrebPlaywrightScraper:
             # Wait for potential JavaScript content loading
             await page.wait_for_timeout(2000)
             
-            # Extract structured data first
-            structured_data = await page.evaluate("""
-                () => {
-                    const scripts = document.querySelectorAll('script[type="application/ld+json"]');
-                    const events = [];
-                    scripts.forEach(script => {
-                        try {
-                            const data = JSON.parse(script.textContent);
-                            if (data['@type'] === 'Event' || (Array.isArray(data) && data.some(item => item['@type'] === 'Event'))) {
-                                events.push(data);
-                            }
-                        } catch (e) {}
-                    });
-                    return events;
-                }
-            """)
-            
-            if structured_data:
-                for data in structured_data:
-                    if isinstance(data, list):
-                        data = data[0] if data else {}
-                    if data.get('@type') == 'Event':
-                        return self._parse_structured_event_data(data)
-            
             # Get page content and parse
             content = await page.content()
-            soup = BeautifulSoup(content, "html.parser")
+            soup = parse_html(content)
             return self._extract_detail_data(soup, url)
             
         finally:
@@ -1226,7 +1124,7 @@ class InfoZagrebPlaywrightScraper:
         """Static event detail parsing fallback."""
         try:
             response = await self.fetch_with_retry(url)
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = parse_html(response.text)
             return self._extract_detail_data(soup, url)
             
         except Exception as e:
@@ -1235,6 +1133,11 @@ class InfoZagrebPlaywrightScraper:
     
     def _extract_detail_data(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
         """Extract detailed event data from soup."""
+        # Selectors only fill in what the page's structured data lacks
+        structured = detail_fields(soup, self.source_name, url)
+        if is_complete(structured):
+            return structured
+
         data: Dict[str, Any] = {}
         
         # Enhanced title extraction
@@ -1284,7 +1187,7 @@ class InfoZagrebPlaywrightScraper:
         # Store full page text for advanced pattern matching
         data["full_text"] = soup.get_text(separator=" ", strip=True)
         
-        return data
+        return {**data, **structured}
     
     def _extract_detail_date_time(self, soup: BeautifulSoup) -> Dict[str, str]:
         """Extract date and time from detail page."""
@@ -1402,29 +1305,6 @@ class InfoZagrebPlaywrightScraper:
         
         return None
     
-    def _parse_structured_event_data(self, data: Dict) -> Dict[str, Any]:
-        """Parse structured event data."""
-        return {
-            "title": data.get("name", ""),
-            "description": data.get("description", ""),
-            "date": data.get("startDate", ""),
-            "time": self._extract_time_from_datetime(data.get("startDate", "")),
-            "location": self._format_structured_location(data.get("location", {})),
-            "image": data.get("image", ""),
-            "price": self._format_structured_price(data.get("offers", {})),
-        }
-    
-    def _extract_time_from_datetime(self, datetime_str: str) -> str:
-        """Extract time from ISO datetime string."""
-        if not datetime_str:
-            return "20:00"
-        
-        time_match = re.search(r'T(\d{2}:\d{2})', datetime_str)
-        if time_match:
-            return time_match.group(1)
-        
-        return "20:00"
-    
     async def try_api_endpoints(self) -> List[Dict[str, Any]]:
         """Attempt to discover and use InfoZagreb's event API endpoints."""
         potential_endpoints = [
@@ -1636,19 +1516,20 @@ class InfoZagrebPlaywrightScraper:
             
             # Get final page content
             content = await page.content()
-            soup = BeautifulSoup(content, "html.parser")
+            soup = parse_html(content)
             
-            # Parse events from the content
+            # Parse events from the content, preferring the page's structured data
             containers = self._find_event_containers(soup)
+            listings = listing_events(soup, self.source_name, self.events_url, len(containers)) or [
+                self.parse_listing_element(container) for container in containers if isinstance(container, Tag)
+            ]
             events = []
             
-            for container in containers:
-                if isinstance(container, Tag):
-                    event_data = self.parse_listing_element(container)
-                    if event_data:
-                        event = self.transform_to_event(event_data)
-                        if event:
-                            events.append(event)
+            for event_data in listings:
+                if event_data:
+                    event = self.transform_to_event(event_data)
+                    if event:
+                        events.append(event)
             
             await page.close()
             logger.info(f"Browser scraping found {len(events)} events")
@@ -1939,45 +1820,18 @@ class InfoZagrebPlaywrightScraper:
         return events
 
     def save_events_to_database(self, events: List[EventCreate]) -> int:
-        """Save events to database with duplicate prevention."""
-        from sqlalchemy import select, tuple_
-        from sqlalchemy.dialects.postgresql import insert
-        
-        from backend.app.core.database import SessionLocal
-        from backend.app.models.event import Event
-        
+        """Upsert events through the shared ingestion service.
+
+        Returns:
+            int: Number of events inserted or updated
+        """
+        from backend.app.core.event_ingestion import ingest_events
+
         if not events:
             return 0
-        
-        db = SessionLocal()
-        try:
-            event_dicts = [e.model_dump() for e in events]
-            # Use 'title' instead of 'name' for duplicate checking
-            pairs = [(e["title"], e["date"]) for e in event_dicts]
-            existing = db.execute(
-                select(Event.title, Event.date).where(
-                    tuple_(Event.title, Event.date).in_(pairs)
-                )
-            ).all()
-            existing_pairs = set(existing)
-            to_insert = [
-                e for e in event_dicts if (e["title"], e["date"]) not in existing_pairs
-            ]
-            if to_insert:
-                stmt = insert(Event).values(to_insert)
-                stmt = stmt.on_conflict_do_nothing(index_elements=["title", "date"])
-                db.execute(stmt)
-                db.commit()
-                logger.info(f"Saved {len(to_insert)} new InfoZagreb events to database")
-                return len(to_insert)
-            db.commit()
-            return 0
-        except Exception as e:
-            logger.error(f"Failed to save events to database: {e}")
-            db.rollback()
-            raise
-        finally:
-            db.close()
+
+        stats = ingest_events(events)
+        return stats["inserted"] + stats["updated"]
 
 
 async def scrape_infozagreb_events(max_pages: int = 5, use_playwright: bool = True, fetch_details: bool = False) -> Dict:
@@ -0,0 +1,222 @@
+"""
+Per-domain request rate limiting for scrapers.
+
+Sources are scraped concurrently, so politeness delays inside one scraper no
+longer bound how often a host is hit. ``DomainRateLimiter`` keeps a token
+bucket per target host; HTTP clients call ``acquire`` (or register
+``request_hook`` as an httpx event hook) before each request. Requests sent
+through the scraping browser endpoint count against the host of the page
+they fetch, not against the endpoint.
+
+``AdaptivePacer`` adds a per-scraper delay on top that follows the site's
+behaviour: it backs off on 429/503 responses and slow answers and speeds up
+again while the site responds quickly.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from app.config.components import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second up to ``capacity``.
+
+    Callers reserve a token without holding a lock across ``await``: when the
+    bucket is empty the reservation drives it negative and the caller sleeps
+    until its token has been refilled. Waiters are therefore served in
+    arrival order, and the bucket can be shared by several event loops.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long to wait before using it."""
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    async def acquire(self) -> float:
+        """Wait for one token.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+class DomainRateLimiter:
+    """Token buckets keyed by host name."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def domain_of(url: str) -> str:
+        """Return the host of a URL (or the value itself when it is a bare host)."""
+        host = urlsplit(url).hostname if "//" in url else url
+        host = (host or url).lower()
+        return host[4:] if host.startswith("www.") else host
+
+    def bucket(self, domain: str) -> TokenBucket:
+        """Get the bucket of a domain, creating it on first use."""
+        with self._lock:
+            bucket = self._buckets.get(domain)
+            if bucket is None:
+                bucket = self._buckets[domain] = TokenBucket(self.rate, self.burst)
+            return bucket
+
+    async def acquire(self, url: str) -> float:
+        """Wait until a request to the URL's domain is allowed.
+
+        Args:
+            url: Request URL or bare host name
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        domain = self.domain_of(url)
+        delay = await self.bucket(domain).acquire()
+        if delay > 0:
+            logger.debug(f"Rate limited {domain} for {delay:.2f}s")
+        return delay
+
+    @staticmethod
+    def target_of(request) -> str:
+        """Return the page URL or host an httpx request fetches.
+
+        Scraping browser requests all go to one endpoint and carry the page
+        in their ``url`` query parameter.
+        """
+        target = request.url.params.get("url")
+        endpoint = get_settings().scraping.scraping_browser_endpoint
+        if target and request.url.host == urlsplit(endpoint).hostname:
+            return target
+        return request.url.host
+
+    async def request_hook(self, request) -> None:
+        """httpx ``event_hooks["request"]`` callback."""
+        await self.acquire(self.target_of(request))
+
+
+# Status codes telling a client to slow down
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptivePacer:
+    """Spacing between requests to a site, adapted to how the site responds.
+
+    Each ``wait`` reserves the next free slot, so concurrent callers (e.g.
+    detail pages fetched in parallel) start ``delay`` seconds apart instead
+    of all sleeping the same delay and firing together.
+
+    A throttling response (429/503) doubles the delay, or raises it to the
+    server's Retry-After when that is longer. A response slower than
+    ``target_latency`` grows it by half, and every fast response shrinks it
+    by a fifth back towards ``min_delay``.
+    """
+
+    # Delay used when backing off from no delay at all
+    BACKOFF_FLOOR = 0.5
+
+    def __init__(self, min_delay: float = 0.0, max_delay: float = 30.0, target_latency: float = 2.0):
+        self.min_delay = min_delay
+        self.max_delay = max(max_delay, min_delay)
+        self.target_latency = target_latency
+        self.delay = min_delay
+        # Monotonic time from which the next request may start
+        self._next_allowed = 0.0
+        self._lock = asyncio.Lock()
+
+    def record(self, status_code: int, elapsed: float, retry_after: Optional[float] = None) -> None:
+        """Adjust the delay after a response.
+
+        Args:
+            status_code: HTTP status of the response
+            elapsed: Seconds the request took
+            retry_after: Parsed Retry-After header, if any
+        """
+        if status_code in THROTTLE_STATUS_CODES:
+            delay = max(self.delay * 2, self.BACKOFF_FLOOR, retry_after or 0.0)
+        elif elapsed > self.target_latency:
+            delay = max(self.delay * 1.5, self.BACKOFF_FLOOR)
+        else:
+            delay = self.delay * 0.8
+        self.delay = min(self.max_delay, max(self.min_delay, delay))
+
+        if status_code in THROTTLE_STATUS_CODES:
+            logger.warning(f"Throttled with HTTP {status_code}, pacing requests {self.delay:.2f}s apart")
+
+    async def wait(self) -> float:
+        """Sleep until this caller's slot, ``delay`` after the previous one.
+
+        Returns:
+            float: Seconds slept
+        """
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed)
+            self._next_allowed = start + self.delay
+        delay = start - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+_rate_limiter: Optional[DomainRateLimiter] = None
+
+
+def get_rate_limiter() -> DomainRateLimiter:
+    """Get the process-wide domain rate limiter configured from settings."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        scraping = get_settings().scraping
+        _rate_limiter = DomainRateLimiter(
+            rate=scraping.domain_rate_limit,
+            burst=scraping.domain_burst,
+        )
+    return _rate_limiter
@@ -0,0 +1,320 @@
+"""
+Structured-data fast path for listing and detail pages.
+
+Many event sites embed schema.org ``Event`` data as JSON-LD or microdata.
+Reading it is far cheaper than the scrapers' DOM heuristics, and an event
+whose structured data already carries everything the transformers need does
+not require a detail page fetch at all.
+
+``extract_events`` returns the events of a page in the scrapers' raw
+listing format (title, date, time, location, link, ...). Dates are rendered
+as ``DD.MM.YYYY``, which every scraper's ``parse_date`` understands.
+``listing_events``, ``needs_detail`` and ``detail_fields`` apply the fast
+path and count per source how often it sufficed (``get_structured_data_stats``).
+Only listings read from structured data may skip their detail page; DOM
+listing cards rarely carry everything the detail page has.
+"""
+
+import json
+import logging
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, Tag
+
+logger = logging.getLogger(__name__)
+
+# Fields an event needs before its detail page is skipped
+COMPLETE_FIELDS = ("title", "date", "time", "location", "description")
+
+# Marks listing entries read from structured data (kept in the parsed-listing cache)
+STRUCTURED_LISTING_KEY = "from_structured_data"
+
+_ISO_DATETIME = re.compile(r"^(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2}))?")
+_MICRODATA_EVENT = re.compile(r"schema\.org/\w*(Event|Festival)\b")
+
+# Values of <a>, <img>, <meta>, ... microdata properties live in attributes
+_MICRODATA_ATTRIBUTES = {
+    "meta": "content",
+    "a": "href",
+    "link": "href",
+    "area": "href",
+    "img": "src",
+    "source": "src",
+    "video": "src",
+    "audio": "src",
+    "time": "datetime",
+    "data": "value",
+}
+
+
+def _types(node: Dict[str, Any]) -> List[str]:
+    types = node.get("@type") or node.get("itemtype") or []
+    if isinstance(types, str):
+        types = [types]
+    return [str(t).rsplit("/", 1)[-1] for t in types]
+
+
+def _is_event(node: Dict[str, Any]) -> bool:
+    # Includes subtypes such as MusicEvent and TheaterEvent
+    return any(t.endswith("Event") or t == "Festival" for t in _types(node))
+
+
+def _flatten(node: Any) -> Iterator[Dict[str, Any]]:
+    """Yield every object of a JSON-LD document, including @graph and list items."""
+    if isinstance(node, list):
+        for item in node:
+            yield from _flatten(item)
+    elif isinstance(node, dict):
+        yield node
+        yield from _flatten(node.get("@graph", []))
+        for element in node.get("itemListElement", None) or []:
+            if isinstance(element, dict):
+                yield from _flatten(element.get("item", element))
+
+
+def _json_ld_nodes(soup: BeautifulSoup) -> Iterator[Dict[str, Any]]:
+    for script in soup.find_all("script", type="application/ld+json"):
+        try:
+            document = json.loads(script.string or script.get_text())
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Skipping invalid JSON-LD: {e}")
+            continue
+        yield from _flatten(document)
+
+
+def _microdata_value(element: Tag) -> Any:
+    if element.has_attr("itemscope"):
+        return _microdata_item(element)
+    attribute = _MICRODATA_ATTRIBUTES.get(element.name)
+    if attribute and element.get(attribute):
+        return element[attribute]
+    return element.get("content") or element.get_text(" ", strip=True)
+
+
+def _microdata_item(scope: Tag) -> Dict[str, Any]:
+    """Read the properties of one microdata item, nested items as dicts."""
+    item: Dict[str, Any] = {"itemtype": scope.get("itemtype", "")}
+    for element in scope.find_all(attrs={"itemprop": True}):
+        # Properties of nested items belong to those items
+        if element.find_parent(attrs={"itemscope": True}) is not scope:
+            continue
+        for name in element["itemprop"].split():
+            item.setdefault(name, _microdata_value(element))
+    return item
+
+
+def _microdata_nodes(soup: BeautifulSoup) -> Iterator[Dict[str, Any]]:
+    for scope in soup.find_all(attrs={"itemscope": True, "itemtype": _MICRODATA_EVENT}):
+        # Events nested in another event (subEvent) are read as properties
+        if scope.find_parent(attrs={"itemscope": True, "itemtype": _MICRODATA_EVENT}):
+            continue
+        yield _microdata_item(scope)
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, list):
+        value = value[0] if value else ""
+    if isinstance(value, dict):
+        value = value.get("name") or value.get("url") or value.get("@id") or ""
+    return " ".join(str(value).split()) if value else ""
+
+
+def _url(value: Any) -> str:
+    if isinstance(value, list):
+        value = value[0] if value else ""
+    if isinstance(value, dict):
+        value = value.get("url") or value.get("contentUrl") or value.get("@id") or ""
+    return str(value).strip() if value else ""
+
+
+def _format_location(location: Any) -> str:
+    if isinstance(location, list):
+        location = location[0] if location else ""
+    if not isinstance(location, dict):
+        return _text(location)
+
+    parts = [_text(location.get("name"))]
+    address = location.get("address")
+    if isinstance(address, dict):
+        parts += [
+            _text(address.get("streetAddress")),
+            " ".join(filter(None, [_text(address.get("postalCode")), _text(address.get("addressLocality"))])),
+        ]
+    else:
+        parts.append(_text(address))
+    return ", ".join(dict.fromkeys(part for part in parts if part))
+
+
+def _format_price(offers: Any) -> str:
+    if isinstance(offers, list):
+        offers = offers[0] if offers else ""
+    if not isinstance(offers, dict):
+        return _text(offers)
+    price = _text(offers.get("price") or offers.get("lowPrice"))
+    if not price:
+        return ""
+    return f"{price} {_text(offers.get('priceCurrency'))}".strip()
+
+
+def _split_datetime(value: Any) -> Dict[str, str]:
+    value = _text(value)
+    match = _ISO_DATETIME.match(value)
+    if not match:
+        return {"date": value} if value else {}
+    year, month, day, hour, minute = match.groups()
+    fields = {"date": f"{int(day)}.{int(month)}.{year}"}
+    if hour is not None and (hour, minute) != ("00", "00"):
+        fields["time"] = f"{hour}:{minute}"
+    return fields
+
+
+def _event_fields(node: Dict[str, Any], base_url: Optional[str]) -> Dict[str, Any]:
+    """Map a schema.org Event to the scrapers' raw event fields."""
+    start = _split_datetime(node.get("startDate"))
+    fields = {
+        "title": _text(node.get("name")),
+        "description": _text(node.get("description")),
+        "date": start.get("date", ""),
+        "time": start.get("time", ""),
+        "location": _format_location(node.get("location")),
+        "link": _url(node.get("url")),
+        "image": _url(node.get("image")),
+        "price": _format_price(node.get("offers")),
+    }
+    if base_url:
+        for key in ("link", "image"):
+            if fields[key]:
+                fields[key] = urljoin(base_url, fields[key])
+    return {key: value for key, value in fields.items() if value}
+
+
+def extract_events(soup: BeautifulSoup, base_url: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Extract schema.org events from JSON-LD and microdata.
+
+    Args:
+        soup: Parsed page
+        base_url: URL relative links and images are resolved against
+
+    Returns:
+        Raw event dicts with at least a title or link, in page order
+    """
+    events = []
+    seen = set()
+    for node in [*_json_ld_nodes(soup), *_microdata_nodes(soup)]:
+        if not _is_event(node):
+            continue
+        fields = _event_fields(node, base_url)
+        key = (fields.get("link"), fields.get("title"), fields.get("date"))
+        if not (fields.get("title") or fields.get("link")) or key in seen:
+            continue
+        seen.add(key)
+        events.append(fields)
+    return events
+
+
+def is_complete(event: Dict[str, Any]) -> bool:
+    """Whether an event has every field its detail page would provide."""
+    return all(event.get(field) for field in COMPLETE_FIELDS)
+
+
+class StructuredDataStats:
+    """Per-source counters of how often structured data sufficed."""
+
+    def __init__(self):
+        self._counts: Dict[str, Counter] = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def record(self, source: str, key: str, count: int = 1) -> None:
+        with self._lock:
+            self._counts[source][key] += count
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Counters per source, with the share of pages and events served by the fast path."""
+        with self._lock:
+            counts = {source: dict(counter) for source, counter in self._counts.items()}
+
+        for counter in counts.values():
+            listing_pages = counter.get("listing_pages", 0)
+            detail_candidates = counter.get("details_skipped", 0) + counter.get("detail_pages", 0)
+            detail_served = counter.get("details_skipped", 0) + counter.get("detail_hits", 0)
+            counter["listing_hit_rate"] = counter.get("listing_hits", 0) / listing_pages if listing_pages else 0.0
+            counter["detail_hit_rate"] = detail_served / detail_candidates if detail_candidates else 0.0
+        return counts
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+_stats = StructuredDataStats()
+
+
+def get_structured_data_stats() -> Dict[str, Dict[str, Any]]:
+    """Fast path counters per source since process start."""
+    return _stats.snapshot()
+
+
+def listing_events(
+    soup: BeautifulSoup, source: str, base_url: str, container_count: int = 0
+) -> Optional[List[Dict[str, Any]]]:
+    """Get the listing entries of a page from its structured data.
+
+    Structured data is used only if it covers at least as many events as the
+    DOM containers found on the page, so a page that marks up just a
+    featured event still goes through the DOM parser.
+
+    Args:
+        soup: Parsed listing page
+        source: Source name for the fast path statistics
+        base_url: URL of the page
+        container_count: Number of event containers found in the DOM
+
+    Returns:
+        Listing entries marked with ``STRUCTURED_LISTING_KEY``, or None when
+        the DOM has to be parsed
+    """
+    events = extract_events(soup, base_url)
+    _stats.record(source, "listing_pages")
+    if not events or len(events) < container_count:
+        return None
+    _stats.record(source, "listing_hits")
+    logger.debug(f"{source}: {len(events)} events read from structured data")
+    return [{**event, STRUCTURED_LISTING_KEY: True} for event in events]
+
+
+def needs_detail(listing: Dict[str, Any], source: str) -> bool:
+    """Whether an event's detail page still has to be fetched.
+
+    Only complete entries from ``listing_events`` skip it; listings parsed
+    from the DOM always need their detail page.
+    """
+    if listing.get(STRUCTURED_LISTING_KEY) and is_complete(listing):
+        _stats.record(source, "details_skipped")
+        return False
+    return True
+
+
+def detail_fields(soup: BeautifulSoup, source: str, base_url: str) -> Dict[str, Any]:
+    """Read an event detail page's structured data.
+
+    Callers return the result as is when ``is_complete`` holds, and otherwise
+    fill only its missing fields from their selectors.
+
+    Args:
+        soup: Parsed detail page
+        source: Source name for the fast path statistics
+        base_url: URL of the page
+
+    Returns:
+        Raw fields of the page's first event, empty without structured data
+    """
+    events = extract_events(soup, base_url)
+    fields = events[0] if events else {}
+    _stats.record(source, "detail_pages")
+    if is_complete(fields):
+        _stats.record(source, "detail_hits")
+    return fields
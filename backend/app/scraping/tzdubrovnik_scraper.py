@@ -12,6 +12,9 @@ import httpx
 from bs4 import BeautifulSoup
 
 from backend.app.models.schemas import EventCreate
+from app.scraping.browser_pool import get_browser_pool
+from app.scraping.html_parser import parse_html
+from app.scraping.http_client import http_get
 
 # Import configuration
 from backend.app.config.components import get_settings
@@ -270,29 +273,11 @@ class DubrovnikTransformer:
 class DubrovnikRequestsScraper:
     """Fallback scraper using httpx and BeautifulSoup."""
 
-    def __init__(self) -> None:
-        if USE_PROXY and not USE_SB:
-            self.client = httpx.AsyncClient(
-                headers=HEADERS,
-                proxies={"http": PROXY, "https": PROXY},
-                verify=False,
-            )
-        else:
-            self.client = httpx.AsyncClient(headers=HEADERS)
-
     async def fetch(self, url: str) -> httpx.Response:
         """Fetch URL with optional proxy."""
-        if USE_SB and USE_PROXY:
-            params = {"url": url}
-            resp = await self.client.get(
-                SCRAPING_BROWSER_EP,
-                params=params,
-                auth=(USER, PASSWORD),
-                timeout=30,
-                verify=False,
-            )
-        else:
-            resp = await self.client.get(url, timeout=30)
+        resp = await http_get(
+            url, headers=HEADERS, use_proxy=USE_PROXY, use_scraping_browser=USE_SB, timeout=30
+        )
         resp.raise_for_status()
         return resp
 
@@ -300,7 +285,7 @@ class DubrovnikRequestsScraper:
         """Scrape the static calendar page with enhanced address extraction."""
         try:
             resp = await self.fetch(EVENTS_URL)
-            soup = BeautifulSoup(resp.text, "html.parser")
+            soup = parse_html(resp.text)
             
             events = []
             # Look for any statically rendered events
@@ -377,8 +362,8 @@ class DubrovnikRequestsScraper:
             return []
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Kept for API compatibility; the shared HTTP client stays open."""
+        return None
 
 
 class DubrovnikPlaywrightScraper:
@@ -469,29 +454,14 @@ class DubrovnikPlaywrightScraper:
     async def scrape_with_playwright(self, months_ahead: int = 6, fetch_details: bool = False) -> List[Dict]:
         """Scrape events using Playwright for calendar interaction."""
         try:
-            from playwright.async_api import async_playwright
-            
             all_events = []
             
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--no-sandbox',
-                        '--disable-dev-shm-usage',
-                        '--disable-web-security',
-                    ]
-                )
-                
-                context = await browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-                    locale='hr-HR',
-                    timezone_id='Europe/Zagreb',
-                )
-                
-                page = await context.new_page()
-                
+            async with get_browser_pool().page(
+                viewport={'width': 1920, 'height': 1080},
+                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+                locale='hr-HR',
+                timezone_id='Europe/Zagreb',
+            ) as page:
                 try:
                     logger.info(f"Navigating to {EVENTS_URL}")
                     await page.goto(EVENTS_URL, wait_until="networkidle", timeout=30000)
@@ -574,8 +544,6 @@ class DubrovnikPlaywrightScraper:
                     
                 except Exception as e:
                     logger.error(f"Error during calendar scraping: {e}")
-                
-                await browser.close()
             
             return all_events
             
@@ -728,52 +696,18 @@ class DubrovnikScraper:
         return events
 
     def save_events_to_database(self, events: List[EventCreate]) -> int:
-        """Save events to database with deduplication."""
-        from sqlalchemy import select, tuple_
+        """Upsert events through the shared ingestion service.
 
-        from backend.app.core.database import SessionLocal
-        from backend.app.models.event import Event
+        Returns:
+            int: Number of events inserted or updated
+        """
+        from backend.app.core.event_ingestion import ingest_events
 
         if not events:
             return 0
 
-        db = SessionLocal()
-        try:
-            event_dicts = [e.model_dump() for e in events]
-            pairs = [(e["title"], e["date"]) for e in event_dicts]
-            existing = db.execute(
-                select(Event.title, Event.date).where(tuple_(Event.title, Event.date).in_(pairs))
-            ).all()
-            existing_pairs = set(existing)
-            to_insert = [e for e in event_dicts if (e["title"], e["date"]) not in existing_pairs]
-            
-            saved_count = 0
-            if to_insert:
-                # Insert events individually to handle any constraint issues
-                for event_data in to_insert:
-                    try:
-                        event = Event(**event_data)
-                        db.add(event)
-                        db.flush()  # Get the ID without committing
-                        saved_count += 1
-                    except Exception as e:
-                        # Skip duplicate or invalid events
-                        db.rollback()
-                        logger.warning(f"Skipping event {event_data.get('title', 'Unknown')}: {e}")
-                        # Continue with the next event
-                        continue
-                
-                db.commit()
-                return saved_count
-            
-            db.commit()
-            return 0
-        except Exception as e:
-            db.rollback()
-            logger.error(f"Database error in Dubrovnik scraper: {e}")
-            raise
-        finally:
-            db.close()
+        stats = ingest_events(events)
+        return stats["inserted"] + stats["updated"]
 
 
 async def scrape_tzdubrovnik_events(months_ahead: int = 6, fetch_details: bool = False) -> Dict:
@@ -9,13 +9,13 @@ from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import httpx
-import requests
-from bs4 import BeautifulSoup, Tag
-from sqlalchemy.dialects.postgresql import insert
+from bs4 import Tag
 
-from backend.app.core.database import SessionLocal
-from backend.app.models.event import Event
+from backend.app.core.event_ingestion import ingest_events
 from backend.app.models.schemas import EventCreate
+from app.scraping.browser_pool import get_browser_pool
+from app.scraping.html_parser import parse_html
+from app.scraping.http_client import http_get
 
 # BrightData configuration (same as other scrapers)
 USER = os.getenv("BRIGHTDATA_USER", "demo_user")
@@ -208,64 +208,20 @@ class UlazniceScraper:
     """Enhanced scraper for https://www.ulaznice.hr/web/events with Playwright support"""
 
     def __init__(self) -> None:
-        self.session = requests.Session()
         self.playwright_scraper = UlaznicePlaywrightScraper()
         self.transformer = UlazniceDataTransformer()
 
     async def fetch_async(self, url: str) -> httpx.Response:
         try:
-            if USE_SB and USE_PROXY:
-                params = {"url": url}
-                async with httpx.AsyncClient(
-                    headers=HEADERS, auth=(USER, PASSWORD), verify=False
-                ) as client:
-                    resp = await client.get(
-                        SCRAPING_BROWSER_EP, params=params, timeout=30
-                    )
-            elif USE_PROXY:
-                async with httpx.AsyncClient(
-                    headers=HEADERS,
-                    proxies={"http": PROXY, "https": PROXY},
-                    verify=False,
-                ) as client:
-                    resp = await client.get(url, timeout=30)
-            else:
-                async with httpx.AsyncClient(headers=HEADERS) as client:
-                    resp = await client.get(url, timeout=30)
+            resp = await http_get(
+                url, headers=HEADERS, use_proxy=USE_PROXY, use_scraping_browser=USE_SB, timeout=30
+            )
             resp.raise_for_status()
             return resp
         except httpx.HTTPError as e:
             logger.error(f"Request failed for {url}: {e}")
             raise
 
-    def fetch(self, url: str) -> requests.Response:
-        try:
-            if USE_SB and USE_PROXY:
-                params = {"url": url}
-                resp = self.session.get(
-                    SCRAPING_BROWSER_EP,
-                    params=params,
-                    headers=HEADERS,
-                    auth=(USER, PASSWORD),
-                    timeout=30,
-                    verify=False,
-                )
-            elif USE_PROXY:
-                resp = self.session.get(
-                    url,
-                    headers=HEADERS,
-                    proxies={"http": PROXY, "https": PROXY},
-                    timeout=30,
-                    verify=False,
-                )
-            else:
-                resp = self.session.get(url, headers=HEADERS, timeout=30)
-            resp.raise_for_status()
-            return resp
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed for {url}: {e}")
-            raise
-
     def parse_event_from_element(self, elem: Tag) -> Dict:
         data: Dict[str, str] = {}
         try:
@@ -367,7 +323,7 @@ class UlazniceScraper:
     async def scrape_events_page(self, url: str) -> Tuple[List[Dict], Optional[str]]:
         logger.info(f"Fetching {url}")
         resp = await self.fetch_async(url)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = parse_html(resp.text)
         events: List[Dict] = []
 
         # Enhanced selector strategy based on MCP investigation
@@ -486,35 +442,16 @@ class UlazniceScraper:
         return all_events
 
     def save_events_to_database(self, events: List[EventCreate]) -> int:
+        """Upsert events through the shared ingestion service.
+
+        Returns:
+            int: Number of events inserted or updated
+        """
         if not events:
             return 0
-        db = SessionLocal()
-        try:
-            event_dicts = [e.model_dump() for e in events]
-            existing_pairs = set(
-                db.execute(
-                    insert(Event)
-                    .returning(Event.title, Event.date)
-                    .on_conflict_do_nothing()
-                ).fetchall()
-            )
-            to_insert = [
-                e for e in event_dicts if (e["title"], e["date"]) not in existing_pairs
-            ]
-            if to_insert:
-                stmt = insert(Event).values(to_insert)
-                stmt = stmt.on_conflict_do_nothing(index_elements=["title", "date"])
-                db.execute(stmt)
-                db.commit()
-                return len(to_insert)
-            db.commit()
-            return 0
-        except Exception as e:
-            logger.error(f"Error saving events: {e}")
-            db.rollback()
-            raise
-        finally:
-            db.close()
+
+        stats = ingest_events(events)
+        return stats["inserted"] + stats["updated"]
 
 
 class UlaznicePlaywrightScraper:
@@ -585,30 +522,13 @@ class UlaznicePlaywrightScraper:
     async def scrape_with_playwright(self, start_url: str = "https://www.ulaznice.hr/web/events", max_pages: int = 5, fetch_details: bool = False) -> List[Dict]:
         """Scrape events using Playwright with enhanced address extraction."""
         try:
-            from playwright.async_api import async_playwright
-            
             all_events = []
             
-            async with async_playwright() as p:
-                # Configure browser
-                if USE_PROXY:
-                    # Use proxy configuration
-                    browser = await p.chromium.launch(
-                        headless=True,
-                        proxy={
-                            "server": PROXY
-                        }
-                    )
-                else:
-                    browser = await p.chromium.launch(headless=True)
-                
-                context = await browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-                )
-                
-                page = await context.new_page()
-                
+            async with get_browser_pool().page(
+                proxy=PROXY if USE_PROXY else None,
+                viewport={'width': 1920, 'height': 1080},
+                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            ) as page:
                 try:
                     logger.info(f"Navigating to {start_url}")
                     await page.goto(start_url, wait_until="domcontentloaded", timeout=30000)
@@ -770,8 +690,6 @@ class UlaznicePlaywrightScraper:
                     
                 except Exception as e:
                     logger.error(f"Error during scraping: {e}")
-                
-                await browser.close()
             
             return all_events
             
@@ -11,11 +11,16 @@ from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
 # Temporarily disabled until OpenAI dependency is added
 # from backend.app.core.llm_location_service import llm_location_service
 from backend.app.models.schemas import EventCreate
+from app.scraping.browser_pool import get_browser_pool
+from app.scraping.html_parser import parse_html
+from app.scraping.http_client import http_get
+from app.scraping.incremental import drop_known_listings
+from app.scraping.structured_data import detail_fields, is_complete, listing_events, needs_detail
 
 # BrightData configuration (shared across scrapers)
 USER = os.getenv("BRIGHTDATA_USER", "demo_user")
@@ -309,29 +314,11 @@ class VisitOpatijaTransformer:
 class VisitOpatijaRequestsScraper:
     """Scraper using httpx with optional BrightData proxy."""
 
-    def __init__(self) -> None:
-        self.client = httpx.AsyncClient(headers=HEADERS)
-
     async def fetch(self, url: str) -> httpx.Response:
         try:
-            if USE_SB and USE_PROXY:
-                params = {"url": url}
-                async with httpx.AsyncClient(
-                    headers=HEADERS, auth=(USER, PASSWORD), verify=False
-                ) as client:
-                    resp = await client.get(
-                        SCRAPING_BROWSER_EP, params=params, timeout=30
-                    )
-            elif USE_PROXY:
-                async with httpx.AsyncClient(
-                    headers=HEADERS,
-                    proxies={"http": PROXY, "https": PROXY},
-                    verify=False,
-                ) as client:
-                    resp = await client.get(url, timeout=30)
-            else:
-                async with httpx.AsyncClient(headers=HEADERS) as client:
-                    resp = await client.get(url, timeout=30)
+            resp = await http_get(
+                url, headers=HEADERS, use_proxy=USE_PROXY, use_scraping_browser=USE_SB, timeout=30
+            )
             resp.raise_for_status()
             return resp
         except httpx.HTTPError as e:
@@ -341,7 +328,7 @@ class VisitOpatijaRequestsScraper:
         """Fetch detailed address information from individual event page."""
         try:
             resp = await self.fetch(url)
-            soup = BeautifulSoup(resp.text, "html.parser")
+            soup = parse_html(resp.text)
             details = {}
             
             # Get full page text for comprehensive analysis
@@ -415,7 +402,13 @@ class VisitOpatijaRequestsScraper:
     async def parse_event_detail(self, url: str) -> Dict:
         """Enhanced parse_event_detail with comprehensive address pattern detection."""
         resp = await self.fetch(url)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = parse_html(resp.text)
+
+        # Selectors only fill in what the page's structured data lacks
+        structured = detail_fields(soup, "visitopatija", url)
+        if is_complete(structured):
+            return structured
+
         data: Dict[str, str] = {}
 
         # Get full page text for comprehensive analysis
@@ -504,7 +497,7 @@ class VisitOpatijaRequestsScraper:
                     data["venue"] = venue_match.group(1).strip()
                     break
 
-        return data
+        return {**data, **structured}
 
     def parse_listing_element(self, el: Tag) -> Dict:
         data: Dict[str, str] = {}
@@ -612,7 +605,7 @@ class VisitOpatijaRequestsScraper:
 
     async def scrape_events_page(self, url: str) -> Tuple[List[Dict], Optional[str]]:
         resp = await self.fetch(url)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = parse_html(resp.text)
 
         events: List[Dict] = []
         containers: List[Tag] = []
@@ -625,18 +618,20 @@ class VisitOpatijaRequestsScraper:
                 logger.info(f"Found {len(found)} events using selector: {sel}")
                 break
 
-        for el in containers:
-            if isinstance(el, Tag):
-                data = self.parse_listing_element(el)
-                link = data.get("link")
-                if link:
-                    try:
-                        detail = await self.parse_event_detail(link)
-                        data.update({k: v for k, v in detail.items() if v})
-                    except Exception:
-                        pass
-                if data:
-                    events.append(data)
+        # Structured data covering the whole page replaces the DOM heuristics
+        listings = listing_events(soup, "visitopatija", url, len(containers)) or [
+            self.parse_listing_element(el) for el in containers if isinstance(el, Tag)
+        ]
+        for data in await drop_known_listings(listings):
+            link = data.get("link")
+            if link and needs_detail(data, "visitopatija"):
+                try:
+                    detail = await self.parse_event_detail(link)
+                    data.update({k: v for k, v in detail.items() if v})
+                except Exception:
+                    pass
+            if data:
+                events.append(data)
 
         next_url = None
         next_link = soup.select_one('a[rel="next"], .pagination-next a, a.next')
@@ -660,7 +655,8 @@ class VisitOpatijaRequestsScraper:
         return all_events
 
     async def close(self) -> None:
-        await self.client.aclose()
+        """Kept for API compatibility; the shared HTTP client stays open."""
+        return None
 
 
 class VisitOpatijaPlaywrightScraper:
@@ -750,27 +746,13 @@ class VisitOpatijaPlaywrightScraper:
     async def scrape_with_playwright(self, start_url: str = EVENTS_URL, max_pages: int = 5, fetch_details: bool = False) -> List[Dict]:
         """Scrape events using Playwright with enhanced address extraction."""
         try:
-            from playwright.async_api import async_playwright
-            
             all_events = []
             
-            async with async_playwright() as p:
-                # Configure browser
-                if USE_PROXY:
-                    browser = await p.chromium.launch(
-                        headless=True,
-                        proxy={"server": PROXY}
-                    )
-                else:
-                    browser = await p.chromium.launch(headless=True)
-                
-                context = await browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-                )
-                
-                page = await context.new_page()
-                
+            async with get_browser_pool().page(
+                proxy=PROXY if USE_PROXY else None,
+                viewport={'width': 1920, 'height': 1080},
+                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            ) as page:
                 try:
                     logger.info(f"Navigating to {start_url}")
                     await page.goto(start_url, wait_until="domcontentloaded", timeout=30000)
@@ -927,8 +909,6 @@ class VisitOpatijaPlaywrightScraper:
                     
                 except Exception as e:
                     logger.error(f"Error during scraping: {e}")
-                
-                await browser.close()
             
             return all_events
             
@@ -1012,68 +992,18 @@ class VisitOpatijaScraper:
         return all_events
 
     def save_events_to_database(self, events: List[EventCreate]) -> int:
-        """Insert events using individual Event creation and return number of new rows."""
-        if not events:
-            return 0
-
-        from backend.app.core.database import SessionLocal
-        from backend.app.models.event import Event
-        from sqlalchemy import select, tuple_
+        """Upsert events through the shared ingestion service.
 
-        db = SessionLocal()
+        Returns:
+            int: Number of events inserted or updated
+        """
+        from backend.app.core.event_ingestion import ingest_events
 
-        try:
-            # Prepare incoming data for database
-            event_dicts = []
-            for e in events:
-                event_dict = e.model_dump()
-                # Remove id field as it's auto-generated by database
-                event_dict.pop("id", None)
-                event_dicts.append(event_dict)
-            
-            pairs = [(e["title"], e["date"]) for e in event_dicts]
-
-            # Fetch all existing events for these (title, date) pairs
-            existing = db.execute(
-                select(Event.title, Event.date).where(
-                    tuple_(Event.title, Event.date).in_(pairs)
-                )
-            ).all()
-            existing_pairs = set(existing)
-
-            # Filter to only new events
-            to_insert = [
-                e for e in event_dicts if (e["title"], e["date"]) not in existing_pairs
-            ]
-
-            if to_insert:
-                # Insert each event individually to avoid bulk insert mapping issues
-                saved_count = 0
-                for event_data in to_insert:
-                    try:
-                        # Create Event object directly
-                        event = Event(**event_data)
-                        db.add(event)
-                        db.flush()  # Get the ID without committing
-                        saved_count += 1
-                    except Exception as e:
-                        # Skip duplicate or invalid events
-                        db.rollback()
-                        logger.debug(f"Skipping event {event_data.get('title', 'Unknown')}: {e}")
-                        continue
-                
-                db.commit()
-                return saved_count
-
-            db.commit()
+        if not events:
             return 0
 
-        except Exception as e:
-            logger.error(f"Error saving events to database: {e}")
-            db.rollback()
-            raise
-        finally:
-            db.close()
+        stats = ingest_events(events)
+        return stats["inserted"] + stats["updated"]
 
 
 async def scrape_visitopatija_events(max_pages: int = 5, fetch_details: bool = False) -> Dict:
@@ -12,7 +12,11 @@ from urllib.parse import urljoin
 import httpx
 from bs4 import BeautifulSoup, Tag
 
+from backend.app.core.croatian_geo_db import croatian_geo_db
 from backend.app.models.schemas import EventCreate
+from app.scraping.browser_pool import get_browser_pool
+from app.scraping.html_parser import parse_html
+from app.scraping.http_client import http_get
 
 # BrightData configuration (reused from other scrapers)
 USER = os.getenv("BRIGHTDATA_USER", "demo_user")
@@ -171,25 +175,9 @@ class VisitSplitDataTransformer:
                 result["detected_address"] = potential_address
         
         # Pattern 3: Enhanced Split-specific venue recognition
-        split_venues = [
-            # Historic and cultural venues
-            "Trg Peristil", "Podrumi Dioklecijanove palače", "HNK Split", "Galerija umjetnina",
-            "Muzej grada Splita", "Arheološki muzej Split", "Etnografski muzej Split",
-            "Gradska knjižnica Split", "Dom mladih Split", "Kino Zlatna vrata",
-            "Kulturni centar Split", "Prokurative", "Riva Split", "Marjan",
-            "Culture HUB Croatia", "Diocletian's Palace", "Split Park Festival",
-            # Additional Split venues discovered
-            "Kino Centaurus", "Art paviljon", "Galerija Kula", "Muzej hrvatskih arheoloških spomenika",
-            "Umjetnička galerija Split", "Gradski muzej Split", "Split City Museum",
-            "Dioklecijan's Palace", "Peristyle", "Cathedral of Saint Domnius",
-            "Bacvice Beach", "Poljud Stadium", "Spaladium Arena"
-        ]
-        
-        for venue in split_venues:
-            if venue in text:
-                if not result.get("venue"):
-                    result["venue"] = venue
-                break
+        venue = croatian_geo_db.find_venue(text, city="Split")
+        if venue and not result.get("venue"):
+            result["venue"] = venue.name
         
         # Pattern 4: Enhanced Croatian address patterns for Split region
         address_patterns = [
@@ -272,9 +260,6 @@ class VisitSplitDataTransformer:
 class VisitSplitRequestsScraper:
     """Scraper using httpx with optional BrightData proxy."""
 
-    def __init__(self) -> None:
-        self.client = httpx.AsyncClient(headers=HEADERS)
-
     def generate_monthly_urls(self, start_date: Optional[datetime] = None) -> List[str]:
         """Generate URLs for 12 months starting from the given date."""
         if start_date is None:
@@ -310,16 +295,9 @@ class VisitSplitRequestsScraper:
         
         for attempt in range(max_retries):
             try:
-                if USE_SB and USE_PROXY:
-                    params = {"url": url}
-                    async with httpx.AsyncClient(headers=HEADERS, auth=(USER, PASSWORD), verify=False) as client:
-                        resp = await client.get(SCRAPING_BROWSER_EP, params=params, timeout=30)
-                elif USE_PROXY:
-                    async with httpx.AsyncClient(headers=HEADERS, proxies={"http": PROXY, "https": PROXY}, verify=False) as client:
-                        resp = await client.get(url, timeout=30)
-                else:
-                    async with httpx.AsyncClient(headers=HEADERS) as client:
-                        resp = await client.get(url, timeout=30)
+                resp = await http_get(
+                    url, headers=HEADERS, use_proxy=USE_PROXY, use_scraping_browser=USE_SB, timeout=30
+                )
                 resp.raise_for_status()
                 return resp
                 
@@ -338,7 +316,7 @@ class VisitSplitRequestsScraper:
         """Fetch detailed address information from individual event page."""
         try:
             resp = await self.fetch(event_url)
-            soup = BeautifulSoup(resp.text, "html.parser")
+            soup = parse_html(resp.text)
             details = {}
             
             # Extract enhanced location information from event detail page
@@ -372,23 +350,9 @@ class VisitSplitRequestsScraper:
                         break
             
             # Extract Split-specific venue information
-            split_venues = [
-                # Historic and cultural venues
-                "Trg Peristil", "Podrumi Dioklecijanove palače", "HNK Split", "Galerija umjetnina",
-                "Muzej grada Splita", "Arheološki muzej Split", "Etnografski muzej Split",
-                "Gradska knjižnica Split", "Dom mladih Split", "Kino Zlatna vrata",
-                "Kulturni centar Split", "Prokurative", "Riva Split", "Marjan",
-                "Culture HUB Croatia", "Diocletian's Palace", "Split Park Festival",
-                # Additional Split venues
-                "Kino Centaurus", "Art paviljon", "Galerija Kula", "Muzej hrvatskih arheoloških spomenika",
-                "Umjetnička galerija Split", "Gradski muzej Split", "Split City Museum",
-                "Dioklecijan's Palace", "Peristyle", "Cathedral of Saint Domnius"
-            ]
-            
-            for venue in split_venues:
-                if venue in page_text and not details.get("venue"):
-                    details["venue"] = venue
-                    break
+            venue = croatian_geo_db.find_venue(page_text, city="Split")
+            if venue and not details.get("venue"):
+                details["venue"] = venue.name
             
             # Ensure Split is recognized as city
             if "Split" in page_text and not details.get("city"):
@@ -405,7 +369,7 @@ class VisitSplitRequestsScraper:
 
     async def parse_event_detail(self, url: str) -> Dict:
         resp = await self.fetch(url)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = parse_html(resp.text)
         data: Dict[str, str] = {}
 
         title_el = soup.select_one("h1")
@@ -540,21 +504,9 @@ class VisitSplitRequestsScraper:
                         data["time"] = time_match.group(1).strip()
                 
                 # Look for Split-specific venues in description
-                split_venues = [
-                    # Historic and cultural venues  
-                    "Trg Peristil", "Podrumi Dioklecijanove palače", "HNK Split", "Galerija umjetnina",
-                    "Muzej grada Splita", "Arheološki muzej Split", "Etnografski muzej Split",
-                    "Gradska knjižnica Split", "Dom mladih Split", "Kino Zlatna vrata",
-                    "Kulturni centar Split", "Prokurative", "Riva Split", "Marjan",
-                    "Culture HUB Croatia", "Diocletian's Palace", "Split Park Festival",
-                    # Additional Split venues
-                    "Kino Centaurus", "Art paviljon", "Galerija Kula"
-                ]
-                
-                for venue in split_venues:
-                    if venue in desc_text and not data.get("venue"):
-                        data["venue"] = venue
-                        break
+                venue = croatian_geo_db.find_venue(desc_text, city="Split")
+                if venue and not data.get("venue"):
+                    data["venue"] = venue.name
                 
                 # Apply general Croatian address pattern detection
                 if not data.get("detected_address"):
@@ -589,7 +541,7 @@ class VisitSplitRequestsScraper:
         """Scrape events from calendar page structure."""
         try:
             resp = await self.fetch(url)
-            soup = BeautifulSoup(resp.text, "html.parser")
+            soup = parse_html(resp.text)
 
             events: List[Dict] = []
             
@@ -713,7 +665,8 @@ class VisitSplitRequestsScraper:
         return await self.scrape_12_months_events()
 
     async def close(self) -> None:
-        await self.client.aclose()
+        """Kept for API compatibility; the shared HTTP client stays open."""
+        return None
 
 
 class VisitSplitPlaywrightScraper:
@@ -815,27 +768,13 @@ class VisitSplitPlaywrightScraper:
     async def scrape_with_playwright(self, start_url: str = None, max_pages: int = 5, fetch_details: bool = False) -> List[Dict]:
         """Scrape events using Playwright with enhanced calendar navigation and address extraction."""
         try:
-            from playwright.async_api import async_playwright
-            
             all_events = []
             
-            async with async_playwright() as p:
-                # Configure browser with proxy if needed
-                if USE_PROXY:
-                    browser = await p.chromium.launch(
-                        headless=True,
-                        proxy={"server": PROXY}
-                    )
-                else:
-                    browser = await p.chromium.launch(headless=True)
-                
-                context = await browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-                )
-                
-                page = await context.new_page()
-                
+            async with get_browser_pool().page(
+                proxy=PROXY if USE_PROXY else None,
+                viewport={'width': 1920, 'height': 1080},
+                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            ) as page:
                 try:
                     # Start with main events page or generate monthly URLs
                     base_url = start_url or f"{BASE_URL}/hr/434/dogadanja"
@@ -1015,8 +954,6 @@ class VisitSplitPlaywrightScraper:
                     
                 except Exception as e:
                     logger.error(f"Error during scraping: {e}")
-                
-                await browser.close()
             
             return all_events
             
@@ -1110,37 +1047,18 @@ class VisitSplitScraper:
         return all_events
 
     def save_events_to_database(self, events: List[EventCreate]) -> int:
-        from sqlalchemy import select, tuple_
-        from sqlalchemy.dialects.postgresql import insert
+        """Upsert events through the shared ingestion service.
 
-        from backend.app.core.database import SessionLocal
-        from backend.app.models.event import Event
+        Returns:
+            int: Number of events inserted or updated
+        """
+        from backend.app.core.event_ingestion import ingest_events
 
         if not events:
             return 0
 
-        db = SessionLocal()
-        try:
-            event_dicts = [e.model_dump() for e in events]
-            pairs = [(e["title"], e["date"]) for e in event_dicts]
-            existing = db.execute(
-                select(Event.title, Event.date).where(tuple_(Event.title, Event.date).in_(pairs))
-            ).all()
-            existing_pairs = set(existing)
-            to_insert = [e for e in event_dicts if (e["title"], e["date"]) not in existing_pairs]
-            if to_insert:
-                stmt = insert(Event).values(to_insert)
-                # Note: No unique constraint exists on title+date, so we'll insert without conflict handling
-                db.execute(stmt)
-                db.commit()
-                return len(to_insert)
-            db.commit()
-            return 0
-        except Exception:
-            db.rollback()
-            raise
-        finally:
-            db.close()
+        stats = ingest_events(events)
+        return stats["inserted"] + stats["updated"]
 
 
 async def scrape_visitsplit_events(max_pages: int = 5, use_playwright: bool = True, fetch_details: bool = False) -> Dict:
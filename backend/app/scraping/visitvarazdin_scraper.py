@@ -10,9 +10,14 @@ from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
 from backend.app.models.schemas import EventCreate
+from app.scraping.browser_pool import get_browser_pool
+from app.scraping.html_parser import parse_html
+from app.scraping.http_client import http_get
+from app.scraping.incremental import drop_known_listings
+from app.scraping.structured_data import detail_fields, is_complete, listing_events, needs_detail
 
 # Import configuration
 from backend.app.config.components import get_settings
@@ -269,34 +274,22 @@ class VisitVarazdinDataTransformer:
 class VisitVarazdinRequestsScraper:
     """Scraper using httpx and BeautifulSoup with optional Bright Data proxy."""
 
-    def __init__(self) -> None:
-        if USE_PROXY and not USE_SB:
-            self.client = httpx.AsyncClient(
-                headers=HEADERS,
-                proxies={"http": PROXY, "https": PROXY},
-                verify=False,
-            )
-        else:
-            self.client = httpx.AsyncClient(headers=HEADERS)
-
     async def fetch(self, url: str) -> httpx.Response:
-        if USE_SB and USE_PROXY:
-            params = {"url": url}
-            resp = await self.client.get(
-                SCRAPING_BROWSER_EP,
-                params=params,
-                auth=(USER, PASSWORD),
-                timeout=30,
-                verify=False,
-            )
-        else:
-            resp = await self.client.get(url, timeout=30)
+        resp = await http_get(
+            url, headers=HEADERS, use_proxy=USE_PROXY, use_scraping_browser=USE_SB, timeout=30
+        )
         resp.raise_for_status()
         return resp
 
     async def parse_event_detail(self, url: str) -> Dict:
         resp = await self.fetch(url)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = parse_html(resp.text)
+
+        # Selectors only fill in what the page's structured data lacks
+        structured = detail_fields(soup, "visitvarazdin", url)
+        if is_complete(structured):
+            return structured
+
         data: Dict[str, str] = {}
 
         title_el = soup.select_one("h1")
@@ -338,7 +331,7 @@ class VisitVarazdinRequestsScraper:
         if price_el:
             data["price"] = price_el.get_text(strip=True)
 
-        return data
+        return {**data, **structured}
 
     def parse_listing_element(self, el: Tag) -> Dict:
         data: Dict[str, str] = {}
@@ -374,7 +367,7 @@ class VisitVarazdinRequestsScraper:
 
     async def scrape_events_page(self, url: str) -> Tuple[List[Dict], Optional[str]]:
         resp = await self.fetch(url)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = parse_html(resp.text)
 
         events: List[Dict] = []
         containers: List[Tag] = []
@@ -385,18 +378,20 @@ class VisitVarazdinRequestsScraper:
                 containers = found
                 break
 
-        for el in containers:
-            if isinstance(el, Tag):
-                data = self.parse_listing_element(el)
-                link = data.get("link")
-                if link:
-                    try:
-                        detail = await self.parse_event_detail(link)
-                        data.update({k: v for k, v in detail.items() if v})
-                    except Exception:
-                        pass
-                if data:
-                    events.append(data)
+        # Structured data covering the whole page replaces the DOM heuristics
+        listings = listing_events(soup, "visitvarazdin", url, len(containers)) or [
+            self.parse_listing_element(el) for el in containers if isinstance(el, Tag)
+        ]
+        for data in await drop_known_listings(listings):
+            link = data.get("link")
+            if link and needs_detail(data, "visitvarazdin"):
+                try:
+                    detail = await self.parse_event_detail(link)
+                    data.update({k: v for k, v in detail.items() if v})
+                except Exception:
+                    pass
+            if data:
+                events.append(data)
 
         next_url = None
         next_link = soup.select_one('a[rel="next"], .pagination-next a, a.next')
@@ -420,7 +415,8 @@ class VisitVarazdinRequestsScraper:
         return all_events
 
     async def close(self) -> None:
-        await self.client.aclose()
+        """Kept for API compatibility; the shared HTTP client stays open."""
+        return None
 
 
 class VisitVarazdinPlaywrightScraper:
@@ -496,30 +492,13 @@ class VisitVarazdinPlaywrightScraper:
     async def scrape_with_playwright(self, start_url: str = "https://visitvarazdin.hr/events", max_pages: int = 5, fetch_details: bool = False) -> List[Dict]:
         """Scrape events using Playwright with enhanced address extraction."""
         try:
-            from playwright.async_api import async_playwright
-            
             all_events = []
             
-            async with async_playwright() as p:
-                # Configure browser
-                if USE_PROXY:
-                    # Use proxy configuration
-                    browser = await p.chromium.launch(
-                        headless=True,
-                        proxy={
-                            "server": PROXY
-                        }
-                    )
-                else:
-                    browser = await p.chromium.launch(headless=True)
-                
-                context = await browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-                )
-                
-                page = await context.new_page()
-                
+            async with get_browser_pool().page(
+                proxy=PROXY if USE_PROXY else None,
+                viewport={'width': 1920, 'height': 1080},
+                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            ) as page:
                 try:
                     logger.info(f"Navigating to {start_url}")
                     await page.goto(start_url, wait_until="domcontentloaded", timeout=30000)
@@ -666,8 +645,6 @@ class VisitVarazdinPlaywrightScraper:
                     
                 except Exception as e:
                     logger.error(f"Error during scraping: {e}")
-                
-                await browser.close()
             
             return all_events
             
@@ -728,37 +705,18 @@ class VisitVarazdinScraper:
         return events
 
     def save_events_to_database(self, events: List[EventCreate]) -> int:
-        from sqlalchemy import select, tuple_
-        from sqlalchemy.dialects.postgresql import insert
+        """Upsert events through the shared ingestion service.
 
-        from backend.app.core.database import SessionLocal
-        from backend.app.models.event import Event
+        Returns:
+            int: Number of events inserted or updated
+        """
+        from backend.app.core.event_ingestion import ingest_events
 
         if not events:
             return 0
 
-        db = SessionLocal()
-        try:
-            event_dicts = [e.model_dump() for e in events]
-            pairs = [(e["name"], e["date"]) for e in event_dicts]
-            existing = db.execute(
-                select(Event.name, Event.date).where(tuple_(Event.name, Event.date).in_(pairs))
-            ).all()
-            existing_pairs = set(existing)
-            to_insert = [e for e in event_dicts if (e["name"], e["date"]) not in existing_pairs]
-            if to_insert:
-                stmt = insert(Event).values(to_insert)
-                stmt = stmt.on_conflict_do_nothing(index_elements=["name", "date"])
-                db.execute(stmt)
-                db.commit()
-                return len(to_insert)
-            db.commit()
-            return 0
-        except Exception:
-            db.rollback()
-            raise
-        finally:
-            db.close()
+        stats = ingest_events(events)
+        return stats["inserted"] + stats["updated"]
 
 
 async def scrape_visitvarazdin_events(max_pages: int = 5, use_playwright: bool = True, fetch_details: bool = False) -> Dict:
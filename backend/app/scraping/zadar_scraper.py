@@ -10,9 +10,14 @@ from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
 from backend.app.models.schemas import EventCreate
+from app.scraping.browser_pool import get_browser_pool
+from app.scraping.html_parser import parse_html
+from app.scraping.http_client import http_get
+from app.scraping.incremental import drop_known_listings
+from app.scraping.structured_data import detail_fields, is_complete, listing_events, needs_detail
 
 # Import configuration
 from backend.app.config.components import get_settings
@@ -302,21 +307,11 @@ class ZadarTransformer:
 class ZadarRequestsScraper:
     """Scraper using httpx and BeautifulSoup with optional Bright Data proxy."""
 
-    def __init__(self) -> None:
-        self.client = httpx.AsyncClient(headers=HEADERS)
-
     async def fetch(self, url: str) -> httpx.Response:
         try:
-            if USE_SB and USE_PROXY:
-                params = {"url": url}
-                async with httpx.AsyncClient(headers=HEADERS, auth=(USER, PASSWORD), verify=False) as client:
-                    resp = await client.get(SCRAPING_BROWSER_EP, params=params, timeout=30)
-            elif USE_PROXY:
-                async with httpx.AsyncClient(headers=HEADERS, proxies={"http": PROXY, "https": PROXY}, verify=False) as client:
-                    resp = await client.get(url, timeout=30)
-            else:
-                async with httpx.AsyncClient(headers=HEADERS) as client:
-                    resp = await client.get(url, timeout=30)
+            resp = await http_get(
+                url, headers=HEADERS, use_proxy=USE_PROXY, use_scraping_browser=USE_SB, timeout=30
+            )
             resp.raise_for_status()
             return resp
         except httpx.HTTPError as e:
@@ -324,7 +319,13 @@ class ZadarRequestsScraper:
 
     async def parse_event_detail(self, url: str) -> Dict:
         resp = await self.fetch(url)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = parse_html(resp.text)
+
+        # Selectors only fill in what the page's structured data lacks
+        structured = detail_fields(soup, "zadar", url)
+        if is_complete(structured):
+            return structured
+
         data: Dict[str, str] = {}
 
         title_el = soup.select_one("h1")
@@ -372,7 +373,7 @@ class ZadarRequestsScraper:
         if price_el:
             data["price"] = price_el.get_text(strip=True)
 
-        return data
+        return {**data, **structured}
 
     def parse_listing_element(self, el: Tag) -> Dict:
         data: Dict[str, str] = {}
@@ -428,7 +429,7 @@ class ZadarRequestsScraper:
 
     async def scrape_events_page(self, url: str) -> Tuple[List[Dict], Optional[str]]:
         resp = await self.fetch(url)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = parse_html(resp.text)
 
         events: List[Dict] = []
         
@@ -451,24 +452,25 @@ class ZadarRequestsScraper:
                     containers = found
                     break
 
-        for el in containers:
-            if isinstance(el, Tag):
-                data = self.parse_listing_element(el)
-                
-                # Try to get more details from individual event page if we have a link
-                link = data.get("link")
-                if link and link.startswith("http"):  # Only for external links that might have more info
-                    try:
-                        detail = await self.parse_event_detail(link)
-                        # Only update with non-empty values
-                        data.update({k: v for k, v in detail.items() if v})
-                    except Exception as e:
-                        # Log but don't fail the whole scraping
-                        logger.warning(f"Warning: Could not fetch details from {link}: {e}")
-                
-                # Only add events that have at least title and date
-                if data.get("title") and data.get("date"):
-                    events.append(data)
+        # Structured data covering the whole page replaces the DOM heuristics
+        listings = listing_events(soup, "zadar", url, len(containers)) or [
+            self.parse_listing_element(el) for el in containers if isinstance(el, Tag)
+        ]
+        for data in await drop_known_listings(listings):
+            # Try to get more details from individual event page if we have a link
+            link = data.get("link")
+            if link and link.startswith("http") and needs_detail(data, "zadar"):  # Only for external links that might have more info
+                try:
+                    detail = await self.parse_event_detail(link)
+                    # Only update with non-empty values
+                    data.update({k: v for k, v in detail.items() if v})
+                except Exception as e:
+                    # Log but don't fail the whole scraping
+                    logger.warning(f"Warning: Could not fetch details from {link}: {e}")
+            
+            # Only add events that have at least title and date
+            if data.get("title") and data.get("date"):
+                events.append(data)
 
         # Look for pagination
         next_url = None
@@ -520,7 +522,8 @@ class ZadarRequestsScraper:
         return all_events
 
     async def close(self) -> None:
-        await self.client.aclose()
+        """Kept for API compatibility; the shared HTTP client stays open."""
+        return None
 
 
 class ZadarPlaywrightScraper:
@@ -597,32 +600,16 @@ class ZadarPlaywrightScraper:
     
     async def scrape_with_playwright(self, max_pages: int = 5, fetch_details: bool = False) -> List[Dict]:
         try:
-            from playwright.async_api import async_playwright
             import random
             
             all_events = []
             
-            async with async_playwright() as p:
-                # Launch browser
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--no-sandbox',
-                        '--disable-dev-shm-usage',
-                        '--disable-web-security',
-                    ]
-                )
-                
-                # Create context with realistic settings
-                context = await browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    locale='hr-HR',
-                    timezone_id='Europe/Zagreb',
-                )
-                
-                page = await context.new_page()
-                
+            async with get_browser_pool().page(
+                viewport={'width': 1920, 'height': 1080},
+                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                locale='hr-HR',
+                timezone_id='Europe/Zagreb',
+            ) as page:
                 try:
                     logger.info(f"Navigating to {EVENTS_URL}")
                     await page.goto(EVENTS_URL, wait_until="networkidle", timeout=30000)
@@ -739,8 +726,6 @@ class ZadarPlaywrightScraper:
                     
                 except Exception as e:
                     logger.error(f"Error scraping with Playwright: {e}")
-                
-                await browser.close()
             
             return all_events
             
@@ -797,48 +782,18 @@ class ZadarScraper:
         return events
 
     def save_events_to_database(self, events: List[EventCreate]) -> int:
-        from sqlalchemy import select, tuple_
+        """Upsert events through the shared ingestion service.
 
-        from backend.app.core.database import SessionLocal
-        from backend.app.models.event import Event
+        Returns:
+            int: Number of events inserted or updated
+        """
+        from backend.app.core.event_ingestion import ingest_events
 
         if not events:
             return 0
 
-        db = SessionLocal()
-        try:
-            event_dicts = [e.model_dump() for e in events]
-            pairs = [(e["title"], e["date"]) for e in event_dicts]
-            existing = db.execute(
-                select(Event.title, Event.date).where(tuple_(Event.title, Event.date).in_(pairs))
-            ).all()
-            existing_pairs = set(existing)
-            to_insert = [e for e in event_dicts if (e["title"], e["date"]) not in existing_pairs]
-            if to_insert:
-                # Insert each event individually to handle any constraint issues
-                saved_count = 0
-                for event_data in to_insert:
-                    try:
-                        event = Event(**event_data)
-                        db.add(event)
-                        db.flush()  # Get the ID without committing
-                        saved_count += 1
-                    except Exception as e:
-                        # Skip duplicate or invalid events
-                        db.rollback()
-                        logger.warning(f"Skipping event {event_data.get('title', 'Unknown')}: {e}")
-                        continue
-                
-                db.commit()
-                return saved_count
-            db.commit()
-            return 0
-        except Exception as e:
-            db.rollback()
-            logger.error(f"Database error in Zadar scraper: {e}")
-            raise
-        finally:
-            db.close()
+        stats = ingest_events(events)
+        return stats["inserted"] + stats["updated"]
 
 
 async def scrape_zadar_events(max_pages: int = 5, use_playwright: bool = True, fetch_details: bool = False) -> Dict:
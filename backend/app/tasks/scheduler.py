@@ -214,6 +214,7 @@ class SimpleScheduler:
                 run_enhanced_scraping_pipeline(
                     max_pages_per_source=2,
                     quality_threshold=50.0,  # Lower threshold for frequent updates
+                    incremental=True,  # Skip events the daily run already stored
                 )
             )
 
@@ -0,0 +1,426 @@
+"""
+Test suite for the caching layer.
+
+Tests event listing response caching and the CacheService building blocks
+without requiring a running Redis server.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from backend.app.core.async_cache import AsyncCacheService, cached_async
+from backend.app.core.cache import CacheService, LocalCache
+from backend.app.core.cache_codec import CacheCodec, CacheCodecError
+from backend.app.core.events_cache import (
+    EVENTS_NAMESPACE,
+    FEATURED_EVENTS_NAMESPACE,
+    SEARCH_RESULTS_NAMESPACE,
+    OPEN_LISTING_TAG,
+    SEARCH_LISTING_TAG,
+    build_event_list_cache_key,
+    event_change_tags,
+    event_list_namespace,
+    event_list_tags,
+    get_cached_event_response,
+)
+from backend.app.models.schemas import EventSearchParams
+
+
+class TestEventListCacheKeys:
+    """Test cache key normalization for event listings."""
+
+    def test_equivalent_params_share_key(self):
+        """Test that cosmetic differences map to the same cache key."""
+        params1 = EventSearchParams(q="  Jazz   Festival ", city="Zagreb", tags=["b", "a"])
+        params2 = EventSearchParams(q="jazz festival", city="zagreb", tags=["a", "b", "a"])
+
+        assert build_event_list_cache_key(params1, "hr") == build_event_list_cache_key(params2, "hr")
+
+    def test_language_and_page_change_key(self):
+        """Test that language and pagination are part of the key."""
+        params = EventSearchParams(page=1)
+
+        assert build_event_list_cache_key(params, "hr") != build_event_list_cache_key(params, "en")
+        assert build_event_list_cache_key(params, "hr") != build_event_list_cache_key(
+            EventSearchParams(page=2), "hr"
+        )
+
+    def test_use_cache_flag_not_in_key(self):
+        """Test that the use_cache flag does not affect the key."""
+        assert build_event_list_cache_key(
+            EventSearchParams(use_cache=True), "hr"
+        ) == build_event_list_cache_key(EventSearchParams(use_cache=False), "hr")
+
+    def test_namespace_selection(self):
+        """Test namespace choice for search, featured and plain listings."""
+        assert event_list_namespace(EventSearchParams(q="koncert")) == SEARCH_RESULTS_NAMESPACE
+        assert event_list_namespace(EventSearchParams(is_featured=True)) == FEATURED_EVENTS_NAMESPACE
+        assert event_list_namespace(EventSearchParams()) == EVENTS_NAMESPACE
+
+
+def _read_through_cache(cached_value=None):
+    """Build a mock cache whose get_or_set behaves like a read-through cache."""
+    cache = Mock()
+
+    def get_or_set(namespace, key, loader, ttl=None, tags=None):
+        if cached_value is not None:
+            return cached_value
+        cache.stored = (namespace, key, loader())
+        return cache.stored[2]
+
+    cache.get_or_set.side_effect = get_or_set
+    return cache
+
+
+class TestGetCachedEventResponse:
+    """Test the read-through behavior of get_cached_event_response."""
+
+    def test_cache_hit_skips_loader(self):
+        """Test that a cached payload is returned without calling the loader."""
+        cache = _read_through_cache(
+            {"events": [], "total": 0, "page": 1, "size": 20, "pages": 0}
+        )
+        loader = Mock()
+
+        with patch("backend.app.core.events_cache.get_cache_service", return_value=cache):
+            result = get_cached_event_response(EventSearchParams(), "hr", loader)
+
+        assert result["total"] == 0
+        loader.assert_not_called()
+
+    def test_cache_miss_stores_result(self):
+        """Test that a miss calls the loader and stores its serialized result."""
+        cache = _read_through_cache()
+        response = {"events": [], "total": 0, "page": 1, "size": 20, "pages": 0}
+        loader = Mock(return_value=response)
+
+        with patch("backend.app.core.events_cache.get_cache_service", return_value=cache):
+            result = get_cached_event_response(EventSearchParams(), "hr", loader)
+
+        loader.assert_called_once()
+        assert result is response
+        namespace, _key, payload = cache.stored
+        assert namespace == EVENTS_NAMESPACE
+        assert payload["next_cursor"] is None
+
+    def test_use_cache_false_bypasses_cache(self):
+        """Test that use_cache=False never touches Redis."""
+        loader = Mock(return_value={})
+
+        with patch("backend.app.core.events_cache.get_cache_service") as mock_get_cache:
+            get_cached_event_response(EventSearchParams(use_cache=False), "hr", loader)
+
+        mock_get_cache.assert_not_called()
+        loader.assert_called_once()
+
+
+class TestEventListTags:
+    """Test tag-based invalidation of event listing pages."""
+
+    def test_page_tags(self):
+        """Test that pages are tagged by their events and filter scope."""
+        payload = {"events": [{"id": 1}, {"id": 2}]}
+
+        assert event_list_tags(EventSearchParams(category_id=5), payload) == [
+            "event:1",
+            "event:2",
+            "category:5",
+        ]
+        assert event_list_tags(EventSearchParams(q="jazz"), {"events": []}) == [
+            OPEN_LISTING_TAG,
+            SEARCH_LISTING_TAG,
+        ]
+
+    def test_cosmetic_update_only_touches_event_pages(self):
+        """Test that editing a non-listing field only invalidates pages showing the event."""
+        event = Mock(id=7, category_id=5, venue_id=3)
+
+        assert event_change_tags(event, ["price", "image"]) == {"event:7"}
+
+    def test_new_event_touches_scoped_pages(self):
+        """Test that a new event invalidates the pages it may appear on."""
+        event = Mock(id=7, category_id=5, venue_id=None)
+
+        assert event_change_tags(event) == {
+            "event:7",
+            "category:5",
+            OPEN_LISTING_TAG,
+            SEARCH_LISTING_TAG,
+        }
+
+
+    def test_deleted_event_touches_scoped_pages(self):
+        """Test that deleting an event invalidates the listings it shifts."""
+        from backend.app.routes.events import delete_event
+
+        event = Mock(id=7, category_id=5, venue_id=None)
+        db = Mock()
+        db.query.return_value.filter.return_value.first.return_value = event
+
+        with patch("backend.app.routes.events.invalidate_event_caches") as invalidate:
+            delete_event(event_id=7, db=db)
+
+        invalidate.assert_called_once_with(
+            {"event:7", "category:5", OPEN_LISTING_TAG, SEARCH_LISTING_TAG}
+        )
+        db.delete.assert_called_once_with(event)
+
+class TestLocalCache:
+    """Test the in-process L1 cache tier."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted when full."""
+        local = LocalCache(max_entries=2, max_ttl=30)
+        local.set("a", 1)
+        local.set("b", 2)
+        local.get("a")
+        local.set("c", 3)
+
+        assert local.get("a") == 1
+        assert local.get("b") is None
+        assert local.get("c") == 3
+
+    def test_entries_expire(self):
+        """Test that entries are dropped after their TTL."""
+        local = LocalCache(max_entries=10, max_ttl=30)
+        local.set("a", 1, ttl=30)
+
+        with patch("backend.app.core.cache.time.monotonic", return_value=time.monotonic() + 31):
+            assert local.get("a") is None
+
+    def test_delete_prefix(self):
+        """Test namespace-wide removal."""
+        local = LocalCache()
+        local.set("kruzna_karta:events:1", 1)
+        local.set("kruzna_karta:venues:1", 2)
+
+        assert local.delete_prefix("kruzna_karta:events:") == 1
+        assert local.get("kruzna_karta:venues:1") == 2
+
+
+class TestGetOrSet:
+    """Test stampede protection in CacheService.get_or_set."""
+
+    @pytest.fixture
+    def cache(self):
+        """Cache service with a mocked Redis client."""
+        with patch.object(CacheService, "_connect"):
+            service = CacheService("redis://test", local_max_entries=100, local_ttl=30)
+        service._redis = Mock()
+        service._redis.get.return_value = None
+        service._redis.set.return_value = True
+        service._release_lock = Mock()
+        return service
+
+    def test_miss_computes_once_and_caches(self, cache):
+        """Test that the loader runs once and later calls hit the L1 tier."""
+        loader = Mock(return_value={"value": 1})
+
+        assert cache.get_or_set("events", "key", loader) == {"value": 1}
+        assert cache.get_or_set("events", "key", loader) == {"value": 1}
+
+        loader.assert_called_once()
+        cache._redis.pipeline.return_value.setex.assert_called_once()
+        cache._release_lock.assert_called_once()
+
+    def test_lock_held_elsewhere_serves_stale_value(self, cache):
+        """Test that a stale value is served while another worker recomputes."""
+        cache_key = cache._make_key("events", "key")
+        cache.local_cache.set(cache_key, {"v": "stale", "d": 0.1, "e": time.time() - 1})
+        cache._redis.set.return_value = False
+        loader = Mock(return_value="fresh")
+
+        assert cache.get_or_set("events", "key", loader) == "stale"
+        loader.assert_not_called()
+
+    def test_concurrent_misses_share_one_load(self, cache):
+        """Test that threads missing the same key wait for a single load."""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_loader():
+            calls.append(1)
+            started.set()
+            release.wait(2)
+            return "value"
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(cache.get_or_set, "events", "key", slow_loader)
+            started.wait(2)
+            second = pool.submit(cache.get_or_set, "events", "key", slow_loader)
+            release.set()
+
+            assert first.result(2) == second.result(2) == "value"
+        assert len(calls) == 1
+
+    def test_slow_load_does_not_block_other_keys(self, cache):
+        """Test that keys sharing a lock stripe load independently."""
+        cache.KEY_LOCK_STRIPES = 1
+        cache._key_locks = [threading.Lock()]
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_loader():
+            started.set()
+            release.wait(2)
+            return "slow"
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            slow = pool.submit(cache.get_or_set, "events", "slow", slow_loader)
+            started.wait(2)
+            try:
+                assert cache.get_or_set("events", "fast", lambda: "fast") == "fast"
+                assert not slow.done()
+            finally:
+                release.set()
+            assert slow.result(2) == "slow"
+
+    def test_none_is_not_cached(self, cache):
+        """Test that None results are recomputed on the next call."""
+        loader = Mock(return_value=None)
+
+        cache.get_or_set("events", "key", loader)
+        cache.get_or_set("events", "key", loader)
+
+        assert loader.call_count == 2
+        cache._redis.pipeline.return_value.setex.assert_not_called()
+
+    def test_invalidate_tags_unlinks_members(self, cache):
+        """Test that tagged keys are resolved and unlinked in pipelines."""
+        cache_key = cache._make_key("events", "page")
+        cache.local_cache.set(cache_key, {"v": 1, "d": 0.1, "e": time.time() + 60})
+        pipe = cache._redis.pipeline.return_value
+        pipe.execute.side_effect = [[{cache_key.encode()}], [1, 1]]
+
+        assert cache.invalidate_tags(["event:1"]) == 1
+        pipe.unlink.assert_any_call(cache_key.encode())
+        assert cache.local_cache.get(cache_key) is None
+
+    def test_redis_unavailable_still_computes(self, cache):
+        """Test graceful fallback when Redis is down."""
+        cache._redis = None
+        cache._connection_failed = True
+        cache._last_connect_attempt = time.monotonic()
+
+        assert cache.get_or_set("events", "key", lambda: "value") == "value"
+
+
+class TestCacheCodec:
+    """Test value encoding, compression and format coexistence."""
+
+    def test_round_trip_with_compression(self):
+        """Test that large payloads are compressed and decode unchanged."""
+        codec = CacheCodec(format="json", compression="zlib", compression_threshold=64)
+        value = {"events": [{"title": "Koncert", "price": "10 EUR"}] * 50}
+
+        encoded = codec.encode(value)
+
+        assert encoded[:3] == b"\xc1jz"
+        assert codec.decode(encoded) == value
+
+    def test_small_payload_not_compressed(self):
+        """Test that values below the threshold are stored uncompressed."""
+        codec = CacheCodec(format="json", compression="zlib", compression_threshold=1024)
+
+        assert codec.encode({"a": 1})[:3] == b"\xc1j-"
+
+    def test_reads_values_from_other_codecs(self):
+        """Test that headerless legacy JSON and other formats still decode."""
+        codec = CacheCodec(format="json", compression="none")
+        zlib_codec = CacheCodec(format="json", compression="zlib", compression_threshold=0)
+
+        assert codec.decode(b'{"total": 3}') == {"total": 3}
+        assert codec.decode(zlib_codec.encode([1, 2, 3])) == [1, 2, 3]
+
+    def test_pydantic_models_are_dumped(self):
+        """Test schema-aware encoding of Pydantic models."""
+        codec = CacheCodec(format="json", compression="none")
+
+        decoded = codec.decode(codec.encode(EventSearchParams(q="jazz")))
+
+        assert decoded["q"] == "jazz"
+
+    def test_unknown_objects_raise(self):
+        """Test that arbitrary objects are rejected instead of leaking __dict__."""
+        codec = CacheCodec(format="json", compression="none")
+
+        with pytest.raises(CacheCodecError):
+            codec.encode(object())
+
+    def test_corrupt_value_raises(self):
+        """Test that unknown headers are reported as codec errors."""
+        with pytest.raises(CacheCodecError):
+            CacheCodec().decode(b"\xc1?-payload")
+
+
+class TestAsyncCacheService:
+    """Test the asyncio cache service without a Redis server."""
+
+    @pytest.fixture
+    def cache(self):
+        """Async cache service with Redis marked unavailable."""
+        service = AsyncCacheService("redis://test", local_max_entries=100, local_ttl=30)
+        service.is_available = AsyncMock(return_value=False)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self, cache):
+        """Test that concurrent get_or_set calls await a single loader."""
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"lat": 45.81}
+
+        results = await asyncio.gather(
+            *(cache.get_or_set("geocoding", "zagreb", loader) for _ in range(5))
+        )
+
+        assert calls == 1
+        assert all(result == {"lat": 45.81} for result in results)
+
+    @pytest.mark.asyncio
+    async def test_loader_error_propagates_to_waiters(self, cache):
+        """Test that a failing loader is not cached and raises for every caller."""
+
+        async def loader():
+            await asyncio.sleep(0.01)
+            raise ValueError("provider down")
+
+        results = await asyncio.gather(
+            cache.get_or_set("geocoding", "split", loader),
+            cache.get_or_set("geocoding", "split", loader),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert cache._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cached_async_decorator(self, cache):
+        """Test that cached_async reuses results for equal arguments."""
+        calls = []
+
+        @cached_async("geocoding", key_func=lambda name: name)
+        async def lookup(name):
+            calls.append(name)
+            return name.upper()
+
+        with patch("backend.app.core.async_cache.get_async_cache_service", return_value=cache):
+            cache.local_cache.set(cache._make_key("geocoding", "rijeka"), "RIJEKA")
+            assert await lookup("rijeka") == "RIJEKA"
+            assert await lookup("osijek") == "OSIJEK"
+
+        assert calls == ["osijek"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
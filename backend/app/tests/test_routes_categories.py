@@ -6,7 +6,7 @@ error handling, authentication, and business logic validation using
 the established excellent testing patterns.
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from fastapi import status
@@ -577,6 +577,58 @@ class TestGetCategoryEvents:
         assert data["category"] == "validation"
 
 
+class TestCategoryRoutesAsyncSession:
+    """Test category handlers directly against a mocked AsyncSession."""
+
+    @pytest.mark.asyncio
+    async def test_get_category_not_found(self):
+        """Test missing category raises CategoryNotFoundError."""
+        # Same import root as the routes, or the exception classes differ
+        from app.core.error_handlers import CategoryNotFoundError
+        from backend.app.routes.categories import get_category
+
+        db = AsyncMock()
+        db.get.return_value = None
+
+        with pytest.raises(CategoryNotFoundError):
+            await get_category(category_id=999, db=db)
+
+    @pytest.mark.asyncio
+    async def test_delete_category_with_events_is_refused(self):
+        """Test category with events is not deleted."""
+        from app.core.error_handlers import CannotDeleteReferencedEntityError
+        from backend.app.routes.categories import delete_category
+
+        db = AsyncMock()
+        db.get.return_value = Mock(id=1)
+        db.scalar.return_value = 3
+
+        with pytest.raises(CannotDeleteReferencedEntityError):
+            await delete_category(category_id=1, db=db)
+
+        db.delete.assert_not_called()
+        db.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_category_events_uses_async_events_service(self):
+        """Test category events are listed through AsyncEventsService."""
+        from backend.app.routes.categories import get_category_events
+
+        db = AsyncMock()
+        db.get.return_value = Mock(id=1)
+
+        with patch('backend.app.routes.categories.AsyncEventsService') as mock_service_class:
+            mock_service_class.return_value.search_events = AsyncMock(return_value="response")
+
+            result = await get_category_events(category_id=1, page=2, size=10, db=db)
+
+        assert result == "response"
+        search_params = mock_service_class.return_value.search_events.call_args[0][0]
+        assert search_params.category_id == 1
+        assert search_params.page == 2
+        assert search_params.size == 10
+
+
 # Additional test utilities and fixtures
 @pytest.fixture
 def mock_category_create():
@@ -6,6 +6,7 @@ error handling, authentication, and business logic validation using
 the established excellent testing patterns.
 """
 
+import asyncio
 from datetime import date
 from decimal import Decimal
 from unittest.mock import Mock, patch
@@ -13,13 +14,15 @@ from unittest.mock import Mock, patch
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 
 from backend.app.main import app
 from backend.app.core.error_handlers import (
     DatabaseOperationError
 )
-from backend.app.models.schemas import EventCreate
+from backend.app.models.schemas import EventCreate, EventSearchParams
 
 
 class TestEventsRoutes:
@@ -342,12 +345,14 @@ class TestGetSpecificEvent:
             
             mock_db.query.return_value.options.return_value.filter.return_value.first.return_value = mock_event
             
-            response = client.get("/api/events/1")
+            with patch('backend.app.routes.events.record_event_view') as mock_record_view:
+                response = client.get("/api/events/1")
             
             assert response.status_code == status.HTTP_200_OK
-            # Verify view count was incremented
-            assert mock_event.view_count == 6
-            mock_db.commit.assert_called_once()
+            # Verify the view was buffered instead of written in the request
+            mock_record_view.assert_called_once_with(1)
+            assert mock_event.view_count == 5
+            mock_db.commit.assert_not_called()
     
     def test_get_event_not_found(self, client):
         """Test event not found scenario."""
@@ -400,6 +405,57 @@ class TestGetSpecificEvent:
             assert response.status_code == status.HTTP_200_OK
 
 
+class TestViewCountFlush:
+    """Test batched view count writes."""
+
+    def test_views_fall_back_to_local_buffer(self):
+        """Test that views are buffered locally and flushed in one batch."""
+        from backend.app.core import view_counts
+
+        cache = Mock()
+        cache.increment_field.return_value = None
+        cache.pop_counters.return_value = {"2": 3}
+        mock_db = Mock()
+
+        with patch('backend.app.core.view_counts.get_cache_service', return_value=cache):
+            view_counts.record_event_view(1)
+            view_counts.record_event_view(1)
+            flushed = view_counts.flush_view_counts(mock_db)
+
+        assert flushed == 5
+        _statement, rows = mock_db.execute.call_args[0]
+        assert rows == [{"event_id": 1, "views": 2}, {"event_id": 2, "views": 3}]
+        mock_db.commit.assert_called_once()
+
+    def test_failed_flush_keeps_views(self):
+        """Test that views survive a failed database write."""
+        from backend.app.core import view_counts
+
+        cache = Mock()
+        cache.pop_counters.return_value = {"7": 4}
+        mock_db = Mock()
+        mock_db.execute.side_effect = Exception("database down")
+
+        with patch('backend.app.core.view_counts.get_cache_service', return_value=cache):
+            assert view_counts.flush_view_counts(mock_db) == 0
+            cache.pop_counters.return_value = {}
+            assert view_counts._take_pending_views() == {7: 4}
+
+
+    @pytest.mark.asyncio
+    async def test_flusher_runs_until_cancelled(self):
+        """Test that the lifespan flusher writes views periodically."""
+        from backend.app.core import view_counts
+
+        with patch('backend.app.core.view_counts.flush_view_counts') as mock_flush:
+            task = asyncio.create_task(view_counts.run_view_count_flusher(interval=0.01))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert mock_flush.call_count >= 2
+
 class TestGetEventBySlug:
     """Test GET /api/events/slug/{slug} endpoint."""
     
@@ -416,11 +472,13 @@ class TestGetEventBySlug:
             
             mock_db.query.return_value.options.return_value.filter.return_value.first.return_value = mock_event
             
-            response = client.get("/api/events/slug/test-event")
+            with patch('backend.app.routes.events.record_event_view') as mock_record_view:
+                response = client.get("/api/events/slug/test-event")
             
             assert response.status_code == status.HTTP_200_OK
-            # Verify view count was incremented
-            assert mock_event.view_count == 11
+            # Verify the view was buffered instead of written in the request
+            mock_record_view.assert_called_once_with(1)
+            mock_db.commit.assert_not_called()
     
     def test_get_event_by_slug_not_found(self, client):
         """Test event by slug not found scenario."""
@@ -813,6 +871,149 @@ class TestDataIntegrityEndpoints:
             assert "checks_performed" in data
 
 
+class TestEventsCursorPagination:
+    """Test keyset cursor helpers used by GET /api/events/."""
+    
+    @pytest.fixture
+    def client(self):
+        """FastAPI test client fixture."""
+        return TestClient(app)
+    
+    def test_cursor_round_trip(self):
+        """Test that an encoded cursor decodes to the event's keyset position."""
+        from backend.app.core.events_service import decode_event_cursor, encode_event_cursor
+        
+        event = Mock(id=42, date=date(2024, 6, 15), time="20:00")
+        cursor = encode_event_cursor(event)
+        
+        assert "=" not in cursor
+        assert decode_event_cursor(cursor) == (date(2024, 6, 15), "20:00", 42)
+    
+    def test_invalid_cursor_rejected(self):
+        """Test that malformed cursors raise ValueError."""
+        from backend.app.core.events_service import decode_event_cursor
+        
+        with pytest.raises(ValueError):
+            decode_event_cursor("not-a-cursor")
+    
+    def test_invalid_cursor_is_a_client_error(self):
+        """Test a tampered cursor is refused instead of restarting at page 1."""
+        from app.core.error_handlers import InvalidParameterError
+        from backend.app.core.events_service import EventsService
+        
+        service = EventsService(Mock())
+        
+        with patch.object(service, "_count_events") as mock_count, \
+             pytest.raises(InvalidParameterError) as exc_info:
+            service.get_events_paginated(EventSearchParams(cursor="not-a-cursor"))
+        
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+        mock_count.assert_not_called()
+    
+    def test_invalid_cursor_returns_400(self, client):
+        """Test the events listing answers a malformed cursor with 400."""
+        response = client.get("/api/events/?cursor=not-a-cursor&use_cache=false")
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["details"][0]["field"] == "cursor"
+    
+    def test_get_events_passes_cursor(self, client):
+        """Test cursor and count_mode query parameters reach the service."""
+        # The app's router is the app.routes.events module, not backend.app.routes.events
+        with patch('app.routes.events._safe_search_events') as mock_search:
+            mock_search.return_value = {
+                "events": [],
+                "total": None,
+                "page": 1,
+                "size": 20,
+                "pages": None,
+                "next_cursor": None
+            }
+            
+            response = client.get("/api/events/?cursor=abc&count_mode=none")
+            
+            assert response.status_code == status.HTTP_200_OK
+            search_params = mock_search.call_args[0][0]
+            assert search_params.cursor == "abc"
+            assert search_params.count_mode == "none"
+            assert response.json()["next_cursor"] is None
+
+
+
+class TestEventsTextSearch:
+    """Test which SQL the events service builds for text searches."""
+    
+    @staticmethod
+    def compile_sql(statement):
+        """Compile a statement for PostgreSQL, returning its SQL and parameters."""
+        compiled = statement.compile(dialect=postgresql.dialect())
+        return str(compiled), compiled.params
+    
+    @staticmethod
+    def events_select():
+        # Same import root as the service, or the Event mapper is defined twice
+        from app.models.event import Event
+        
+        return select(Event.id)
+    
+    def test_full_text_search_with_trigram_fallback(self):
+        """Test longer queries use the search vector OR-ed with title trigrams."""
+        from backend.app.core.events_service import EventsService
+        
+        statement = EventsService(Mock())._apply_text_search(self.events_select(), "jazz festival")
+        sql, params = self.compile_sql(statement)
+        
+        assert "events.search_vector @@ websearch_to_tsquery(" in sql
+        assert "OR (events.title %% " in sql
+        assert "croatian_unaccent" in params.values()
+        assert "ILIKE" not in sql
+    
+    def test_short_query_uses_title_prefix(self):
+        """Test queries below the full-text minimum match a title prefix."""
+        from backend.app.core.events_service import EventsService
+        
+        statement = EventsService(Mock())._apply_text_search(self.events_select(), "ab")
+        sql, params = self.compile_sql(statement)
+        
+        assert "events.title ILIKE" in sql
+        assert "ab%" in params.values()
+        assert "websearch_to_tsquery" not in sql
+    
+    def test_ranked_search_ignores_cursor(self):
+        """Test relevance-ordered searches paginate by offset, not by cursor."""
+        from backend.app.core.events_service import EventsService, encode_event_cursor
+        
+        service = EventsService(Mock())
+        cursor = encode_event_cursor(Mock(id=42, date=date(2024, 6, 15), time="20:00"))
+        search_params = EventSearchParams(q="jazz", cursor=cursor, size=1)
+        
+        statement, rank = service._order_and_paginate(self.events_select(), search_params)
+        sql, _params = self.compile_sql(statement)
+        events, _total, _pages, next_cursor = service._build_page(
+            [Mock(latitude=None, longitude=None, venue=None)] * 2, None, search_params, rank
+        )
+        
+        assert rank is not None
+        assert "ORDER BY ts_rank(" in sql
+        assert "OFFSET" in sql
+        assert "(events.date, events.time, events.id) >" not in sql
+        assert len(events) == 1
+        assert next_cursor is None
+    
+    def test_unranked_listing_uses_cursor(self):
+        """Test chronological listings seek past the cursor position."""
+        from backend.app.core.events_service import EventsService, encode_event_cursor
+        
+        cursor = encode_event_cursor(Mock(id=42, date=date(2024, 6, 15), time="20:00"))
+        statement, rank = EventsService(Mock())._order_and_paginate(
+            self.events_select(), EventSearchParams(cursor=cursor)
+        )
+        sql, _params = self.compile_sql(statement)
+        
+        assert rank is None
+        assert "(events.date, events.time, events.id) >" in sql
+        assert "OFFSET" not in sql
+
 # Additional test utilities and fixtures
 @pytest.fixture
 def mock_event_create():
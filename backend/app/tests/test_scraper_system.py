@@ -3,18 +3,57 @@ Comprehensive test suite for the scraper system.
 Tests scraper functionality, database persistence, and error handling.
 """
 
+import asyncio
+import random
+import time
+
+import httpx
 import pytest
-from datetime import date
+from bs4 import SoupStrainer
+from sqlalchemy.dialects import postgresql
+from datetime import date, timedelta
 from typing import List
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 from backend.app.core.scraper_registry import get_scraper_registry, ScraperInfo, ScraperResult
 from backend.app.core.scraper_service import get_scraper_service
-from backend.app.core.database_optimization import BulkEventProcessor, DatabaseOptimizer
+from backend.app.core.data_quality import (
+    DataQualityService,
+    DataQualityValidator,
+    DuplicateDetector,
+    EventFeatures,
+)
+from backend.app.core.database_optimization import (
+    BulkEventProcessor,
+    DatabaseOptimizer,
+    build_event_upsert,
+    calculate_event_hash,
+    prepare_event_rows,
+    summarize_upsert,
+)
+from backend.app.core.croatian_geo_db import CroatianGeoDatabase
+from backend.app.core.event_ingestion import EventIngestionService
 from backend.app.core.error_handling import get_error_handler, RetryConfig
 from backend.app.core.scraper_logging import get_scraping_logger
 from backend.app.models.schemas import EventCreate
+from backend.app.scraping.base_scraper import BaseScraper
+from backend.app.scraping.browser_pool import BrowserPool, ResourceBlocker
 from backend.app.scraping.croatia_scraper import CroatiaEventDataTransformer
+from backend.app.scraping import html_parser, http_client, incremental
+from backend.app.scraping.http_cache import HttpCache, is_unchanged
+from backend.app.scraping.structured_data import (
+    STRUCTURED_LISTING_KEY,
+    extract_events,
+    get_structured_data_stats,
+    listing_events,
+)
+from backend.app.scraping.enhanced_scraper import EnhancedScrapingPipeline
+from backend.app.scraping.rate_limit import (
+    AdaptivePacer,
+    DomainRateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
 
 
 class TestScraperRegistry:
@@ -177,6 +216,946 @@ class TestDatabaseOptimization:
         assert processor.processed_count == 0
         assert processor.error_count == 0
 
+    def test_prepare_event_rows_collapses_duplicate_hashes(self):
+        """Test events with the same hash become one upsert row."""
+        events = [
+            EventCreate(title="Concert", date=date(2024, 6, 15), time="20:00",
+                        location="Zagreb", source="test", price="10 EUR"),
+            EventCreate(title="Concert", date=date(2024, 6, 15), time="20:00",
+                        location="Zagreb", source="test", price="12 EUR"),
+            EventCreate(title="Play", date=date(2024, 6, 16), time="19:00",
+                        location="Split", source="test"),
+        ]
+        
+        rows = prepare_event_rows(events)
+        
+        assert len(rows) == 2
+        assert rows[0]["price"] == "12 EUR"
+        assert all(row["scrape_hash"] and row["last_scraped_at"] for row in rows)
+        assert rows[0]["scrape_hash"] == DatabaseOptimizer(Mock())._calculate_event_hash(events[0])
+        assert "id" not in rows[0]
+    
+    def test_upsert_keeps_values_scrapers_do_not_set(self):
+        """Test a re-scrape does not clear coordinates, venue or category."""
+        rows = prepare_event_rows([
+            EventCreate(title="Concert", date=date(2024, 6, 15), time="20:00",
+                        location="Zagreb", source="test"),
+        ])
+        
+        sql = str(build_event_upsert(rows).compile(dialect=postgresql.dialect()))
+        
+        for column in ("latitude", "longitude", "venue_id", "category_id"):
+            assert f"{column} = coalesce(excluded.{column}, events.{column})" in sql
+        assert "updated_at = now()" in sql
+        assert "title = excluded.title" in sql
+    
+    def test_summarize_upsert_counts(self):
+        """Test inserted/updated/unchanged counts from RETURNING rows."""
+        rows = [{"scrape_hash": h} for h in ("a", "b", "c")]
+        written = [Mock(scrape_hash="a", inserted=True), Mock(scrape_hash="b", inserted=False)]
+        
+        stats, unchanged = summarize_upsert(rows, written)
+        
+        assert stats == {"inserted": 1, "updated": 1, "unchanged": 1}
+        assert unchanged == {"c"}
+    
+    def test_ingestion_retries_failed_batch_per_event(self):
+        """Test one bad row does not drop the rest of its batch."""
+        events = [
+            EventCreate(title=f"Event {i}", date=date(2024, 6, 15), time="20:00",
+                        location="Zagreb", source="test")
+            for i in range(3)
+        ]
+        service = EventIngestionService(Mock())
+        
+        def upsert(rows, scraped_at, update_existing):
+            if len(rows) > 1 or rows[0]["title"] == "Event 1":
+                raise Exception("check constraint violated")
+            return {"inserted": 1, "updated": 0, "unchanged": 0}
+        
+        with patch.object(service, "_upsert_batch", side_effect=upsert):
+            stats = service.ingest(events)
+        
+        assert stats == {"inserted": 2, "updated": 0, "unchanged": 0, "failed": 1}
+
+
+class TestDuplicateDetection:
+    """Test candidate blocking in DuplicateDetector."""
+    
+    @staticmethod
+    def _pairwise_duplicates(events: List[EventCreate]):
+        """Reference result of comparing every pair of events."""
+        groups = []
+        processed = set()
+        for i, event1 in enumerate(events):
+            if i in processed:
+                continue
+            found = []
+            for j in range(i + 1, len(events)):
+                if j in processed:
+                    continue
+                is_dup, dup_info = DuplicateDetector.is_duplicate(event1, events[j])
+                if is_dup:
+                    found.append((j, dup_info["reason"]))
+                    processed.add(j)
+            if found:
+                groups.append((i, found))
+        return groups
+    
+    def test_batch_duplicates_match_pairwise_scan(self):
+        """Test blocked detection finds exactly the pairwise duplicates."""
+        rng = random.Random(42)
+        words = ["koncert", "jazz", "festival", "zagreb", "kazalište", "predstava",
+                 "izložba", "rock", "noć", "ljeta", "dan", "grada"]
+        locations = ["Zagreb, Lisinski", "Split", "Dom sportova", "Pula Arena"]
+        titles = [" ".join(rng.sample(words, rng.randint(2, 4))) for _ in range(25)]
+        
+        events = []
+        for _ in range(150):
+            title = rng.choice(titles)
+            if rng.random() < 0.3:
+                title = f"{title} {rng.choice(words)}"
+            events.append(EventCreate(
+                title=title.upper() if rng.random() < 0.2 else title,
+                description=rng.choice(["", f"Opis: {title}"]),
+                location=rng.choice(locations),
+                date=date(2025, 6, 1) + timedelta(days=rng.randint(0, 40)),
+                time="20:00",
+            ))
+        
+        result = [
+            (group["original_index"],
+             [(dup["index"], dup["duplicate_info"]["reason"]) for dup in group["duplicates"]])
+            for group in DuplicateDetector.find_duplicates_in_batch(events)
+        ]
+        
+        assert result
+        assert result == self._pairwise_duplicates(events)
+    
+    def test_candidates_skip_distant_dates(self):
+        """Test events more than a week apart are never compared."""
+        events = [
+            EventCreate(title="Jazz Festival", date=date(2025, 6, 1), time="20:00", location="Zagreb"),
+            EventCreate(title="Jazz Festival", date=date(2025, 6, 20), time="20:00", location="Zagreb"),
+        ]
+        
+        features = [EventFeatures.from_event(event) for event in events]
+        
+        assert DuplicateDetector._find_candidate_pairs(features) == {}
+    
+    def test_similarity_backend_selectable_per_field(self):
+        """Test a field can be scored with a different similarity backend."""
+        first = EventCreate(title="Jazz Festival Zagreb", date=date(2025, 6, 1), time="20:00", location="Zagreb")
+        second = EventCreate(title="Zagreb Jazz Festival", date=date(2025, 6, 1), time="20:00", location="Zagreb")
+        
+        default = DuplicateDetector.calculate_event_similarity(first, second)
+        with patch.dict(DuplicateDetector.SIMILARITY_BACKEND, {"name": "token_jaccard"}):
+            tokens = DuplicateDetector.calculate_event_similarity(first, second)
+        
+        assert default["name"] < 1.0
+        assert tokens["name"] == 1.0
+        assert tokens["location"] == default["location"]
+    
+    def test_event_features_normalize_once(self):
+        """Test feature records hold normalized text."""
+        features = EventFeatures.from_event(
+            EventCreate(title="  Koncert: ŠIBENIK!  ", date=date(2025, 6, 1), time="20:00", location="Šibenik")
+        )
+        
+        assert features.title == "koncert sibenik"
+        assert features.location == "sibenik"
+        assert features.title_chars["k"] == 2
+    
+    def test_database_duplicates_found_with_one_window_query(self):
+        """Test a batch is checked against the database with a single row query."""
+        new_events = [
+            EventCreate(title="Jazz Festival", date=date(2025, 6, 1), time="20:00", location="Zagreb"),
+            EventCreate(title="Rock Night", date=date(2025, 6, 3), time="21:00", location="Split"),
+        ]
+        existing_row = Mock(id=7, title="Jazz festival", description="", location="Zagreb",
+                            date=date(2025, 6, 1), time="20:00")
+        existing_event = Mock(id=7)
+        
+        db = Mock()
+        window_query = Mock()
+        window_query.filter.return_value.order_by.return_value.all.return_value = [existing_row]
+        match_query = Mock()
+        match_query.filter.return_value.all.return_value = [existing_event]
+        db.query.side_effect = [window_query, match_query]
+        
+        result = DuplicateDetector.find_duplicates_in_database_batch(new_events, db)
+        
+        assert db.query.call_count == 2
+        assert [event for event, _ in result[0]] == [existing_event]
+        assert result[1] == []
+
+
+class TestParallelValidation:
+    """Test chunked validation in DataQualityService."""
+    
+    @pytest.fixture
+    def events(self):
+        return [
+            EventCreate(title=f"Koncert broj {i}", date=date.today() + timedelta(days=i),
+                        time="20:00", location="Zagreb", description="Opis " * i)
+            for i in range(7)
+        ]
+    
+    def test_chunks_keep_input_order(self, events):
+        """Test pooled validation returns results in event order."""
+        service = DataQualityService(Mock(), workers=3, chunk_size=2)
+        pool = Mock()
+        pool.map.side_effect = lambda func, chunks: [func(chunk) for chunk in reversed(chunks)][::-1]
+        
+        with patch("backend.app.core.data_quality._get_validation_pool", return_value=pool):
+            validations = service.validate_events(events)
+        
+        assert len(pool.map.call_args[0][1]) == 4
+        assert validations == [DataQualityValidator.validate_event(event) for event in events]
+    
+    def test_small_batches_validate_inline(self, events):
+        """Test batches within one chunk skip the pool."""
+        service = DataQualityService(Mock(), workers=4, chunk_size=50)
+        
+        with patch("backend.app.core.data_quality._get_validation_pool") as get_pool:
+            validations = service.validate_events(events)
+        
+        get_pool.assert_not_called()
+        assert len(validations) == len(events)
+    
+    def test_pool_failure_falls_back_to_inline(self, events):
+        """Test a broken pool does not fail the quality stage."""
+        service = DataQualityService(Mock(), workers=2, chunk_size=2)
+        pool = Mock()
+        pool.map.side_effect = RuntimeError("worker died")
+        
+        with patch("backend.app.core.data_quality._get_validation_pool", return_value=pool):
+            validations = service.validate_events(events)
+        
+        assert validations == [DataQualityValidator.validate_event(event) for event in events]
+
+
+class TestConcurrentPipeline:
+    """Test concurrent, streaming source scheduling in EnhancedScrapingPipeline."""
+    
+    SCRAPER_ATTRIBUTES = [
+        "entrio_scraper", "croatia_scraper", "infozagreb_scraper", "ulaznice_scraper",
+        "visitrijeka_scraper", "vukovar_scraper", "visitsplit_scraper", "zadar_scraper",
+        "dubrovnik_scraper", "visitvarazdin_scraper", "visitkarlovac_scraper",
+        "visitopatija_scraper",
+    ]
+    
+    def make_pipeline(self, scrape_events, max_concurrent_sources=3, source_timeout=5.0,
+                      stream_batch_size=100):
+        pipeline = EnhancedScrapingPipeline.__new__(EnhancedScrapingPipeline)
+        pipeline.quality_threshold = 60.0
+        pipeline.enable_duplicate_detection = True
+        pipeline.max_concurrent_sources = max_concurrent_sources
+        pipeline.source_timeout = source_timeout
+        pipeline.stream_batch_size = stream_batch_size
+        pipeline.stream_queue_size = 2
+        for position, attribute in enumerate(self.SCRAPER_ATTRIBUTES):
+            scraper = Mock()
+            scraper.scrape_events = AsyncMock(side_effect=scrape_events(position))
+            setattr(pipeline, attribute, scraper)
+        pipeline._run_quality_batch = Mock(side_effect=self.process_batch)
+        return pipeline
+    
+    @staticmethod
+    def process_batch(events):
+        """Stand-in for one quality batch that accepts and saves every event."""
+        count = len(events)
+        return {
+            "total_events": count,
+            "valid_events": [{"event": event, "validation": {"quality_score": 90.0, "issues": []}}
+                             for event in events],
+            "invalid_events": [],
+            "low_quality_events": [],
+            "duplicates_found": [],
+            "duplicates_in_db": [],
+            "processing_summary": {
+                "original_count": count,
+                "valid_count": count,
+                "invalid_count": 0,
+                "low_quality_count": 0,
+                "batch_duplicates_count": 0,
+                "db_duplicates_count": 0,
+                "final_processable_count": count,
+                "quality_threshold": 60.0,
+                "duplicate_detection_enabled": True,
+            },
+            "saved_events": count,
+        }
+    
+    @pytest.mark.asyncio
+    async def test_sources_run_concurrently_under_cap(self):
+        """Test sources overlap, never exceed the cap and keep config order."""
+        running = {"now": 0, "peak": 0}
+        
+        def scrape_events(position):
+            async def scrape(**kwargs):
+                running["now"] += 1
+                running["peak"] = max(running["peak"], running["now"])
+                # Later sources finish first
+                await asyncio.sleep(0.01 * (12 - position))
+                running["now"] -= 1
+                return [f"event-{position}"]
+            return scrape
+        
+        pipeline = self.make_pipeline(scrape_events, max_concurrent_sources=3)
+        results = await pipeline.scrape_all_sources(max_pages_per_source=1)
+        
+        assert running["peak"] == 3
+        assert list(results["sources"])[:2] == ["entrio.hr", "croatia.hr"]
+        assert all(source["status"] == "success" for source in results["sources"].values())
+        assert results["saved_events"] == 12
+    
+    @pytest.mark.asyncio
+    async def test_slow_source_times_out_alone(self):
+        """Test a source exceeding its timeout is reported without failing others."""
+        def scrape_events(position):
+            async def scrape(**kwargs):
+                await asyncio.sleep(1.0 if position == 0 else 0)
+                return [f"event-{position}"]
+            return scrape
+        
+        pipeline = self.make_pipeline(scrape_events, max_concurrent_sources=12, source_timeout=0.05)
+        results = await pipeline.scrape_all_sources(max_pages_per_source=1)
+        
+        entrio = results["sources"]["entrio.hr"]
+        assert entrio["status"] == "error"
+        assert entrio["error_message"].startswith("Timed out")
+        assert entrio["events_scraped"] == 0
+        assert results["sources"]["croatia.hr"]["events_scraped"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_events_stream_into_quality_batches(self):
+        """Test scraped events are processed in batches and merged into one report."""
+        def scrape_events(position):
+            async def scrape(**kwargs):
+                await asyncio.sleep(0.001 * position)
+                return [f"event-{position}-{i}" for i in range(5)]
+            return scrape
+        
+        pipeline = self.make_pipeline(scrape_events, stream_batch_size=8)
+        results = await pipeline.scrape_all_sources(max_pages_per_source=1)
+        
+        batches = [call.args[0] for call in pipeline._run_quality_batch.call_args_list]
+        assert all(len(batch) <= 15 for batch in batches)
+        assert sorted(event for batch in batches for event in batch) == sorted(
+            f"event-{position}-{i}" for position in range(12) for i in range(5)
+        )
+        combined = results["combined_results"]
+        assert combined["processing_summary"]["original_count"] == 60
+        assert combined["quality_report"]["quality_metrics"]["quality_distribution"]["high"] == 60
+        assert "event" not in combined["valid_events"][0]
+        assert "events" not in results["sources"]["entrio.hr"]
+    
+    def test_token_bucket_spaces_requests_after_burst(self):
+        """Test the bucket allows a burst and then waits for refills."""
+        bucket = TokenBucket(rate=10.0, capacity=2)
+        
+        with patch("backend.app.scraping.rate_limit.time.monotonic", return_value=100.0):
+            bucket._updated = 100.0
+            delays = [bucket.reserve() for _ in range(4)]
+        
+        assert delays == pytest.approx([0.0, 0.0, 0.1, 0.2])
+    
+    def test_rate_limiter_keys_by_host(self):
+        """Test URLs of one host share a bucket regardless of scheme or www."""
+        limiter = DomainRateLimiter(rate=1.0)
+        
+        assert limiter.domain_of("https://www.entrio.hr/events?page=2") == "entrio.hr"
+        assert limiter.bucket("entrio.hr") is limiter.bucket(limiter.domain_of("http://entrio.hr/"))
+    
+    @pytest.mark.asyncio
+    async def test_scraping_browser_requests_limited_by_target_host(self):
+        """Test requests through the scraping browser endpoint use the page's bucket."""
+        limiter = DomainRateLimiter(rate=1.0)
+        scraping = Mock(scraping_browser_endpoint="https://brd.superproxy.io:9515")
+        
+        def browser_request(url):
+            return httpx.Request("GET", "https://brd.superproxy.io:9515", params={"url": url})
+        
+        with patch("backend.app.scraping.rate_limit.get_settings") as get_settings, \
+             patch.object(limiter, "acquire", AsyncMock()) as acquire:
+            get_settings.return_value.scraping = scraping
+            await limiter.request_hook(browser_request("https://www.entrio.hr/events"))
+            await limiter.request_hook(browser_request("https://visitsplit.com/e/1"))
+            await limiter.request_hook(httpx.Request("GET", "https://infozagreb.hr/?url=x"))
+        
+        assert [call.args[0] for call in acquire.await_args_list] == [
+            "https://www.entrio.hr/events", "https://visitsplit.com/e/1", "infozagreb.hr",
+        ]
+
+
+class TestSharedHttpClient:
+    """Test the pooled HTTP clients shared by scrapers."""
+    
+    @staticmethod
+    def build_client(proxy, verify):
+        client = Mock(is_closed=False, proxy=proxy, verify=verify)
+        client.get = AsyncMock(return_value=Mock(status_code=200))
+        client.aclose = AsyncMock()
+        return client
+    
+    @pytest.mark.asyncio
+    async def test_clients_are_shared_per_mode(self):
+        """Test one client is reused per connection mode on a loop."""
+        with patch.object(http_client, "_build_client", side_effect=self.build_client) as build:
+            direct = http_client.get_http_client()
+            proxied = http_client.get_http_client(proxy=True, verify=False)
+            
+            assert http_client.get_http_client() is direct
+            assert proxied is not direct
+            assert build.call_count == 2
+            
+            await http_client.close_http_clients()
+        
+        direct.aclose.assert_awaited_once()
+        proxied.aclose.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_scraping_browser_requests_go_to_endpoint(self):
+        """Test scraping browser mode fetches through the BrightData endpoint."""
+        with patch.object(http_client, "_build_client", side_effect=self.build_client):
+            await http_client.http_get(
+                "https://www.entrio.hr/events",
+                use_proxy=True,
+                use_scraping_browser=True,
+                use_cache=False,
+            )
+            client = http_client.get_http_client(verify=False)
+            await http_client.close_http_clients()
+        
+        args, kwargs = client.get.call_args
+        assert kwargs["params"] == {"url": "https://www.entrio.hr/events"}
+        assert args[0] != "https://www.entrio.hr/events"
+        assert "auth" in kwargs
+
+
+
+class TestHttpCache:
+    """Test conditional requests through the on-disk HTTP cache."""
+    
+    URL = "https://www.visitrijeka.hr/dogadanja"
+    
+    @classmethod
+    def page(cls, status_code, content=b"", headers=None):
+        return httpx.Response(
+            status_code,
+            headers=headers or {},
+            content=content,
+            request=httpx.Request("GET", cls.URL),
+        )
+    
+    async def fetch_all(self, cache, responses):
+        client = Mock(is_closed=False)
+        client.get = AsyncMock(side_effect=responses)
+        client.aclose = AsyncMock()
+        
+        with patch.object(http_client, "_build_client", return_value=client), \
+             patch.object(http_client, "get_http_cache", return_value=cache):
+            results = [await http_client.http_get(self.URL) for _ in responses]
+            await http_client.close_http_clients()
+        return client, results
+    
+    @pytest.mark.asyncio
+    async def test_not_modified_replays_stored_page(self, tmp_path):
+        """Test a 304 answer is served from the stored body."""
+        body = b"<html><div class='event'>Koncert</div></html>"
+        client, (first, second) = await self.fetch_all(HttpCache(tmp_path), [
+            self.page(200, body, {"ETag": '"v1"', "Content-Type": "text/html; charset=utf-8"}),
+            self.page(304),
+        ])
+        
+        assert "If-None-Match" not in (client.get.call_args_list[0].kwargs["headers"] or {})
+        assert client.get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert not is_unchanged(first)
+        assert is_unchanged(second)
+        assert second.status_code == 200
+        assert second.content == body
+    
+    @pytest.mark.asyncio
+    async def test_identical_body_reuses_parsed_data(self, tmp_path):
+        """Test pages without validators are compared by body hash."""
+        cache = HttpCache(tmp_path)
+        _, (first, same, changed) = await self.fetch_all(cache, [
+            self.page(200, b"<html>v1</html>"),
+            self.page(200, b"<html>v1</html>"),
+            self.page(200, b"<html>v2</html>"),
+        ])
+        cache.store_parsed(first, {"listing": [{"title": "Koncert"}], "next_url": None})
+        
+        assert is_unchanged(same)
+        assert cache.load_parsed(same) == {"listing": [{"title": "Koncert"}], "next_url": None}
+        assert not is_unchanged(changed)
+        assert cache.load_parsed(changed) is None
+
+    
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_ignored_and_pruned(self, tmp_path):
+        """Test entries older than max_age are refetched and deleted from disk."""
+        cache = HttpCache(tmp_path, max_age=3600)
+        _, (first,) = await self.fetch_all(cache, [self.page(200, b"<html>v1</html>", {"ETag": '"v1"'})])
+        cache.store_parsed(first, {"listing": [], "next_url": None})
+        
+        with patch("backend.app.scraping.http_cache.time.time", return_value=time.time() + 7200):
+            assert cache.lookup(self.URL) is None
+            assert cache.prune() == 1
+        
+        assert cache.prune() == 0
+        assert not any(path.is_file() for path in tmp_path.rglob("*"))
+
+class TestBaseScraperPacing:
+    """Test bounded detail fetching, pacing and listing prefetch in BaseScraper."""
+    
+    @staticmethod
+    def make_scraper(detail_concurrency=2):
+        with patch.multiple(BaseScraper, __abstractmethods__=set()):
+            scraper = BaseScraper("https://www.visitpula.hr", "https://www.visitpula.hr/events", "test")
+        scraper.detail_semaphore = asyncio.Semaphore(detail_concurrency)
+        scraper.close = AsyncMock()
+        return scraper
+    
+    @pytest.mark.asyncio
+    async def test_detail_fetches_are_bounded(self):
+        """Test detail pages respect the concurrency budget and keep listing order."""
+        scraper = self.make_scraper(detail_concurrency=2)
+        active = peak = 0
+        
+        async def parse_event_detail(url):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"description": f"detail {url}"}
+        
+        scraper.parse_event_detail = parse_event_detail
+        listing = [{"title": f"Event {i}", "link": f"/e/{i}"} for i in range(5)]
+        listing.insert(2, {"title": "No link"})
+        
+        events = await scraper.fetch_event_details(listing)
+        
+        assert peak == 2
+        assert [e["title"] for e in events] == [l["title"] for l in listing]
+        assert events[0]["description"] == "detail /e/0"
+        assert "description" not in events[2]
+    
+    def test_pacer_adapts_to_throttling_and_latency(self):
+        """Test the pacer backs off on 429s and slow responses and recovers."""
+        pacer = AdaptivePacer(min_delay=0.0, max_delay=10.0, target_latency=1.0)
+        
+        pacer.record(429, 0.1)
+        assert pacer.delay == AdaptivePacer.BACKOFF_FLOOR
+        pacer.record(429, 0.1, retry_after=parse_retry_after("3"))
+        assert pacer.delay == 3.0
+        pacer.record(200, 5.0)
+        assert pacer.delay == 4.5
+        pacer.record(200, 0.1)
+        assert pacer.delay == pytest.approx(3.6)
+        pacer.record(503, 0.1, retry_after=60)
+        assert pacer.delay == 10.0
+    
+    @pytest.mark.asyncio
+    async def test_pacer_spaces_concurrent_waiters(self):
+        """Test concurrent waiters get successive slots instead of firing together."""
+        pacer = AdaptivePacer(min_delay=0.05)
+        
+        waits = await asyncio.gather(*(pacer.wait() for _ in range(3)))
+        
+        assert waits[0] == 0.0
+        assert waits[1] == pytest.approx(0.05, abs=0.01)
+        assert waits[2] == pytest.approx(0.10, abs=0.01)
+    
+    @pytest.mark.asyncio
+    async def test_next_listing_page_is_prefetched(self):
+        """Test the next listing page is fetched while details are in flight."""
+        scraper = self.make_scraper()
+        calls = []
+        pages = {
+            "https://www.visitpula.hr/events": ([{"title": "A", "link": "/a"}], "https://www.visitpula.hr/events?page=2"),
+            "https://www.visitpula.hr/events?page=2": ([{"title": "B", "link": "/b"}], None),
+        }
+        
+        async def parse_listing_page(url):
+            calls.append(("listing", url))
+            return pages[url]
+        
+        async def fetch_event_details(listing_data):
+            calls.append(("details start", listing_data[0]["title"]))
+            await asyncio.sleep(0.01)
+            calls.append(("details end", listing_data[0]["title"]))
+            return listing_data
+        
+        scraper.parse_listing_page = parse_listing_page
+        scraper.fetch_event_details = fetch_event_details
+        scraper.transform_to_event = lambda raw: raw["title"]
+        
+        events = await scraper.scrape_all_events(max_pages=5)
+        
+        assert events == ["A", "B"]
+        assert calls.index(("listing", "https://www.visitpula.hr/events?page=2")) < calls.index(("details end", "A"))
+
+
+class TestIncrementalScraping:
+    """Test skipping known events in incremental runs."""
+    
+    LISTINGS = [
+        {"title": "Koncert klape  Kampanel", "link": "https://www.visitsplit.com/e/1"},
+        {"title": "Ljetni festival (novi termin)", "link": "https://www.visitsplit.com/e/2"},
+        {"title": "Izložba", "link": "https://www.visitsplit.com/e/3"},
+        {"title": "Bez poveznice"},
+    ]
+    STORED = {
+        "https://www.visitsplit.com/e/1": "Koncert klape Kampanel",
+        "https://www.visitsplit.com/e/2": "Ljetni festival",
+    }
+    
+    @pytest.mark.asyncio
+    async def test_full_runs_do_not_query(self):
+        """Test listings pass through untouched outside incremental mode."""
+        with patch.object(incremental, "_find_known_titles") as find_known:
+            listings = await incremental.drop_known_listings(self.LISTINGS)
+        
+        assert listings == self.LISTINGS
+        find_known.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_known_unchanged_events_are_dropped(self):
+        """Test recently stored events with the same title are skipped."""
+        with patch.object(incremental, "_find_known_titles", return_value=self.STORED) as find_known, \
+             incremental.incremental_scraping():
+            listings = await incremental.drop_known_listings(self.LISTINGS)
+        
+        assert [l["title"] for l in listings] == [
+            "Ljetni festival (novi termin)", "Izložba", "Bez poveznice",
+        ]
+        find_known.assert_called_once()
+        assert sorted(find_known.call_args.args[0]) == sorted(l["link"] for l in self.LISTINGS[:3])
+        assert not incremental.is_incremental()
+    
+    @pytest.mark.asyncio
+    async def test_known_page_stops_pagination(self):
+        """Test BaseScraper stops paginating at a page without new events."""
+        scraper = TestBaseScraperPacing.make_scraper()
+        scraper.parse_listing_page = AsyncMock(
+            return_value=(self.LISTINGS, "https://www.visitsplit.com/events?page=2")
+        )
+        scraper.fetch_event_details = AsyncMock(side_effect=lambda listing_data: listing_data)
+        scraper.transform_to_event = lambda raw: raw["title"]
+        
+        with patch(
+            "backend.app.scraping.base_scraper.drop_known_listings", AsyncMock(return_value=[])
+        ):
+            events = await scraper.scrape_all_events(max_pages=5)
+        
+        assert events == []
+        scraper.parse_listing_page.assert_awaited_once()
+
+
+    def test_rescraped_events_refresh_last_scraped_at(self):
+        """Test events matched to stored ones still reach the upsert or get stamped."""
+        rescraped = EventCreate(title="Koncert klape Kampanel", date=date.today() + timedelta(days=3),
+                                time="20:00", location="Split", source="visitsplit",
+                                link="https://www.visitsplit.com/e/1")
+        moved = EventCreate(title="Ljetni festival", date=date.today() + timedelta(days=5),
+                            time="21:30", location="Split", source="visitsplit",
+                            link="https://www.visitsplit.com/e/2")
+        stored_same = Mock(scrape_hash=calculate_event_hash(rescraped.model_dump()), link=rescraped.link)
+        stored_moved = Mock(scrape_hash="old-hash", link=moved.link)
+        
+        db = Mock()
+        service = DataQualityService(db, workers=1)
+        with patch.object(
+            service.duplicate_detector, "find_duplicates_in_database_batch",
+            return_value=[[(stored_same, {})], [(stored_moved, {})]],
+        ), patch("backend.app.core.data_quality.EventIngestionService") as ingestion:
+            ingestion.return_value.ingest.return_value = {"inserted": 0, "updated": 0, "unchanged": 1}
+            results = service.process_scraped_events([rescraped, moved], quality_threshold=0)
+            service.save_processed_events(results)
+        
+        assert ingestion.return_value.ingest.call_args.args[0] == [rescraped]
+        assert [d["new_event"] for d in results["duplicates_in_db"]] == [moved]
+        mark_scraped = db.execute.call_args.args[0]
+        assert mark_scraped.compile().params["scrape_hash_1"] == ["old-hash"]
+
+
+class TestBrowserPool:
+    """Test the shared Playwright browser pool."""
+    
+    @staticmethod
+    def fake_browser():
+        def new_context(**options):
+            context = Mock(options=options)
+            context.close = AsyncMock()
+            context.route = AsyncMock()
+            context.new_page = AsyncMock(return_value=Mock(context=context))
+            return context
+        
+        browser = Mock()
+        browser.is_connected.return_value = True
+        browser.new_context = AsyncMock(side_effect=new_context)
+        browser.close = AsyncMock()
+        return browser
+    
+    def make_pool(self, **kwargs):
+        pool = BrowserPool(**kwargs)
+        launched = []
+        
+        async def launch(**options):
+            launched.append(self.fake_browser())
+            return launched[-1]
+        
+        playwright = Mock()
+        playwright.chromium.launch = AsyncMock(side_effect=launch)
+        playwright.stop = AsyncMock()
+        pool._playwright = playwright
+        return pool, playwright, launched
+    
+    @pytest.mark.asyncio
+    async def test_leases_share_browser_under_cap(self):
+        """Test concurrent leases reuse one browser and respect the context cap."""
+        pool, playwright, launched = self.make_pool(max_contexts=2)
+        active = peak = 0
+        
+        async def scrape():
+            nonlocal active, peak
+            async with pool.page(viewport={"width": 1920, "height": 1080}) as page:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return page
+        
+        pages = await asyncio.gather(*(scrape() for _ in range(5)))
+        await pool.close()
+        
+        assert peak == 2
+        assert len(launched) == 1
+        assert all(page.context.close.await_count == 1 for page in pages)
+        assert pages[0].context.options == {"viewport": {"width": 1920, "height": 1080}}
+        launched[0].close.assert_awaited_once()
+        playwright.stop.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_browser_recycled_after_navigations(self):
+        """Test a worn browser is replaced and closed once its last lease ends."""
+        pool, _, launched = self.make_pool(max_contexts=2, recycle_after=2)
+        navigation = Mock(**{"is_navigation_request.return_value": True})
+        
+        async with pool.context() as context:
+            count_navigation = context.on.call_args.args[1]
+            count_navigation(navigation)
+            count_navigation(navigation)
+            
+            async with pool.context():
+                pass
+            
+            assert len(launched) == 2
+            launched[0].close.assert_not_awaited()
+        
+        launched[0].close.assert_awaited_once()
+        launched[1].close.assert_not_awaited()
+        await pool.close()
+        launched[1].close.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_context_routes_through_blocker(self):
+        """Test leased contexts abort requests outside the allowed domains."""
+        pool, _, _ = self.make_pool()
+        
+        async with pool.context(allowed_domains=["entrio.hr"]) as context:
+            pattern, handler = context.route.call_args.args
+        async with pool.context(block_resources=False) as unblocked:
+            unblocked.route.assert_not_awaited()
+        await pool.close()
+        
+        route = Mock(request=Mock(url="https://cdn.example.com/app.js", resource_type="script"))
+        route.abort = AsyncMock()
+        route.continue_ = AsyncMock()
+        await handler(route)
+        
+        assert pattern == "**/*"
+        route.abort.assert_awaited_once()
+        route.continue_.assert_not_awaited()
+
+
+class TestResourceBlocker:
+    """Test Playwright request blocking."""
+    
+    def test_blocks_by_type_and_domain(self):
+        """Test heavy resource types and tracker domains are blocked."""
+        blocker = ResourceBlocker(["image", "font"], ["google-analytics.com"])
+        
+        assert blocker.should_block("https://entrio.hr/logo.png", "image")
+        assert blocker.should_block("https://www.google-analytics.com/collect", "xhr")
+        assert not blocker.should_block("https://entrio.hr/events", "document")
+        assert not blocker.should_block("https://notgoogle-analytics.com/app.js", "script")
+    
+    def test_allowlist_blocks_third_parties(self):
+        """Test an allowlist keeps the site and its subdomains only."""
+        blocker = ResourceBlocker(allowed_domains=["visitrijeka.hr"])
+        
+        assert not blocker.should_block("https://visitrijeka.hr/dogadanja", "document")
+        assert not blocker.should_block("https://static.visitrijeka.hr/app.js", "script")
+        assert blocker.should_block("https://widgets.example.com/embed.js", "script")
+        assert not blocker.should_block("data:image/svg+xml,<svg/>", "script")
+
+
+class TestHtmlParser:
+    """Test HTML parsing for scrapers."""
+    
+    def test_missing_parser_falls_back(self):
+        """Test an unavailable parser falls back to html.parser."""
+        with patch.object(html_parser, "get_settings") as get_settings:
+            get_settings.return_value.scraping.html_parser = "no-such-parser"
+            soup = html_parser.parse_html('<ul><li class="event-item">Koncert</li></ul>')
+        
+        assert soup.select_one("li.event-item").get_text() == "Koncert"
+    
+    def test_parse_only_builds_matching_subtree(self):
+        """Test a strainer drops everything outside the event list."""
+        html = (
+            '<nav><a href="/">Naslovna</a></nav>'
+            '<ul class="events"><li><a href="/e/1">Koncert</a></li></ul>'
+            "<footer>Kontakt</footer>"
+        )
+        
+        soup = html_parser.parse_html(html, parse_only=SoupStrainer("ul", class_="events"))
+        
+        assert [a["href"] for a in soup.select("a")] == ["/e/1"]
+        assert soup.find("footer") is None
+
+
+class TestStructuredData:
+    """Test the JSON-LD / microdata fast path."""
+    
+    JSON_LD_PAGE = """
+        <script type="application/ld+json">
+        {"@context": "https://schema.org", "@graph": [
+            {"@type": "WebSite", "name": "Info Zagreb"},
+            {"@type": "MusicEvent", "name": "Jazz na Gornjem gradu",
+             "description": "Koncert pod zvijezdama",
+             "startDate": "2025-07-01T20:30:00+02:00", "url": "/dogadanja/jazz",
+             "image": {"@type": "ImageObject", "url": "https://cdn.example.com/jazz.jpg"},
+             "location": {"@type": "Place", "name": "Klovićevi dvori",
+                          "address": {"streetAddress": "Jezuitski trg 4",
+                                      "postalCode": "10000", "addressLocality": "Zagreb"}},
+             "offers": {"price": "15", "priceCurrency": "EUR"}}
+        ]}
+        </script>
+    """
+    
+    def test_json_ld_event_fields(self):
+        """Test JSON-LD events are mapped to raw scraper fields."""
+        soup = html_parser.parse_html(self.JSON_LD_PAGE)
+        
+        events = extract_events(soup, "https://www.infozagreb.hr/dogadanja")
+        
+        assert events == [{
+            "title": "Jazz na Gornjem gradu",
+            "description": "Koncert pod zvijezdama",
+            "date": "1.7.2025",
+            "time": "20:30",
+            "location": "Klovićevi dvori, Jezuitski trg 4, 10000 Zagreb",
+            "link": "https://www.infozagreb.hr/dogadanja/jazz",
+            "image": "https://cdn.example.com/jazz.jpg",
+            "price": "15 EUR",
+        }]
+    
+    def test_microdata_nested_items(self):
+        """Test microdata properties of nested items stay with those items."""
+        soup = html_parser.parse_html("""
+            <div itemscope itemtype="https://schema.org/Event">
+                <div itemprop="location" itemscope itemtype="https://schema.org/Place">
+                    <span itemprop="name">Hrvatski narodni kazalište</span>
+                </div>
+                <h2 itemprop="name">Labuđe jezero</h2>
+                <time itemprop="startDate" datetime="2025-12-20">20. prosinca</time>
+            </div>
+        """)
+        
+        [event] = extract_events(soup)
+        
+        assert event["title"] == "Labuđe jezero"
+        assert event["location"] == "Hrvatski narodni kazalište"
+        assert event["date"] == "20.12.2025"
+    
+    def test_partial_structured_data_falls_back_to_dom(self):
+        """Test a page marking up fewer events than it lists is parsed from the DOM."""
+        soup = html_parser.parse_html(self.JSON_LD_PAGE)
+        
+        assert listing_events(soup, "test-partial", "https://www.infozagreb.hr", container_count=3) is None
+        assert len(listing_events(soup, "test-partial", "https://www.infozagreb.hr", container_count=1)) == 1
+        assert get_structured_data_stats()["test-partial"]["listing_hit_rate"] == 0.5
+    
+    @pytest.mark.asyncio
+    async def test_complete_listings_skip_detail_fetch(self):
+        """Test only complete structured-data listings skip their detail page."""
+        scraper = TestBaseScraperPacing.make_scraper()
+        scraper.parse_event_detail = AsyncMock(return_value={"price": "10 EUR"})
+        fields = {
+            "title": "Filmski festival", "date": "12.7.2025", "time": "21:00",
+            "location": "Arena", "description": "Projekcije u Areni",
+        }
+        structured = {**fields, "link": "/e/1", STRUCTURED_LISTING_KEY: True}
+        dom_card = {**fields, "link": "/e/2"}
+        partial = {**fields, "time": "", "link": "/e/3", STRUCTURED_LISTING_KEY: True}
+        
+        events = await scraper.fetch_event_details([structured, dom_card, partial])
+        
+        assert [call.args for call in scraper.parse_event_detail.await_args_list] == [("/e/2",), ("/e/3",)]
+        assert events[0] == structured
+        assert events[1]["price"] == "10 EUR"
+
+
+class TestLocationMatcher:
+    """Test the precompiled location matcher of the Croatian geo database."""
+    
+    @pytest.fixture(scope="class")
+    def geo_db(self):
+        return CroatianGeoDatabase()
+    
+    def test_venue_beats_city(self, geo_db):
+        """Test a known venue wins over its city and resolves to it."""
+        match = geo_db.match_location("Zagreb Jazz Festival, Tvornica kulture")
+        
+        assert match.location.name == "Tvornica kulture"
+        assert match.city == "Zagreb"
+    
+    def test_inflected_city_name(self, geo_db):
+        """Test Croatian case endings and missing diacritics still match."""
+        assert geo_db.match_location("Dalmacija: koncert u Splitu").city == "Split"
+        assert geo_db.match_location("Ljetni festival, Varazdin").city == "Varaždin"
+    
+    def test_short_names_match_whole_words_only(self, geo_db):
+        """Test short names such as "vis" do not match inside other words."""
+        assert geo_db.match_location("Visit our website for more") is None
+        assert geo_db.match_location("Izlet na Vis").city == "Vis"
+    
+    def test_smaller_city_wins(self, geo_db):
+        """Test a big city mentioned in passing loses to the smaller one."""
+        match = geo_db.match_location("Zagrebački bend nastupa u Sinju, Zagreb Music")
+        
+        assert match.city == "Sinj"
+    
+    def test_address_uses_locality(self, geo_db):
+        """Test city names inside street names do not decide an address's city."""
+        assert geo_db.match_location("Ulica grada Vukovara 1, Zagreb").city == "Vukovar"
+        assert geo_db.match_address("Ulica grada Vukovara 1, Zagreb").city == "Zagreb"
+        assert geo_db.match_address("Zagrebačka 5, Samobor").city == "Samobor"
+        assert geo_db.match_address("Koncert u Splitu").city == "Split"
+        assert geo_db.match_address("Ulica 1, 10000") is None
+    
+    def test_find_venue_in_city(self, geo_db):
+        """Test venue lookup is limited to the requested city."""
+        text = "Predstava u HNK Split"
+        
+        assert geo_db.find_venue(text, city="Split").name == "HNK Split"
+        assert geo_db.find_venue(text, city="Zagreb") is None
+
 
 class TestErrorHandling:
     """Test error handling functionality."""
@@ -208,12 +208,14 @@ CREATE OR REPLACE FUNCTION update_search_vectors()
 RETURNS void AS $$
 BEGIN
     UPDATE events 
-    SET search_vector = to_tsvector('croatian', 
-        COALESCE(name, '') || ' ' || 
-        COALESCE(description, '') || ' ' || 
-        COALESCE(location, '') || ' ' ||
-        COALESCE(organizer, '')
-    )
+    SET search_vector =
+        setweight(to_tsvector('croatian_unaccent', COALESCE(title, '')), 'A') ||
+        setweight(to_tsvector('croatian_unaccent', COALESCE(location, '')), 'B') ||
+        setweight(to_tsvector('croatian_unaccent',
+            COALESCE(organizer, '') || ' ' ||
+            COALESCE(array_to_string(tags, ' '), '')
+        ), 'B') ||
+        setweight(to_tsvector('croatian_unaccent', COALESCE(description, '')), 'C')
     WHERE search_vector IS NULL 
        OR updated_at > NOW() - INTERVAL '1 hour';
     
@@ -286,7 +288,7 @@ log_disconnections = on
 log_lock_waits = on
 
 # Full-text search settings
-default_text_search_config = 'croatian'   # Croatian language support
+default_text_search_config = 'croatian_unaccent'   # Accent-insensitive Croatian search
 
 # Auto vacuum settings
 autovacuum = on
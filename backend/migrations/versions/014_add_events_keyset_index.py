@@ -0,0 +1,28 @@
+"""Add composite index for keyset pagination of events
+
+Revision ID: 014_add_events_keyset_index
+Revises: 20250606_234628
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '014_add_events_keyset_index'
+down_revision: Union[str, None] = '20250606_234628'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add (date, time, id) index matching the events listing order."""
+    op.create_index(
+        'idx_events_date_time_id', 'events', ['date', 'time', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Remove keyset pagination index."""
+    op.drop_index('idx_events_date_time_id', table_name='events')
@@ -0,0 +1,115 @@
+"""Add accent-insensitive full-text and trigram search for events
+
+Revision ID: 015_add_croatian_full_text_search
+Revises: 014_add_events_keyset_index
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '015_add_croatian_full_text_search'
+down_revision: Union[str, None] = '014_add_events_keyset_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create croatian_unaccent search config, rebuild search_vector and indexes."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # PostgreSQL ships no Croatian stemmer, so fold diacritics (č, ć, š, ž, đ)
+    # with unaccent and keep words unstemmed via the simple dictionary.
+    op.execute("""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_ts_config WHERE cfgname = 'croatian_unaccent'
+            ) THEN
+                CREATE TEXT SEARCH CONFIGURATION croatian_unaccent (COPY = simple);
+                ALTER TEXT SEARCH CONFIGURATION croatian_unaccent
+                    ALTER MAPPING FOR hword, hword_part, word
+                    WITH unaccent, simple;
+            END IF;
+        END
+        $$;
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_search_vector()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('croatian_unaccent', COALESCE(NEW.title, '')), 'A') ||
+                setweight(to_tsvector('croatian_unaccent', COALESCE(NEW.location, '')), 'B') ||
+                setweight(to_tsvector('croatian_unaccent',
+                    COALESCE(NEW.organizer, '') || ' ' ||
+                    COALESCE(array_to_string(NEW.tags, ' '), '')
+                ), 'B') ||
+                setweight(to_tsvector('croatian_unaccent', COALESCE(NEW.description, '')), 'C');
+            RETURN NEW;
+        END;
+        $$ language 'plpgsql';
+    """)
+
+    op.execute("DROP TRIGGER IF EXISTS update_events_search_vector ON events")
+    op.execute("""
+        CREATE TRIGGER update_events_search_vector
+            BEFORE INSERT OR UPDATE OF title, description, location, organizer, tags
+            ON events
+            FOR EACH ROW
+            EXECUTE FUNCTION update_search_vector();
+    """)
+
+    # Backfill rows written before the trigger was fixed
+    op.execute("""
+        UPDATE events SET search_vector =
+            setweight(to_tsvector('croatian_unaccent', COALESCE(title, '')), 'A') ||
+            setweight(to_tsvector('croatian_unaccent', COALESCE(location, '')), 'B') ||
+            setweight(to_tsvector('croatian_unaccent',
+                COALESCE(organizer, '') || ' ' ||
+                COALESCE(array_to_string(tags, ' '), '')
+            ), 'B') ||
+            setweight(to_tsvector('croatian_unaccent', COALESCE(description, '')), 'C')
+    """)
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_search_vector "
+        "ON events USING gin(search_vector)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_title_trgm "
+        "ON events USING gin(title gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Drop trigram index and restore the English search trigger."""
+    op.execute("DROP INDEX IF EXISTS idx_events_title_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_events_search_vector")
+    op.execute("DROP TRIGGER IF EXISTS update_events_search_vector ON events")
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_search_vector()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.search_vector := to_tsvector('english',
+                COALESCE(NEW.title, '') || ' ' ||
+                COALESCE(NEW.description, '') || ' ' ||
+                COALESCE(NEW.location, '') || ' ' ||
+                COALESCE(NEW.organizer, '') || ' ' ||
+                COALESCE(array_to_string(NEW.tags, ' '), '')
+            );
+            RETURN NEW;
+        END;
+        $$ language 'plpgsql';
+    """)
+    op.execute("""
+        CREATE TRIGGER update_events_search_vector
+            BEFORE INSERT OR UPDATE ON events
+            FOR EACH ROW
+            EXECUTE FUNCTION update_search_vector();
+    """)
+    op.execute("DROP TEXT SEARCH CONFIGURATION IF EXISTS croatian_unaccent")
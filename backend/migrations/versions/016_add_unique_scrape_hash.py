@@ -0,0 +1,68 @@
+"""Make events.scrape_hash unique for bulk upsert ingestion
+
+Revision ID: 016_add_unique_scrape_hash
+Revises: 015_add_croatian_full_text_search
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '016_add_unique_scrape_hash'
+down_revision: Union[str, None] = '015_add_croatian_full_text_search'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Backfill scrape_hash, drop duplicate hashes and add a unique index."""
+    # Same formula as database_optimization.calculate_event_hash, so rows saved
+    # before scrape_hash was populated are matched on the next scrape
+    op.execute("""
+        UPDATE events
+        SET scrape_hash = encode(sha256(convert_to(
+            COALESCE(title, 'None') || '|' ||
+            COALESCE(date::text, 'None') || '|' ||
+            COALESCE(time, 'None') || '|' ||
+            COALESCE(location, 'None') || '|' ||
+            COALESCE(source, 'None'),
+            'UTF8'
+        )), 'hex')
+        WHERE scrape_hash IS NULL
+        AND source <> 'user_generated'
+    """)
+
+    # Keep the oldest row for each hash; the others stay but are not matched
+    op.execute("""
+        UPDATE events
+        SET scrape_hash = NULL
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY scrape_hash ORDER BY id) AS position
+            FROM events
+            WHERE scrape_hash IS NOT NULL
+        ) AS ranked
+        WHERE events.id = ranked.id AND ranked.position > 1
+    """)
+
+    op.drop_index('idx_events_scrape_hash', table_name='events')
+    op.create_index(
+        'idx_events_scrape_hash',
+        'events',
+        ['scrape_hash'],
+        unique=True,
+        postgresql_where=sa.text('scrape_hash IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Restore the non-unique scrape_hash index (backfilled hashes are kept)."""
+    op.drop_index('idx_events_scrape_hash', table_name='events')
+    op.create_index(
+        'idx_events_scrape_hash',
+        'events',
+        ['scrape_hash'],
+        postgresql_where=sa.text('scrape_hash IS NOT NULL'),
+    )
@@ -0,0 +1,32 @@
+"""Add (link, last_scraped_at) index for incremental scraping
+
+Revision ID: 017_add_events_link_scraped_at_index
+Revises: 016_add_unique_scrape_hash
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '017_add_events_link_scraped_at_index'
+down_revision: Union[str, None] = '016_add_unique_scrape_hash'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the index incremental runs use to find recently scraped links."""
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_events_link_scraped_at "
+            "ON events (link, last_scraped_at)"
+        )
+
+
+def downgrade() -> None:
+    """Remove the incremental scraping index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_events_link_scraped_at")
@@ -4,6 +4,18 @@
 -- Enable UUID extension for unique identifiers
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 CREATE EXTENSION IF NOT EXISTS "pg_trgm";
+CREATE EXTENSION IF NOT EXISTS "unaccent";
+
+-- Accent-insensitive search configuration (no Croatian stemmer ships with PostgreSQL)
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'croatian_unaccent') THEN
+        CREATE TEXT SEARCH CONFIGURATION croatian_unaccent (COPY = simple);
+        ALTER TEXT SEARCH CONFIGURATION croatian_unaccent
+            ALTER MAPPING FOR hword, hword_part, word WITH unaccent, simple;
+    END IF;
+END
+$$;
 
 -- Venue coordinates cache table for real-time geocoding
 CREATE TABLE IF NOT EXISTS venue_coordinates (
@@ -146,6 +158,7 @@ CREATE INDEX IF NOT EXISTS idx_events_featured ON events(is_featured) WHERE is_f
 CREATE INDEX IF NOT EXISTS idx_events_date_status ON events(date, event_status);
 CREATE INDEX IF NOT EXISTS idx_events_location_gin ON events USING gin(to_tsvector('simple', location));
 CREATE INDEX IF NOT EXISTS idx_events_search ON events USING gin(search_vector);
+CREATE INDEX IF NOT EXISTS idx_events_title_trgm ON events USING gin(title gin_trgm_ops);
 CREATE INDEX IF NOT EXISTS idx_events_tags ON events USING gin(tags);
 CREATE INDEX IF NOT EXISTS idx_events_coordinates ON events(latitude, longitude) WHERE latitude IS NOT NULL AND longitude IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_events_scrape_hash ON events(scrape_hash) WHERE scrape_hash IS NOT NULL;
@@ -220,13 +233,14 @@ $$ language 'plpgsql';
 CREATE OR REPLACE FUNCTION update_search_vector()
 RETURNS TRIGGER AS $$
 BEGIN
-    NEW.search_vector := to_tsvector('english', 
-        COALESCE(NEW.title, '') || ' ' ||
-        COALESCE(NEW.description, '') || ' ' ||
-        COALESCE(NEW.location, '') || ' ' ||
-        COALESCE(NEW.organizer, '') || ' ' ||
-        COALESCE(array_to_string(NEW.tags, ' '), '')
-    );
+    NEW.search_vector :=
+        setweight(to_tsvector('croatian_unaccent', COALESCE(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('croatian_unaccent', COALESCE(NEW.location, '')), 'B') ||
+        setweight(to_tsvector('croatian_unaccent',
+            COALESCE(NEW.organizer, '') || ' ' ||
+            COALESCE(array_to_string(NEW.tags, ' '), '')
+        ), 'B') ||
+        setweight(to_tsvector('croatian_unaccent', COALESCE(NEW.description, '')), 'C');
     RETURN NEW;
 END;
 $$ language 'plpgsql';